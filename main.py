@@ -1,24 +1,33 @@
+import asyncio
 import base64
+import copy
+import fcntl
+import hashlib
 import os
-import json
+import re
+import secrets
 import logging
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
-import jwt
+from urllib.parse import quote
+from typing import Any, AsyncIterator, Callable, DefaultDict, Dict, Iterable, Iterator, Mapping, Optional, Set, Tuple
+import orjson
 import time
+from collections import OrderedDict, defaultdict
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
 from datetime import datetime, timezone
 
 import httpx
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import HTMLResponse, JSONResponse, FileResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.background import BackgroundTask
 from starlette.middleware.sessions import SessionMiddleware
-from uuid import uuid4
 
 from google.api_core import exceptions as gcs_exceptions
 from google.auth.transport.requests import Request as GoogleRequest
-from google.cloud import storage
 from google.oauth2 import service_account
 from tenant_stack_template import get_tenant_stack_template, list_tenant_stack_templates
 
@@ -27,15 +36,60 @@ logger = logging.getLogger("unified-ui")
 
 load_dotenv()
 
-app = FastAPI(title="Unified UI Gateway")
+HTTPX_TIMEOUT = httpx.Timeout(600.0, connect=15.0)
+HTTPX_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=60.0)
+MAX_REQUEST_BODY_BYTES = int(os.getenv("MAX_REQUEST_BODY_BYTES") or 1024 * 1024)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The SPA shell is constant for the process lifetime; render it once instead of per request.
+    app.state.frontend_index = _render_frontend_index()
+    # One pooled client for the whole process so downstream calls reuse TCP/TLS connections.
+    # HTTP/2 lets concurrent calls to the same Cloud Run host multiplex over a single connection.
+    # With the brotli/zstd extras installed httpx advertises and decodes br/zstd on its own, which
+    # shrinks the large googleapis.com JSON bodies; passthrough proxies pin Accept-Encoding themselves.
+    app.state.http = httpx.AsyncClient(timeout=HTTPX_TIMEOUT, limits=HTTPX_LIMITS, http2=True)
+    try:
+        yield
+    finally:
+        await app.state.http.aclose()
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    ORJSONResponse rendered with orjson; keeps int/enum dict keys working like stdlib json.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+app = FastAPI(title="Unified UI Gateway", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 BASE_DIR = Path(__file__).resolve().parent
 
 # --- Frontend static assets ---
 FRONTEND_DIST = BASE_DIR / "frontend" / "dist"
 
+# Vite emits build assets as [name]-[hash].[ext]; those file names change whenever the content does.
+_HASHED_ASSET_RE = re.compile(r"-[A-Za-z0-9_-]{8}\.[A-Za-z0-9]+$")
+
+
+class HashedAssetStaticFiles(StaticFiles):
+    """
+    StaticFiles that lets browsers keep content-hashed assets for a year without revalidating.
+    """
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if _HASHED_ASSET_RE.search(os.path.basename(full_path)):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
 if (FRONTEND_DIST / "assets").exists():
-    app.mount("/assets", StaticFiles(directory=FRONTEND_DIST / "assets"), name="frontend-assets")
+    app.mount("/assets", HashedAssetStaticFiles(directory=FRONTEND_DIST / "assets"), name="frontend-assets")
 else:
     logger.warning("Frontend assets directory not found at %s", FRONTEND_DIST / "assets")
 logger.info("Frontend dist path: %s (exists=%s)", FRONTEND_DIST, FRONTEND_DIST.exists())
@@ -67,7 +121,6 @@ WEB_RESEARCH_BASE_URL = _normalize_base_url(os.getenv("WEB_RESEARCH_BASE_URL"))
 CHEATSHEET_BASE_URL = _normalize_base_url(os.getenv("CHEATSHEET_BASE_URL"))
 AGENT_REGISTRY_BASE_URL = _normalize_base_url(os.getenv("AGENT_REGISTRY_BASE_URL") or "https://thunderagents-497847265153.us-central1.run.app")
 AGENTONE_CONFIGURATOR_URL = _normalize_base_url(os.getenv("AGENTONE_CONFIGURATOR_URL") or "https://agentone-configurator-176446471226.us-central1.run.app")
-TRIGGERSERVICE_BASE_URL = THUNDERDEPLOY_BASE_URL
 TRIGGERSERVICE_BASE_URL = _normalize_base_url(
     os.getenv("TRIGGERSERVICE_BASE_URL")
     or os.getenv("THUNDERDEPLOY_BASE_URL")
@@ -79,7 +132,6 @@ CREDENTIALS_PREFIX = os.getenv("CREDENTIALS_PREFIX", "unified-ui-credentials")
 CREDENTIALS_BUCKET_LOCATION = os.getenv("CREDENTIALS_BUCKET_LOCATION") or "US"
 
 
-HTTPX_TIMEOUT = httpx.Timeout(600.0, connect=15.0)
 READ_TIMEOUT_MESSAGE = (
     "Connecting to the service took too long. The deployment request may still be running; "
     "check the Deployment Dashboard or job history to confirm."
@@ -91,6 +143,41 @@ STORAGE_SCOPE = "https://www.googleapis.com/auth/devstorage.full_control"
 
 # --- Simple server-side credential store ---
 _gcs_bucket = None
+_gcs_bucket_lock = threading.Lock()
+# Parsed credential stores keyed by type: (GCS generation or local mtime_ns, normalized store, monotonic time validated).
+_store_cache: Dict[str, Tuple[Any, Dict[str, Any], float]] = {}
+STORE_WRITE_ATTEMPTS = 3
+# Store updates waiting for the in-flight write of their store type, committed as one batch.
+_store_pending: Dict[str, list] = {}
+# Store type -> the task committing its queued updates; at most one write per store is in flight.
+_store_committers: Dict[str, asyncio.Task] = {}
+# How long a GCS-backed store is trusted without re-checking its generation.
+STORE_CACHE_TTL_SECONDS = float(os.getenv("STORE_CACHE_TTL_SECONDS") or 2.0)
+# How long a successful proxied GET is replayed to identical callers; 0 disables coalescing.
+PROXY_COALESCE_TTL = float(os.getenv("PROXY_COALESCE_TTL") or 1.0)
+_PROXY_COALESCE_MAX_ENTRIES = 256
+# (base_url, generation, endpoint, accept-encoding, forwarded headers) -> (expires monotonic, status, raw body, headers)
+_coalesce_cache: Dict[Tuple[Any, ...], Tuple[float, int, bytes, Dict[str, str]]] = {}
+# base_url -> write generation; bumped when a write through the gateway starts and again when it lands.
+_coalesce_generations: Dict[str, int] = {}
+# Same key -> future resolved with (status, raw body, headers), or None when the leading call failed.
+_coalesce_inflight: Dict[Tuple[Any, ...], asyncio.Future] = {}
+
+
+def _http_client() -> httpx.AsyncClient:
+    """
+    Return the shared, connection-pooled client opened by the app lifespan.
+    """
+    return app.state.http
+
+
+# Raw (lowercase) request header name -> name sent upstream. Auth headers already used across the stack.
+_FORWARD_HEADERS: Dict[bytes, str] = {
+    b"userkey": "userkey",
+    b"authorization": "authorization",
+    b"x-api-key": "x-api-key",
+    b"content-type": "Content-Type",
+}
 
 
 def _with_forward_headers(
@@ -98,20 +185,210 @@ def _with_forward_headers(
     *,
     extra_headers: Optional[Dict[str, str]] = None,
 ) -> Dict[str, str]:
-    headers: Dict[str, str] = {}
-    # Forward key auth headers that are already used across the stack.
-    for header_name in ("userkey", "authorization", "x-api-key"):
-        header_value = request.headers.get(header_name)
-        if header_value:
-            headers[header_name] = header_value
-    content_type = request.headers.get("content-type")
-    if content_type:
-        headers["Content-Type"] = content_type
+    # Built once per request and kept on request.state; handlers that call several services reuse it.
+    forwarded: Optional[Dict[str, str]] = getattr(request.state, "forward_headers", None)
+    if forwarded is None:
+        forwarded = {}
+        # One pass over the raw header list instead of a case-insensitive scan per header.
+        for raw_name, raw_value in request.headers.raw:
+            name = _FORWARD_HEADERS.get(raw_name)
+            if name is not None and raw_value and name not in forwarded:
+                forwarded[name] = raw_value.decode("latin-1")
+        request.state.forward_headers = forwarded
+    # Callers add/remove headers on the result, so hand out a copy.
+    headers = dict(forwarded)
     if extra_headers:
         headers.update(extra_headers)
     return headers
 
 
+async def _bounded_body(request: Request, limit: int = MAX_REQUEST_BODY_BYTES) -> bytes:
+    """
+    Buffer the request body, rejecting it with 413 as soon as it grows past `limit` bytes.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > limit:
+        raise HTTPException(status_code=413, detail="Request body too large")
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > limit:
+            raise HTTPException(status_code=413, detail="Request body too large")
+    return bytes(body)
+
+
+async def _read_json(request: Request, *, required: bool = True, default: Any = None) -> Any:
+    """
+    Parse the request body with orjson. An empty body is a 400 when required, otherwise `default`.
+    """
+    raw = await _bounded_body(request)
+    if not raw:
+        if required:
+            raise HTTPException(status_code=400, detail="Invalid JSON payload")
+        return default
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+
+
+async def _read_raw_json(request: Request, *, required: bool = True) -> bytes:
+    """
+    Return the request body untouched for handlers that only forward it upstream.
+    """
+    raw = await _bounded_body(request)
+    if not raw and required:
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    return raw
+
+
+def _fast_json(response: httpx.Response) -> Optional[Any]:
+    """
+    Parse a response body straight from bytes with orjson; None when it is empty or not JSON.
+    """
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        return None
+
+
+def _upstream_error_detail(response: httpx.Response) -> Any:
+    """
+    Error detail to surface from a failed upstream call: the parsed JSON body when it is one, else the text.
+    """
+    if response.headers.get("content-type", "").startswith("application/json"):
+        payload = _fast_json(response)
+        if payload is not None:
+            return payload
+    return response.text
+
+
+_PASSTHROUGH_HEADERS = ("content-type", "content-length", "content-encoding")
+
+
+def _upstream_accept_encoding(request: Request) -> str:
+    # Proxied bodies are relayed still-encoded, so only ask upstream for gzip when the caller accepts it.
+    return "gzip" if "gzip" in request.headers.get("accept-encoding", "") else "identity"
+
+
+def _passthrough_headers(response: httpx.Response) -> Dict[str, str]:
+    return {name: response.headers[name] for name in _PASSTHROUGH_HEADERS if name in response.headers}
+
+
+def _passthrough_response(
+    response: httpx.Response,
+    body: AsyncIterator[bytes],
+    slot: Optional[asyncio.Semaphore] = None,
+) -> Response:
+    """
+    Relay a successful upstream response's raw body without decoding or re-serializing it.
+    The upstream connection, and the proxy slot holding it when one is given, are released once the
+    last chunk has been sent.
+    """
+
+    async def close() -> None:
+        try:
+            await response.aclose()
+        finally:
+            if slot is not None:
+                slot.release()
+
+    return StreamingResponse(
+        body,
+        status_code=response.status_code,
+        headers=_passthrough_headers(response),
+        background=BackgroundTask(close),
+    )
+
+
+async def _prepend_chunk(first: bytes, rest: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    yield first
+    async for chunk in rest:
+        yield chunk
+
+
+async def _relay_success(
+    response: httpx.Response,
+    *,
+    fallback: Callable[[str], Any],
+    slot: Optional[asyncio.Semaphore] = None,
+    buffer: bool = False,
+) -> Response:
+    """
+    Relay a 2xx upstream response opened with stream=True. A non-empty JSON body passes through still
+    encoded, streamed unless `buffer` is set. An empty body, or one not labelled as JSON, is read and
+    answered as JSON, with `fallback` mapping its text to the payload when it does not parse.
+    Takes ownership of `slot` and of the response.
+    """
+    handed_off = False
+    try:
+        if response.headers.get("content-type", "").startswith("application/json"):
+            chunks = response.aiter_raw()
+            if buffer:
+                content = b"".join([chunk async for chunk in chunks])
+                if content:
+                    return Response(
+                        content=content,
+                        status_code=response.status_code,
+                        headers=_passthrough_headers(response),
+                    )
+            else:
+                async for first in chunks:
+                    if first:
+                        handed_off = True
+                        return _passthrough_response(response, _prepend_chunk(first, chunks), slot)
+            return ORJSONResponse(fallback(""), status_code=response.status_code)
+
+        await response.aread()
+        payload = _fast_json(response)
+        return ORJSONResponse(fallback(response.text) if payload is None else payload, status_code=response.status_code)
+    finally:
+        if not handed_off:
+            try:
+                await response.aclose()
+            finally:
+                if slot is not None:
+                    slot.release()
+
+
+PROXY_MAX_CONCURRENCY = int(os.getenv("PROXY_MAX_CONCURRENCY") or HTTPX_LIMITS.max_keepalive_connections or 50)
+PROXY_QUEUE_WARN_SECONDS = 0.25
+_upstream_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+
+def _upstream_semaphore(base_url: str) -> asyncio.Semaphore:
+    """
+    Per-backend cap on in-flight proxy calls, sized to the keep-alive pool by default so bursts queue on
+    warm connections instead of opening and discarding new ones.
+    """
+    semaphore = _upstream_semaphores.get(base_url)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(PROXY_MAX_CONCURRENCY)
+        _upstream_semaphores[base_url] = semaphore
+    return semaphore
+
+
+async def _acquire_upstream_slot(base_url: str) -> asyncio.Semaphore:
+    """
+    Claim a proxy slot for base_url and return its semaphore. The caller releases it once the upstream
+    connection is back in the pool, which for a streamed response is after the body has been relayed.
+    """
+    semaphore = _upstream_semaphore(base_url)
+    if not semaphore.locked():
+        await semaphore.acquire()
+        return semaphore
+    queued_at = time.monotonic()
+    await semaphore.acquire()
+    waited = time.monotonic() - queued_at
+    if waited > PROXY_QUEUE_WARN_SECONDS:
+        logger.warning(
+            "Proxy calls to %s queued %.2fs for a slot; consider raising PROXY_MAX_CONCURRENCY",
+            base_url,
+            waited,
+        )
+    return semaphore
+
+
 async def _proxy_request(
     request: Request,
     *,
@@ -120,48 +397,117 @@ async def _proxy_request(
     endpoint: str,
     extra_headers: Optional[Dict[str, str]] = None,
     json_body: Optional[Any] = None,
-) -> JSONResponse:
+    raw_body: Optional[bytes] = None,
+    buffer: bool = False,
+) -> Response:
     if not base_url:
         raise HTTPException(
             status_code=500,
             detail="Target service is not configured for this environment.",
         )
+    if method != "GET":
+        _forget_coalesced(base_url)
 
-    target_base = base_url.rstrip("/")
-    url = f"{target_base}{endpoint}"
+    # Base URLs are stripped of trailing slashes once at import by _normalize_base_url.
+    url = f"{base_url}{endpoint}"
     headers = _with_forward_headers(request, extra_headers=extra_headers)
+    headers["Accept-Encoding"] = _upstream_accept_encoding(request)
+    if raw_body:
+        headers["Content-Type"] = "application/json"
 
     logger.info("Proxying %s request to %s", method, url)
 
+    client = _http_client()
+    slot = await _acquire_upstream_slot(base_url)
+    # A 2xx hands the slot to _relay_success, which frees it once the body is relayed; other exits free it here.
+    slot_handed_off = False
     try:
-        async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-            response = await client.request(method, url, headers=headers, json=json_body)
-    except httpx.ReadTimeout:
-        logger.error("Proxy %s %s timed out", method, url)
-        return JSONResponse({"detail": READ_TIMEOUT_MESSAGE}, status_code=504)
-    except httpx.RequestError as exc:
-        logger.error("Proxy %s %s failed: %s", method, url, exc)
-        return JSONResponse({"detail": REQUEST_ERROR_MESSAGE}, status_code=502)
+        try:
+            response = await client.send(
+                client.build_request(method, url, headers=headers, json=json_body, content=raw_body or None),
+                stream=True,
+            )
+            if response.is_error:
+                try:
+                    await response.aread()
+                finally:
+                    await response.aclose()
+        except httpx.ReadTimeout:
+            logger.error("Proxy %s %s timed out", method, url)
+            return ORJSONResponse({"detail": READ_TIMEOUT_MESSAGE}, status_code=504)
+        except httpx.RequestError as exc:
+            logger.error("Proxy %s %s failed: %s", method, url, exc)
+            return ORJSONResponse({"detail": REQUEST_ERROR_MESSAGE}, status_code=502)
+        finally:
+            if method != "GET":
+                # Reads issued while the write was in flight may have seen the old state.
+                _forget_coalesced(base_url)
+
+        if response.is_error:
+            payload = _fast_json(response)
+            logger.error(
+                "Proxy %s %s failed with status %s: %s",
+                method,
+                url,
+                response.status_code,
+                payload if payload is not None else response.text,
+            )
+            detail = payload if payload is not None else {"error": response.text}
+            return ORJSONResponse({"detail": detail}, status_code=response.status_code)
 
-    try:
-        payload = response.json()
-    except ValueError:
-        payload = None
+        slot_handed_off = True
+        return await _relay_success(response, fallback=lambda text: {}, slot=slot, buffer=buffer)
+    finally:
+        if not slot_handed_off:
+            slot.release()
 
-    if response.is_error:
-        logger.error(
-            "Proxy %s %s failed with status %s: %s",
-            method,
-            url,
-            response.status_code,
-            payload if payload is not None else response.text,
-        )
-        detail = payload if payload is not None else {"error": response.text}
-        return JSONResponse({"detail": detail}, status_code=response.status_code)
 
-    if payload is None:
-        return JSONResponse({}, status_code=response.status_code)
-    return JSONResponse(payload, status_code=response.status_code)
+def _forget_coalesced(base_url: str) -> None:
+    # A write through the gateway must not be followed by a replayed pre-write read. Bumping the
+    # generation also keeps GETs that are still in flight from caching what they read.
+    _coalesce_generations[base_url] = _coalesce_generations.get(base_url, 0) + 1
+    for key in [key for key in _coalesce_cache if key[0] == base_url]:
+        del _coalesce_cache[key]
+
+
+async def _coalesced_get(request: Request, *, base_url: Optional[str], endpoint: str) -> Response:
+    """
+    Proxy a GET so that identical concurrent calls share one upstream request, and replay a successful
+    response for PROXY_COALESCE_TTL seconds. The key includes the forwarded auth headers, so callers
+    only ever share responses with themselves.
+    """
+    if not base_url or PROXY_COALESCE_TTL <= 0:
+        return await _proxy_request(request, method="GET", base_url=base_url, endpoint=endpoint)
+
+    accept_encoding = _upstream_accept_encoding(request)
+    generation = _coalesce_generations.get(base_url, 0)
+    key = (base_url, generation, endpoint, accept_encoding, tuple(sorted(_with_forward_headers(request).items())))
+    cached = _coalesce_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return Response(content=cached[2], status_code=cached[1], headers=cached[3])
+
+    pending = _coalesce_inflight.get(key)
+    if pending is not None:
+        shared = await asyncio.shield(pending)
+        if shared is not None:
+            return Response(content=shared[1], status_code=shared[0], headers=shared[2])
+        return await _proxy_request(request, method="GET", base_url=base_url, endpoint=endpoint)
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _coalesce_inflight[key] = future
+    shared = None
+    try:
+        response = await _proxy_request(request, method="GET", base_url=base_url, endpoint=endpoint, buffer=True)
+        headers = {name: value for name, value in response.headers.items() if name in _PASSTHROUGH_HEADERS}
+        shared = (response.status_code, response.body, headers)
+        if response.status_code < 300 and _coalesce_generations.get(base_url, 0) == generation:
+            if len(_coalesce_cache) >= _PROXY_COALESCE_MAX_ENTRIES:
+                _coalesce_cache.clear()
+            _coalesce_cache[key] = (time.monotonic() + PROXY_COALESCE_TTL, *shared)
+        return response
+    finally:
+        del _coalesce_inflight[key]
+        future.set_result(shared)
 
 
 async def _proxy_trigger_request(
@@ -170,9 +516,9 @@ async def _proxy_trigger_request(
     method: str,
     endpoint: str,
     json_body: Optional[Any] = None,
-    params: Optional[Dict[str, Any]] = None,
+    params: Optional[Mapping[str, Any]] = None,
     files: Optional[Dict[str, Any]] = None,
-) -> JSONResponse:
+) -> Response:
     """
     Proxy requests to TriggerService. TriggerService is the only deployment orchestrator;
     priming is allowed outside but still proxied here for UI simplicity.
@@ -180,35 +526,41 @@ async def _proxy_trigger_request(
     if not TRIGGERSERVICE_BASE_URL:
         raise HTTPException(status_code=500, detail="TriggerService is not configured.")
 
-    target_base = TRIGGERSERVICE_BASE_URL.rstrip("/")
-    url = f"{target_base}{endpoint}"
+    url = f"{TRIGGERSERVICE_BASE_URL}{endpoint}"
     headers = _with_forward_headers(request)
+    headers["Accept-Encoding"] = _upstream_accept_encoding(request)
     # Let httpx set the appropriate multipart boundary when sending files.
     if files is not None:
         headers.pop("Content-Type", None)
 
+    client = _http_client()
     try:
-        async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-            response = await client.request(
+        response = await client.send(
+            client.build_request(
                 method,
                 url,
                 headers=headers,
                 json=json_body,
                 params=params,
                 files=files,
-            )
+            ),
+            stream=True,
+        )
+        if response.is_error:
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
     except httpx.ReadTimeout:
-        return JSONResponse({"detail": READ_TIMEOUT_MESSAGE}, status_code=504)
+        return ORJSONResponse({"detail": READ_TIMEOUT_MESSAGE}, status_code=504)
     except httpx.RequestError as exc:
         logger.error("Trigger proxy %s %s failed: %s", method, url, exc)
-        return JSONResponse({"detail": REQUEST_ERROR_MESSAGE}, status_code=502)
-
-    try:
-        payload = response.json()
-    except ValueError:
-        payload = response.text
+        return ORJSONResponse({"detail": REQUEST_ERROR_MESSAGE}, status_code=502)
 
     if response.is_error:
+        payload = _fast_json(response)
+        if payload is None:
+            payload = response.text
         logger.error(
             "Trigger proxy %s %s failed with status %s: %s",
             method,
@@ -216,9 +568,9 @@ async def _proxy_trigger_request(
             response.status_code,
             payload,
         )
-        return JSONResponse({"detail": payload}, status_code=response.status_code)
+        return ORJSONResponse({"detail": payload}, status_code=response.status_code)
 
-    return JSONResponse(payload, status_code=response.status_code)
+    return await _relay_success(response, fallback=lambda text: text)
 
 
 def _inject_frontend_config(index_html: str) -> str:
@@ -235,31 +587,57 @@ def _inject_frontend_config(index_html: str) -> str:
         "AGENTONE_CONFIGURATOR_URL": AGENTONE_CONFIGURATOR_URL,
     }
     script = "<script>window.__UNIFIED_UI_CONFIG__ = {cfg};</script>".format(
-        cfg=json.dumps(config)
+        cfg=orjson.dumps(config).decode("utf-8")
     )
     if "</head>" in index_html:
         return index_html.replace("</head>", f"  {script}\n</head>", 1)
     return f"{script}\n{index_html}"
 
 
-def _serve_frontend() -> HTMLResponse:
-    if not FRONTEND_DIST.exists():
-        message = (
-            "Frontend build directory not found. "
-            "Run 'npm install' and 'npm run build' inside ui/frontend/ before starting the server."
-        )
-        return HTMLResponse(message, status_code=500)
+def _render_frontend_index() -> Optional[Tuple[bytes, str]]:
+    """
+    Read index.html once, inject the runtime config and return (body, etag).
+    Returns None when the build output is missing so callers can report it.
+    """
     index_file = FRONTEND_DIST / "index.html"
     if not index_file.exists():
-        return HTMLResponse("Frontend index file is missing.", status_code=500)
-    index_html = index_file.read_text(encoding="utf-8")
-    index_html = _inject_frontend_config(index_html)
-    return HTMLResponse(index_html)
+        return None
+    body = _inject_frontend_config(index_file.read_text(encoding="utf-8")).encode("utf-8")
+    return body, f'"{hashlib.md5(body).hexdigest()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def _serve_frontend(request: Request) -> Response:
+    rendered = getattr(app.state, "frontend_index", None)
+    if rendered is None:
+        if not FRONTEND_DIST.exists():
+            message = (
+                "Frontend build directory not found. "
+                "Run 'npm install' and 'npm run build' inside ui/frontend/ before starting the server."
+            )
+            return HTMLResponse(message, status_code=500)
+        rendered = _render_frontend_index()
+        if rendered is None:
+            return HTMLResponse("Frontend index file is missing.", status_code=500)
+        app.state.frontend_index = rendered
+    body, etag = rendered
+    # no-cache: browsers revalidate every load (so new deploys are picked up) but get a bodiless 304.
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(body, headers=headers)
 
 
 @app.get("/", response_class=HTMLResponse)
-async def root() -> HTMLResponse:
-    return _serve_frontend()
+async def root(request: Request) -> Response:
+    return _serve_frontend(request)
 
 
 # --- Simple server-side credential store ---
@@ -269,14 +647,19 @@ DATA_DIR = Path(os.getenv("CREDENTIALS_DIR", "/tmp/unified-ui-credentials"))
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
+_STORE_PREFIX = CREDENTIALS_PREFIX.strip("/")
+_STORE_FILE_PATHS = {t: DATA_DIR / f"{t}-store.json" for t in VALID_CREDENTIAL_TYPES}
+_STORE_BLOB_NAMES = {
+    t: f"{_STORE_PREFIX}/{t}-store.json" if _STORE_PREFIX else f"{t}-store.json" for t in VALID_CREDENTIAL_TYPES
+}
+
+
 def _store_file_path(type_name: str) -> Path:
-    return DATA_DIR / f"{type_name}-store.json"
+    return _STORE_FILE_PATHS[type_name]
 
 
 def _store_blob_name(type_name: str) -> str:
-    prefix = CREDENTIALS_PREFIX.strip("/")
-    blob_name = f"{type_name}-store.json"
-    return f"{prefix}/{blob_name}" if prefix else blob_name
+    return _STORE_BLOB_NAMES[type_name]
 
 
 def _empty_store() -> Dict[str, Any]:
@@ -287,6 +670,17 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+# Entry fields and the snake_case spellings older stores used for them.
+_ENTRY_FIELD_ALIASES: Tuple[Tuple[str, str], ...] = (
+    ("createdAt", "created_at"),
+    ("projectId", "project_id"),
+    ("verifiedAt", "verified_at"),
+    ("primedAt", "primed_at"),
+    ("lastCheck", "last_check"),
+    ("lastPrimeResult", "last_prime_result"),
+)
+
+
 def _normalize_entry(entry: Any) -> Dict[str, Any]:
     if not isinstance(entry, dict):
         return {
@@ -301,14 +695,10 @@ def _normalize_entry(entry: Any) -> Dict[str, Any]:
     normalized = {
         "credential": entry.get("credential"),
         "label": entry.get("label"),
-        "createdAt": entry.get("createdAt") or entry.get("created_at") or None,
         "status": status,
-        "projectId": entry.get("projectId") or entry.get("project_id"),
-        "verifiedAt": entry.get("verifiedAt") or entry.get("verified_at"),
-        "primedAt": entry.get("primedAt") or entry.get("primed_at"),
-        "lastCheck": entry.get("lastCheck") or entry.get("last_check"),
-        "lastPrimeResult": entry.get("lastPrimeResult") or entry.get("last_prime_result"),
     }
+    for field, legacy_field in _ENTRY_FIELD_ALIASES:
+        normalized[field] = entry.get(field) or entry.get(legacy_field)
     return normalized
 
 
@@ -330,19 +720,13 @@ def _entry_activation_allowed(type_name: str, entry: Dict[str, Any]) -> bool:
 def _normalize_store_payload(raw: Any, type_name: str) -> Dict[str, Any]:
     if not isinstance(raw, dict):
         return _empty_store()
-    store = _empty_store()
-    store["selectedId"] = raw.get("selectedId")
-    entries = raw.get("entries", {})
-    normalized_entries: Dict[str, Any] = {}
-    for entry_id, entry_value in entries.items():
-        normalized_entries[entry_id] = _normalize_entry(entry_value)
-    store["entries"] = normalized_entries
-
-    if store["selectedId"]:
-        entry = store["entries"].get(store["selectedId"])
+    entries = {entry_id: _normalize_entry(value) for entry_id, value in raw.get("entries", {}).items()}
+    selected_id = raw.get("selectedId")
+    if selected_id:
+        entry = entries.get(selected_id)
         if not entry or not _entry_activation_allowed(type_name, entry):
-            store["selectedId"] = None
-    return store
+            selected_id = None
+    return {"selectedId": selected_id, "entries": entries}
 
 
 def _get_gcs_bucket():
@@ -351,72 +735,327 @@ def _get_gcs_bucket():
         return None
     if _gcs_bucket is not None:
         return _gcs_bucket
-    try:
-        client = storage.Client()
-        bucket = client.bucket(CREDENTIALS_BUCKET)
-        if not bucket.exists():
-            try:
-                bucket.create(location=CREDENTIALS_BUCKET_LOCATION)
-                logger.info("Created credential bucket %s in %s", CREDENTIALS_BUCKET, CREDENTIALS_BUCKET_LOCATION)
-            except gcs_exceptions.Conflict:
-                logger.info("Credential bucket %s already exists (created concurrently).", CREDENTIALS_BUCKET)
-            except gcs_exceptions.GoogleAPIError as exc:
-                logger.error("Failed to create credentials bucket %s: %s", CREDENTIALS_BUCKET, exc)
-                raise HTTPException(status_code=500, detail="Unable to create credential bucket.")
-        _gcs_bucket = bucket
-    except Exception as exc:
-        logger.error("Failed to initialize credentials bucket %s: %s", CREDENTIALS_BUCKET, exc)
-        raise HTTPException(status_code=500, detail="Credential bucket is not accessible.")
+    # Store reads run in worker threads; without the lock a cold burst builds one client (and ADC lookup) each.
+    with _gcs_bucket_lock:
+        if _gcs_bucket is not None:
+            return _gcs_bucket
+        # Imported lazily: the storage SDK is slow to import and unused when running off local disk.
+        from google.cloud import storage
+
+        try:
+            # No exists() probe: a missing bucket reads as an empty store and is created on first write.
+            _gcs_bucket = storage.Client().bucket(CREDENTIALS_BUCKET)
+        except Exception as exc:
+            logger.error("Failed to initialize credentials bucket %s: %s", CREDENTIALS_BUCKET, exc)
+            raise HTTPException(status_code=500, detail="Credential bucket is not accessible.")
     return _gcs_bucket
 
 
-def _load_store(type_name: str) -> Dict[str, Any]:
+def _create_gcs_bucket(bucket: Any) -> None:
+    try:
+        bucket.create(location=CREDENTIALS_BUCKET_LOCATION)
+        logger.info("Created credential bucket %s in %s", CREDENTIALS_BUCKET, CREDENTIALS_BUCKET_LOCATION)
+    except gcs_exceptions.Conflict:
+        logger.info("Credential bucket %s already exists (created concurrently).", CREDENTIALS_BUCKET)
+    except gcs_exceptions.GoogleAPIError as exc:
+        logger.error("Failed to create credentials bucket %s: %s", CREDENTIALS_BUCKET, exc)
+        raise HTTPException(status_code=500, detail="Unable to create credential bucket.")
+
+
+def _cached_store(type_name: str, version: Any) -> Optional[Dict[str, Any]]:
+    cached = _store_cache.get(type_name)
+    if cached is not None and cached[0] == version:
+        _store_cache[type_name] = (version, cached[1], time.monotonic())
+        # Callers mutate the returned store in place, so never hand out the cached object.
+        return copy.deepcopy(cached[1])
+    return None
+
+
+def _recent_store(type_name: str) -> Optional[Tuple[Dict[str, Any], Any]]:
+    cached = _store_cache.get(type_name)
+    if cached is not None and time.monotonic() - cached[2] < STORE_CACHE_TTL_SECONDS:
+        return copy.deepcopy(cached[1]), cached[0]
+    return None
+
+
+def _remember_store(type_name: str, version: Any, store: Dict[str, Any]) -> None:
+    _store_cache[type_name] = (version, copy.deepcopy(store), time.monotonic())
+
+
+def _read_store(type_name: str) -> Tuple[Dict[str, Any], Optional[int]]:
+    """
+    Load a credential store along with the GCS generation it was read at.
+    The generation is 0 when the blob does not exist yet and None on local disk (or when unknown).
+    """
     # Prefer GCS if configured; fall back to local disk for local dev.
     if CREDENTIALS_BUCKET:
+        recent = _recent_store(type_name)
+        if recent is not None:
+            # A page load fans out several store reads at once; let them share one generation check.
+            return recent
         bucket = _get_gcs_bucket()
         blob = bucket.blob(_store_blob_name(type_name))
         try:
-            if not blob.exists():
-                return _empty_store()
-            raw_text = blob.download_as_text(encoding="utf-8")
-            return _normalize_store_payload(json.loads(raw_text), type_name)
+            if type_name in _store_cache:
+                try:
+                    # Metadata-only GET; lets us skip the download when the generation is unchanged.
+                    blob.reload()
+                except gcs_exceptions.NotFound:
+                    _store_cache.pop(type_name, None)
+                    return _empty_store(), 0
+                cached = _cached_store(type_name, blob.generation)
+                if cached is not None:
+                    return cached, blob.generation
+                generation = blob.generation
+                try:
+                    raw = blob.download_as_bytes(if_generation_match=generation)
+                except gcs_exceptions.PreconditionFailed:
+                    # Rewritten between reload and download; take whatever is current.
+                    raw = blob.download_as_bytes()
+                    generation = blob.generation
+            else:
+                # Nothing cached to revalidate, so a single GET (404 when missing) beats reload + download.
+                try:
+                    raw = blob.download_as_bytes()
+                except gcs_exceptions.NotFound:
+                    return _empty_store(), 0
+                generation = blob.generation
+            store = _normalize_store_payload(orjson.loads(raw), type_name)
+            _remember_store(type_name, generation, store)
+            return store, generation
         except gcs_exceptions.GoogleAPIError as exc:
             logger.error("Failed to read %s credential store from GCS: %s", type_name, exc)
             raise HTTPException(status_code=500, detail="Unable to load credentials from bucket.")
         except Exception as exc:
             logger.warning("Unexpected error reading %s store from GCS, falling back to empty: %s", type_name, exc)
-            return _empty_store()
+            return _empty_store(), None
 
     path = _store_file_path(type_name)
-    if not path.exists():
-        return _empty_store()
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
-        return _normalize_store_payload(raw, type_name)
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        _store_cache.pop(type_name, None)
+        return _empty_store(), None
+    cached = _cached_store(type_name, mtime_ns)
+    if cached is not None:
+        return cached, None
+    try:
+        raw = orjson.loads(path.read_bytes())
+        store = _normalize_store_payload(raw, type_name)
     except Exception:
-        return _empty_store()
+        return _empty_store(), None
+    _remember_store(type_name, mtime_ns, store)
+    return store, None
 
 
-def _write_store(type_name: str, store: Dict[str, Any]) -> Dict[str, Any]:
-    serialized = json.dumps(store, indent=2)
+def _load_store(type_name: str) -> Dict[str, Any]:
+    return _read_store(type_name)[0]
+
+
+def _write_store(
+    type_name: str,
+    store: Dict[str, Any],
+    *,
+    if_generation_match: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Persist a credential store. With if_generation_match set, the GCS upload only succeeds if the blob
+    is still at that generation; gcs_exceptions.PreconditionFailed is propagated so callers can retry.
+    """
     if CREDENTIALS_BUCKET:
         bucket = _get_gcs_bucket()
         blob = bucket.blob(_store_blob_name(type_name))
+        serialized = orjson.dumps(store)
         try:
-            blob.upload_from_string(serialized, content_type="application/json")
-            return store
+            try:
+                blob.upload_from_string(
+                    serialized,
+                    content_type="application/json",
+                    if_generation_match=if_generation_match,
+                )
+            except gcs_exceptions.NotFound:
+                _create_gcs_bucket(bucket)
+                blob.upload_from_string(
+                    serialized,
+                    content_type="application/json",
+                    if_generation_match=if_generation_match,
+                )
+        except (gcs_exceptions.PreconditionFailed, HTTPException):
+            raise
         except gcs_exceptions.GoogleAPIError as exc:
             logger.error("Failed to persist %s credential store to GCS: %s", type_name, exc)
             raise HTTPException(status_code=500, detail="Unable to persist credentials to bucket.")
         except Exception as exc:
             logger.error("Unexpected error writing %s store to GCS: %s", type_name, exc)
             raise HTTPException(status_code=500, detail="Unable to persist credentials to bucket.")
+        # The upload response carries the new generation, so the next load can skip the download.
+        _remember_store(type_name, blob.generation, _normalize_store_payload(store, type_name))
+        _forget_stale_credentials()
+        return store
 
     path = _store_file_path(type_name)
-    path.write_text(serialized, encoding="utf-8")
+    path.write_bytes(orjson.dumps(store, option=orjson.OPT_INDENT_2))
+    _remember_store(type_name, path.stat().st_mtime_ns, _normalize_store_payload(store, type_name))
+    _forget_stale_credentials()
     return store
 
 
+def _store_snapshot(store: Dict[str, Any]) -> Dict[str, Any]:
+    # Mutations only reassign top-level keys, entries and entry fields, so copying two levels
+    # isolates them; credentials and other nested values are shared.
+    return {**store, "entries": {entry_id: dict(entry) for entry_id, entry in store["entries"].items()}}
+
+
+async def _commit_store_batch(type_name: str, batch: list) -> None:
+    """
+    Apply a batch of queued (mutate, future) pairs to one freshly loaded store and persist it with a
+    single optimistic-generation write, resolving each future with its mutate() result or error.
+    Each mutation runs on its own snapshot, so one that raises leaves the rest of the batch intact.
+    """
+    for attempt in range(STORE_WRITE_ATTEMPTS):
+        loaded, generation = await asyncio.to_thread(_read_store, type_name)
+        store = loaded
+        outcomes = []
+        for mutate, _ in batch:
+            working = _store_snapshot(store)
+            try:
+                outcomes.append((True, mutate(working)))
+            except Exception as exc:
+                outcomes.append((False, exc))
+                continue
+            store = working
+        # No-op batches (e.g. re-selecting the active entry) skip the upload entirely.
+        if store is not loaded and store != loaded:
+            try:
+                await asyncio.to_thread(_write_store, type_name, store, if_generation_match=generation)
+            except gcs_exceptions.PreconditionFailed:
+                logger.info("%s credential store changed concurrently; retrying update (attempt %s)", type_name, attempt + 1)
+                _store_cache.pop(type_name, None)
+                await asyncio.sleep(0.05 * (2 ** attempt))
+                continue
+        for (_, future), (ok, value) in zip(batch, outcomes):
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+        return
+    _fail_store_updates(
+        batch, HTTPException(status_code=409, detail="Credential store was modified concurrently. Please retry.")
+    )
+
+
+def _fail_store_updates(batch: list, exc: BaseException) -> None:
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(exc)
+
+
+async def _drain_store_updates(type_name: str) -> None:
+    """
+    Commit queued updates for one store type, batch by batch, until none are left. This runs as its
+    own task so a caller that is cancelled mid-write cannot abort or misreport the others' updates.
+    """
+    batch: list = []
+    try:
+        while _store_pending.get(type_name):
+            batch = _store_pending.pop(type_name)
+            try:
+                await _commit_store_batch(type_name, batch)
+            except Exception as exc:
+                _fail_store_updates(batch, exc)
+    except BaseException:
+        # Only shutdown cancels the committer. The write may or may not have landed, so ask callers to retry.
+        interrupted = HTTPException(status_code=503, detail="Credential store update was interrupted. Please retry.")
+        _fail_store_updates(batch + _store_pending.pop(type_name, []), interrupted)
+        raise
+    finally:
+        _store_committers.pop(type_name, None)
+
+
+async def _update_store(type_name: str, mutate: Callable[[Dict[str, Any]], Any]) -> Any:
+    """
+    Apply mutate() to a freshly loaded store and persist it with an optimistic generation check.
+    If another writer got in first, reload and re-apply the mutation (with backoff) instead of
+    clobbering their update. Nothing is written when mutate() leaves the store unchanged.
+    Updates that queue up while a write for the same store is in flight are applied together
+    and committed with one upload. mutate() may reassign store keys, entries and entry fields but
+    must not modify nested values in place. Returns whatever mutate() returns.
+    """
+    future = asyncio.get_running_loop().create_future()
+    _store_pending.setdefault(type_name, []).append((mutate, future))
+    if type_name not in _store_committers:
+        _store_committers[type_name] = asyncio.create_task(_drain_store_updates(type_name))
+    try:
+        # Shielded: the update stays queued (and is committed) even if this caller goes away.
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        future.add_done_callback(lambda done: done.exception())
+        raise
+
+
+# (client_email, private key digest, scopes) -> refreshed google-auth credentials
+_credentials_cache: Dict[Tuple[str, str, Tuple[str, ...]], service_account.Credentials] = {}
+_credentials_locks: Dict[Tuple[str, str, Tuple[str, ...]], threading.Lock] = {}
+
+
+def _private_key_digest(service_account_info: Dict[str, Any]) -> str:
+    return hashlib.sha256(str(service_account_info.get("private_key", "")).encode("utf-8")).hexdigest()
+
+
+def _service_account_cache_key(service_account_info: Dict[str, Any], scopes: Iterable[str]) -> Tuple[str, str, Tuple[str, ...]]:
+    # The private key digest keeps a bare client_email from matching credentials minted for another key.
+    key_digest = _private_key_digest(service_account_info)
+    return str(service_account_info.get("client_email", "")), key_digest, tuple(sorted(scopes))
+
+
+def _refreshed_credentials(service_account_info: Dict[str, Any], scopes: list) -> service_account.Credentials:
+    """
+    Return credentials with a usable access token, refreshing only when the cached token is close
+    to expiry. Blocking (token endpoint round trip), so call it from a worker thread.
+    """
+    cache_key = _service_account_cache_key(service_account_info, scopes)
+    with _credentials_locks.setdefault(cache_key, threading.Lock()):
+        creds = _credentials_cache.get(cache_key)
+        if creds is not None and creds.token and creds.expiry is not None:
+            expiry = creds.expiry.replace(tzinfo=timezone.utc).timestamp()
+            if expiry > time.time() + TOKEN_REFRESH_MARGIN_SECONDS:
+                return creds
+        creds = service_account.Credentials.from_service_account_info(service_account_info, scopes=scopes)
+        creds.refresh(GoogleRequest())
+        _credentials_cache[cache_key] = creds
+        return creds
+
+
+def _forget_stale_credentials() -> None:
+    """
+    Drop refreshed credentials whose key is no longer in any credential store, so deleted or rotated
+    service accounts don't keep a private key in memory. Call after a store write. Locks are kept:
+    they hold no key material, and dropping one could let two refreshes of the same key race.
+    """
+    try:
+        stores = [_load_store(type_name) for type_name in VALID_CREDENTIAL_TYPES]
+    except HTTPException:
+        # A store we cannot read may still hold any of the keys; try again after the next write.
+        return
+    live_digests = {
+        _private_key_digest(entry.get("credential") or {})
+        for store in stores
+        for entry in (store.get("entries") or {}).values()
+        if isinstance(entry, dict) and isinstance(entry.get("credential"), dict)
+    }
+    for cache_key in list(_credentials_cache):
+        if cache_key[1] in live_digests:
+            continue
+        lock = _credentials_locks.get(cache_key)
+        if lock is None or not lock.acquire(blocking=False):
+            # Mid-refresh; the next write looks at it again.
+            continue
+        try:
+            _credentials_cache.pop(cache_key, None)
+        finally:
+            lock.release()
+
+
 def _get_target_sql_token_and_project() -> Tuple[str, str]:
     """
     Retrieve the selected target credential's project ID and a short-lived SQL Admin access token.
@@ -433,8 +1072,7 @@ def _get_target_sql_token_and_project() -> Tuple[str, str]:
         raise HTTPException(status_code=400, detail="Target credential is missing project_id.")
 
     try:
-        creds = service_account.Credentials.from_service_account_info(sa_info, scopes=[SQLADMIN_SCOPE])
-        creds.refresh(GoogleRequest())
+        creds = _refreshed_credentials(sa_info, [SQLADMIN_SCOPE])
     except Exception as exc:
         logger.error("Failed to create/refresh SQL Admin credentials: %s", exc)
         raise HTTPException(status_code=500, detail="Unable to use target credential for SQL discovery.")
@@ -470,8 +1108,7 @@ def _get_project_and_creds_for_scope(scope: Optional[str], scopes: Optional[list
 
     use_scopes = scopes or [CLOUD_BUILD_SCOPE]
     try:
-        creds = service_account.Credentials.from_service_account_info(sa_info, scopes=use_scopes)
-        creds.refresh(GoogleRequest())
+        creds = _refreshed_credentials(sa_info, use_scopes)
     except Exception as exc:
         logger.error("Failed to create/refresh credentials for scope %s: %s", normalized, exc)
         raise HTTPException(status_code=500, detail="Unable to use selected credential for validation.")
@@ -496,8 +1133,7 @@ def _get_source_build_token_and_project() -> Tuple[str, str, Optional[str]]:
         raise HTTPException(status_code=400, detail="Source credential is missing project_id.")
 
     try:
-        creds = service_account.Credentials.from_service_account_info(sa_info, scopes=[CLOUD_BUILD_SCOPE])
-        creds.refresh(GoogleRequest())
+        creds = _refreshed_credentials(sa_info, [CLOUD_BUILD_SCOPE])
     except Exception as exc:
         logger.error("Failed to create/refresh Cloud Build credentials: %s", exc)
         raise HTTPException(status_code=500, detail="Unable to use source credential for provider bootstrap.")
@@ -507,76 +1143,82 @@ def _get_source_build_token_and_project() -> Tuple[str, str, Optional[str]]:
 
 
 @app.get("/api/credential-store/{type_name}")
-async def credential_store_get(type_name: str) -> JSONResponse:
+async def credential_store_get(type_name: str) -> ORJSONResponse:
     t = _normalize_type(type_name)
-    return JSONResponse(_load_store(t))
+    return ORJSONResponse(await asyncio.to_thread(_load_store, t))
 
 
 @app.post("/api/credential-store/{type_name}/entries")
-async def credential_store_add(type_name: str, request: Request) -> JSONResponse:
+async def credential_store_add(type_name: str, request: Request) -> ORJSONResponse:
     t = _normalize_type(type_name)
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    body = await _read_json(request)
     credential = body.get("credential")
     label = body.get("label")
     if not isinstance(credential, dict):
         raise HTTPException(status_code=400, detail="credential must be an object")
     entry_id = body.get("id")
     if not entry_id or not isinstance(entry_id, str):
-        entry_id = uuid4().hex
+        entry_id = secrets.token_hex(16)
 
-    store = _load_store(t)
     created_at = body.get("createdAt") or _now_iso()
-    store["entries"][entry_id] = {
-        "credential": credential,
-        "label": label or entry_id,
-        "createdAt": created_at,
-        "status": "unverified",
-        "projectId": credential.get("project_id"),
-    }
-    # Do not auto-activate new credentials; they must be verified + primed first.
-    store["selectedId"] = store.get("selectedId") if store.get("selectedId") in store["entries"] else None
-    _write_store(t, store)
-    return JSONResponse({"id": entry_id, **store["entries"][entry_id], "selectedId": store["selectedId"]}, status_code=201)
+
+    def add_entry(store: Dict[str, Any]) -> Dict[str, Any]:
+        store["entries"][entry_id] = {
+            "credential": credential,
+            "label": label or entry_id,
+            "createdAt": created_at,
+            "status": "unverified",
+            "projectId": credential.get("project_id"),
+        }
+        # Do not auto-activate new credentials; they must be verified + primed first.
+        store["selectedId"] = store.get("selectedId") if store.get("selectedId") in store["entries"] else None
+        return {"id": entry_id, **store["entries"][entry_id], "selectedId": store["selectedId"]}
+
+    created = await _update_store(t, add_entry)
+    return ORJSONResponse(created, status_code=201)
 
 
 @app.put("/api/credential-store/{type_name}/selection")
-async def credential_store_select(type_name: str, request: Request) -> JSONResponse:
+async def credential_store_select(type_name: str, request: Request) -> ORJSONResponse:
     t = _normalize_type(type_name)
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    body = await _read_json(request)
     selected_id = body.get("selectedId")
-    store = _load_store(t)
-    if selected_id is not None and selected_id not in store["entries"]:
-        raise HTTPException(status_code=404, detail="Credential not found")
-    if selected_id:
-        entry = store["entries"].get(selected_id)
-        if not entry:
+
+    def select_entry(store: Dict[str, Any]) -> None:
+        if selected_id is not None and selected_id not in store["entries"]:
             raise HTTPException(status_code=404, detail="Credential not found")
-        if not _entry_activation_allowed(t, entry):
-            if t == "source":
-                raise HTTPException(status_code=400, detail="Source credential must be verified or primed before activation.")
-            raise HTTPException(status_code=400, detail="Target credential must be primed before activation.")
-    store["selectedId"] = selected_id
-    _write_store(t, store)
-    return JSONResponse({}, status_code=204)
+        if selected_id:
+            entry = store["entries"].get(selected_id)
+            if not entry:
+                raise HTTPException(status_code=404, detail="Credential not found")
+            if not _entry_activation_allowed(t, entry):
+                if t == "source":
+                    raise HTTPException(status_code=400, detail="Source credential must be verified or primed before activation.")
+                raise HTTPException(status_code=400, detail="Target credential must be primed before activation.")
+        store["selectedId"] = selected_id
+
+    await _update_store(t, select_entry)
+    return ORJSONResponse({}, status_code=204)
 
 
 @app.delete("/api/credential-store/{type_name}/entries/{entry_id}")
-async def credential_store_delete(type_name: str, entry_id: str) -> JSONResponse:
+async def credential_store_delete(type_name: str, entry_id: str) -> ORJSONResponse:
     t = _normalize_type(type_name)
-    store = _load_store(t)
-    if entry_id not in store["entries"]:
-        raise HTTPException(status_code=404, detail="Credential not found")
-    del store["entries"][entry_id]
-    if store.get("selectedId") == entry_id:
-        store["selectedId"] = None
-    _write_store(t, store)
-    return JSONResponse(store)
+
+    def delete_entry(store: Dict[str, Any]) -> Dict[str, Any]:
+        if entry_id not in store["entries"]:
+            raise HTTPException(status_code=404, detail="Credential not found")
+        del store["entries"][entry_id]
+        if store.get("selectedId") == entry_id:
+            store["selectedId"] = None
+        return store
+
+    store = await _update_store(t, delete_entry)
+    return ORJSONResponse(store)
+
+
+def _encode_credential(info: Any) -> str:
+    return base64.b64encode(orjson.dumps(info)).decode("ascii")
 
 
 async def _prime_status_for_credential(
@@ -588,7 +1230,7 @@ async def _prime_status_for_credential(
     if not TRIGGERSERVICE_BASE_URL:
         raise HTTPException(status_code=500, detail="TriggerService is not configured.")
     try:
-        credential_b64 = base64.b64encode(json.dumps(credential).encode("utf-8")).decode("utf-8")
+        credential_b64 = _encode_credential(credential)
     except Exception as exc:
         raise HTTPException(status_code=400, detail=f"Unable to encode credential: {exc}")
 
@@ -598,103 +1240,93 @@ async def _prime_status_for_credential(
     if region:
         params["region"] = region
 
-    url = f"{TRIGGERSERVICE_BASE_URL.rstrip('/')}/prime-status"
+    url = f"{TRIGGERSERVICE_BASE_URL}/prime-status"
     headers = _with_forward_headers(request)
-    async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-        resp = await client.get(url, params=params, headers=headers)
-    try:
-        payload = resp.json()
-    except Exception:
-        payload = None
+    resp = await _http_client().get(url, params=params, headers=headers)
+    payload = _fast_json(resp)
     if resp.is_error or payload is None:
         raise HTTPException(status_code=resp.status_code, detail=payload or resp.text)
     return payload
 
 
 @app.post("/api/credential-store/{type_name}/entries/{entry_id}/verify")
-async def credential_store_verify(type_name: str, entry_id: str, request: Request) -> JSONResponse:
+async def credential_store_verify(type_name: str, entry_id: str, request: Request) -> ORJSONResponse:
     t = _normalize_type(type_name)
-    store = _load_store(t)
+    store = await asyncio.to_thread(_load_store, t)
     entry = store["entries"].get(entry_id)
     if not entry:
         raise HTTPException(status_code=404, detail="Credential not found")
     credential = entry.get("credential")
     if not isinstance(credential, dict):
         raise HTTPException(status_code=400, detail="Stored credential is invalid.")
-    try:
-        body = await request.json()
-    except Exception:
-        body = {}
+    body = await _read_json(request, required=False, default={})
 
     project_id = body.get("project_id") or body.get("projectId") or entry.get("projectId") or credential.get("project_id")
     region = body.get("region") or "us-central1"
 
     status_payload = await _prime_status_for_credential(credential, project_id, region, request)
+    verified_at = _now_iso()
 
-    entry["status"] = "primed" if entry.get("status") == "primed" else "verified"
-    entry["verifiedAt"] = _now_iso()
-    entry["projectId"] = project_id
-    entry["lastCheck"] = {
-        "status": status_payload.get("status"),
-        "missing_bucket_count": status_payload.get("missing_bucket_count"),
-        "missing_service_account_count": status_payload.get("missing_service_account_count"),
-    }
-    store["entries"][entry_id] = entry
-    _write_store(t, store)
-    return JSONResponse({"entry": entry, "prime_status": status_payload})
+    def record_verification(store: Dict[str, Any]) -> Dict[str, Any]:
+        entry = store["entries"].get(entry_id)
+        if not entry:
+            raise HTTPException(status_code=404, detail="Credential not found")
+        entry["status"] = "primed" if entry.get("status") == "primed" else "verified"
+        entry["verifiedAt"] = verified_at
+        entry["projectId"] = project_id
+        entry["lastCheck"] = {
+            "status": status_payload.get("status"),
+            "missing_bucket_count": status_payload.get("missing_bucket_count"),
+            "missing_service_account_count": status_payload.get("missing_service_account_count"),
+        }
+        return entry
+
+    entry = await _update_store(t, record_verification)
+    return ORJSONResponse({"entry": entry, "prime_status": status_payload})
 
 
 @app.post("/api/credential-store/{type_name}/entries/{entry_id}/mark-primed")
-async def credential_store_mark_primed(type_name: str, entry_id: str, request: Request) -> JSONResponse:
+async def credential_store_mark_primed(type_name: str, entry_id: str, request: Request) -> ORJSONResponse:
     t = _normalize_type(type_name)
-    store = _load_store(t)
-    entry = store["entries"].get(entry_id)
-    if not entry:
-        raise HTTPException(status_code=404, detail="Credential not found")
-    if entry.get("status") not in {"verified", "primed"}:
-        raise HTTPException(status_code=400, detail="Verify the credential before marking it primed.")
-    try:
-        body = await request.json()
-    except Exception:
-        body = {}
+    body = await _read_json(request, required=False, default={})
+    primed_at = _now_iso()
 
-    entry["status"] = "primed"
-    entry["primedAt"] = _now_iso()
-    if body.get("prime_result"):
-        entry["lastPrimeResult"] = body.get("prime_result")
-    store["entries"][entry_id] = entry
-    _write_store(t, store)
-    return JSONResponse({"entry": entry})
+    def mark_primed(store: Dict[str, Any]) -> Dict[str, Any]:
+        entry = store["entries"].get(entry_id)
+        if not entry:
+            raise HTTPException(status_code=404, detail="Credential not found")
+        if entry.get("status") not in {"verified", "primed"}:
+            raise HTTPException(status_code=400, detail="Verify the credential before marking it primed.")
+        entry["status"] = "primed"
+        entry["primedAt"] = primed_at
+        if body.get("prime_result"):
+            entry["lastPrimeResult"] = body.get("prime_result")
+        return entry
 
+    entry = await _update_store(t, mark_primed)
+    return ORJSONResponse({"entry": entry})
 
-# --- Cloud SQL discovery using the selected target credential ---
-@app.get("/api/sql/instances")
-async def sql_instances() -> JSONResponse:
-    """
-    List Cloud SQL instances for the selected target credential's project.
-    """
-    project_id, access_token = _get_target_sql_token_and_project()
-    url = f"https://sqladmin.googleapis.com/sql/v1beta4/projects/{project_id}/instances"
-    headers = {"Authorization": f"Bearer {access_token}"}
 
+# --- Cloud SQL discovery using the selected target credential ---
+async def _sql_admin_get(url: str, headers: Dict[str, str], what: str) -> Dict[str, Any]:
     try:
-        async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-            resp = await client.get(url, headers=headers)
+        resp = await _http_client().get(url, headers=headers)
     except httpx.RequestError as exc:
-        logger.error("SQL Admin instances request failed: %s", exc)
+        logger.error("SQL Admin %s request failed: %s", what, exc)
         raise HTTPException(status_code=502, detail="Failed to contact Cloud SQL Admin.")
 
-    try:
-        payload = resp.json()
-    except Exception:
+    payload = _fast_json(resp)
+    if payload is None:
         raise HTTPException(status_code=502, detail="Invalid response from Cloud SQL Admin.")
 
     if resp.is_error:
         raise HTTPException(status_code=resp.status_code, detail=payload)
+    return payload
 
-    items = payload.get("items") or []
+
+def _sql_instances_from_payload(payload: Dict[str, Any]) -> list:
     instances = []
-    for inst in items:
+    for inst in payload.get("items") or []:
         name = inst.get("name")
         region = inst.get("region") or inst.get("gceZone")
         connection_name = inst.get("connectionName")
@@ -706,165 +1338,234 @@ async def sql_instances() -> JSONResponse:
                     "connectionName": connection_name,
                 }
             )
+    return instances
 
-    return JSONResponse({"projectId": project_id, "instances": instances})
+
+def _sql_databases_from_payload(payload: Dict[str, Any]) -> list:
+    dbs = []
+    for db in payload.get("items") or []:
+        name = db.get("name")
+        charset = db.get("charset")
+        collation = db.get("collation")
+        if name:
+            dbs.append(
+                {
+                    "name": name,
+                    "charset": charset,
+                    "collation": collation,
+                }
+            )
+    return dbs
+
+
+def _sql_admin_instances_url(project_id: str) -> str:
+    return f"https://sqladmin.googleapis.com/sql/v1beta4/projects/{project_id}/instances"
+
+
+@app.get("/api/sql/instances")
+async def sql_instances() -> ORJSONResponse:
+    """
+    List Cloud SQL instances for the selected target credential's project.
+    """
+    project_id, access_token = await asyncio.to_thread(_get_target_sql_token_and_project)
+    headers = {"Authorization": f"Bearer {access_token}"}
+    payload = await _sql_admin_get(_sql_admin_instances_url(project_id), headers, "instances")
+    return ORJSONResponse({"projectId": project_id, "instances": _sql_instances_from_payload(payload)})
+
+
+@app.get("/api/sql/instances-with-databases")
+async def sql_instances_with_databases() -> ORJSONResponse:
+    """
+    List Cloud SQL instances together with their databases in one call, fetching every
+    instance's databases concurrently. A failed lookup is reported on that instance only.
+    """
+    project_id, access_token = await asyncio.to_thread(_get_target_sql_token_and_project)
+    base_url = _sql_admin_instances_url(project_id)
+    headers = {"Authorization": f"Bearer {access_token}"}
+    payload = await _sql_admin_get(base_url, headers, "instances")
+    instances = _sql_instances_from_payload(payload)
+    results = await asyncio.gather(
+        *(_sql_admin_get(f"{base_url}/{inst['name']}/databases", headers, "databases") for inst in instances),
+        return_exceptions=True,
+    )
+    for inst, result in zip(instances, results):
+        if isinstance(result, HTTPException):
+            inst["databases"] = []
+            inst["error"] = result.detail
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            inst["databases"] = _sql_databases_from_payload(result)
+    return ORJSONResponse({"projectId": project_id, "instances": instances})
 
 
 @app.get("/api/sql/instances/{instance_name}/databases")
-async def sql_instance_databases(instance_name: str) -> JSONResponse:
+async def sql_instance_databases(instance_name: str) -> ORJSONResponse:
     """
     List databases for a Cloud SQL instance in the selected target project.
     """
-    project_id, access_token = _get_target_sql_token_and_project()
-    url = f"https://sqladmin.googleapis.com/sql/v1beta4/projects/{project_id}/instances/{instance_name}/databases"
-    headers = {"Authorization": f"Bearer {access_token}"}
+    project_id, access_token = await asyncio.to_thread(_get_target_sql_token_and_project)
+    url = f"{_sql_admin_instances_url(project_id)}/{instance_name}/databases"
+    payload = await _sql_admin_get(url, {"Authorization": f"Bearer {access_token}"}, "databases")
+    return ORJSONResponse(
+        {"projectId": project_id, "instance": instance_name, "databases": _sql_databases_from_payload(payload)}
+    )
 
-    try:
-        async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-            resp = await client.get(url, headers=headers)
-    except httpx.RequestError as exc:
-        logger.error("SQL Admin databases request failed: %s", exc)
-        raise HTTPException(status_code=502, detail="Failed to contact Cloud SQL Admin.")
 
-    try:
-        payload = resp.json()
-    except Exception:
-        raise HTTPException(status_code=502, detail="Invalid response from Cloud SQL Admin.")
+# --- Bucket and database validation helpers ---
+# 3-63 lowercase letters, numbers, dashes, underscores, dots; must start/end with letter/number.
+_BUCKET_NAME_RE = re.compile(r"[a-z0-9][a-z0-9._-]{1,61}[a-z0-9]")
 
-    if resp.is_error:
-        raise HTTPException(status_code=resp.status_code, detail=payload)
 
-    dbs = []
-    for db in payload.get("items") or []:
-        name = db.get("name")
-        charset = db.get("charset")
-        collation = db.get("collation")
-        if name:
-            dbs.append(
-                {
-                    "name": name,
-                    "charset": charset,
-                    "collation": collation,
-                }
-            )
+def _is_valid_bucket_name(name: str) -> bool:
+    if not name or not isinstance(name, str):
+        return False
+    return _BUCKET_NAME_RE.fullmatch(name) is not None
+
+
+_STORAGE_CLIENTS_MAX = 8
+# (project_id, id(credentials)) -> (credentials, storage.Client); the credentials are kept to rule out id reuse.
+_storage_clients: Dict[Tuple[str, int], Tuple[Any, Any]] = {}
+# project_id -> project number; buckets only report their owner by number.
+_project_numbers: Dict[str, int] = {}
+# Cloud Storage's per-project service agent is named after the project number.
+_GCS_SERVICE_AGENT_RE = re.compile(r"service-(\d+)@gs-project-accounts\.iam\.gserviceaccount\.com")
+
+
+def _storage_client_for(project_id: str, creds: service_account.Credentials) -> Any:
+    """
+    Reuse one storage.Client per cached credential so back-to-back validations skip client setup.
+    A refreshed credential is a new object and therefore gets a new client.
+    """
+    from google.cloud import storage
+
+    key = (project_id, id(creds))
+    cached = _storage_clients.get(key)
+    if cached is not None and cached[0] is creds:
+        return cached[1]
+    if len(_storage_clients) >= _STORAGE_CLIENTS_MAX:
+        _storage_clients.clear()
+    client = storage.Client(project=project_id, credentials=creds)
+    _storage_clients[key] = (creds, client)
+    return client
+
+
+def _lookup_bucket(project_id: str, creds: service_account.Credentials, name: str) -> Any:
+    # Runs in a worker thread: building the client imports the SDK and may resolve credentials.
+    return _storage_client_for(project_id, creds).lookup_bucket(name)
+
+
+def _project_number(project_id: str, creds: service_account.Credentials) -> Optional[int]:
+    """
+    Resolve a project ID to its number through the Cloud Storage service agent, which needs no scope
+    beyond the storage one. Blocking; None when the lookup fails.
+    """
+    number = _project_numbers.get(project_id)
+    if number is not None:
+        return number
+    try:
+        email = _storage_client_for(project_id, creds).get_service_account_email(project=project_id)
+    except Exception as exc:
+        logger.warning("Failed to resolve the project number for %s: %s", project_id, exc)
+        return None
+    match = _GCS_SERVICE_AGENT_RE.fullmatch(email or "")
+    if match is None:
+        logger.warning("Unexpected Cloud Storage service agent for %s: %s", project_id, email)
+        return None
+    number = _project_numbers[project_id] = int(match.group(1))
+    return number
+
 
-    return JSONResponse({"projectId": project_id, "instance": instance_name, "databases": dbs})
+def _bucket_response(name: str, scope: str, status: str, message: str, **fields: Any) -> ORJSONResponse:
+    return ORJSONResponse({"bucket_name": name, "scope": scope, **fields, "status": status, "message": message})
 
 
-# --- Bucket and database validation helpers ---
-def _is_valid_bucket_name(name: str) -> bool:
-    if not name or not isinstance(name, str):
-        return False
-    if len(name) < 3 or len(name) > 63:
-        return False
-    # Lowercase letters, numbers, dashes, underscores, dots; must start/end with letter/number.
-    import re
-    pattern = re.compile(r"^[a-z0-9](?:[a-z0-9._-]{1,61}[a-z0-9])?$")
-    return bool(pattern.match(name))
+def _sql_database_response(instance: str, database: str, project_id: str, status: str, message: str) -> ORJSONResponse:
+    return ORJSONResponse(
+        {"instance": instance, "database": database, "project_id": project_id, "status": status, "message": message}
+    )
 
 
 @app.get("/api/validate/bucket-name")
-async def validate_bucket_name(scope: str = "target", name: Optional[str] = None) -> JSONResponse:
+async def validate_bucket_name(scope: str = "target", name: Optional[str] = None) -> ORJSONResponse:
     """
     Validate a GCS bucket name for availability/ownership using the selected credential.
     """
     if not name:
         raise HTTPException(status_code=400, detail="Bucket name is required.")
     if not _is_valid_bucket_name(name):
-        return JSONResponse(
-            {
-                "bucket_name": name,
-                "scope": scope,
-                "status": "invalid_name",
-                "message": f"Bucket name '{name}' is invalid. Use lowercase letters, numbers, dots, underscores, or dashes (3-63 chars).",
-            }
+        return _bucket_response(
+            name,
+            scope,
+            "invalid_name",
+            f"Bucket name '{name}' is invalid. Use lowercase letters, numbers, dots, underscores, or dashes (3-63 chars).",
         )
 
-    project_id, creds = _get_project_and_creds_for_scope(scope, scopes=[STORAGE_SCOPE])
+    project_id, creds = await asyncio.to_thread(_get_project_and_creds_for_scope, scope, scopes=[STORAGE_SCOPE])
     try:
-        client = storage.Client(project=project_id, credentials=creds)
-        bucket = client.lookup_bucket(name)
+        bucket = await asyncio.to_thread(_lookup_bucket, project_id, creds, name)
     except gcs_exceptions.Forbidden:
         # Treat as exists elsewhere/inaccessible
-        return JSONResponse(
-            {
-                "bucket_name": name,
-                "scope": scope,
-                "project_id": project_id,
-                "status": "exists_elsewhere",
-                "owner_project": None,
-                "message": f"Bucket {name} exists but is not accessible with the current credential.",
-            }
+        return _bucket_response(
+            name,
+            scope,
+            "exists_elsewhere",
+            f"Bucket {name} exists but is not accessible with the current credential.",
+            project_id=project_id,
+            owner_project=None,
         )
     except Exception as exc:
         logger.error("Bucket validation failed for %s: %s", name, exc)
         raise HTTPException(status_code=500, detail="Failed to validate bucket name.")
 
     if bucket is None:
-        return JSONResponse(
-            {
-                "bucket_name": name,
-                "scope": scope,
-                "project_id": project_id,
-                "status": "available",
-                "owner_project": None,
-                "message": f"Bucket {name} is available to create in project {project_id}.",
-            }
+        return _bucket_response(
+            name,
+            scope,
+            "available",
+            f"Bucket {name} is available to create in project {project_id}.",
+            project_id=project_id,
+            owner_project=None,
         )
 
-    bucket_project = getattr(bucket, "project", None) or getattr(bucket, "project_number", None)
-    status = "exists_in_project" if str(bucket_project) == str(project_id) else "exists_elsewhere"
+    # storage.Bucket only exposes the owning project by number, so compare numbers rather than IDs.
+    bucket_project = bucket.project_number
+    project_number = await asyncio.to_thread(_project_number, project_id, creds)
+    in_project = bucket_project is not None and bucket_project == project_number
+    status = "exists_in_project" if in_project else "exists_elsewhere"
     message = (
         f"Bucket {name} exists in project {bucket_project}; can be reused."
         if status == "exists_in_project"
         else f"Bucket {name} already exists in another project ({bucket_project}); choose a different name."
     )
-    return JSONResponse(
-        {
-            "bucket_name": name,
-            "scope": scope,
-            "project_id": project_id,
-            "status": status,
-            "owner_project": bucket_project,
-            "message": message,
-        }
-    )
+    return _bucket_response(name, scope, status, message, project_id=project_id, owner_project=bucket_project)
 
 
 @app.get("/api/sql/validate-database")
-async def validate_sql_database(instance: Optional[str] = None, database: Optional[str] = None, scope: str = "target") -> JSONResponse:
+async def validate_sql_database(instance: Optional[str] = None, database: Optional[str] = None, scope: str = "target") -> ORJSONResponse:
     """
     Validate whether a database exists within a Cloud SQL instance using the selected credential.
     """
     if not instance or not database:
         raise HTTPException(status_code=400, detail="instance and database are required.")
 
-    project_id, creds = _get_project_and_creds_for_scope(scope, scopes=[SQLADMIN_SCOPE])
+    project_id, creds = await asyncio.to_thread(_get_project_and_creds_for_scope, scope, scopes=[SQLADMIN_SCOPE])
     headers = {"Authorization": f"Bearer {creds.token}"}
     url = f"https://sqladmin.googleapis.com/sql/v1beta4/projects/{project_id}/instances/{instance}/databases"
 
     try:
-        async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-            resp = await client.get(url, headers=headers)
+        resp = await _http_client().get(url, headers=headers)
     except httpx.RequestError as exc:
         logger.error("SQL Admin database validation request failed: %s", exc)
         raise HTTPException(status_code=502, detail="Failed to contact Cloud SQL Admin.")
 
-    try:
-        payload = resp.json()
-    except Exception:
+    payload = _fast_json(resp)
+    if payload is None:
         raise HTTPException(status_code=502, detail="Invalid response from Cloud SQL Admin.")
 
     if resp.status_code == 404:
-        return JSONResponse(
-            {
-                "instance": instance,
-                "database": database,
-                "project_id": project_id,
-                "status": "instance_not_found",
-                "message": f"Instance {instance} was not found in project {project_id}.",
-            },
-            status_code=200,
+        return _sql_database_response(
+            instance, database, project_id, "instance_not_found", f"Instance {instance} was not found in project {project_id}."
         )
 
     if resp.is_error:
@@ -873,24 +1574,16 @@ async def validate_sql_database(instance: Optional[str] = None, database: Option
     items = payload.get("items") or []
     exists = any(db.get("name") == database for db in items)
     if exists:
-        return JSONResponse(
-            {
-                "instance": instance,
-                "database": database,
-                "project_id": project_id,
-                "status": "exists",
-                "message": f"Database {database} exists in instance {instance}.",
-            }
+        return _sql_database_response(
+            instance, database, project_id, "exists", f"Database {database} exists in instance {instance}."
         )
 
-    return JSONResponse(
-        {
-            "instance": instance,
-            "database": database,
-            "project_id": project_id,
-            "status": "missing",
-            "message": f"Database {database} does not exist in instance {instance} and can be created.",
-        }
+    return _sql_database_response(
+        instance,
+        database,
+        project_id,
+        "missing",
+        f"Database {database} does not exist in instance {instance} and can be created.",
     )
 
 
@@ -901,15 +1594,15 @@ _sql_operations: Dict[str, Dict[str, Any]] = {}
 
 
 @app.get("/api/sql/preflight-check")
-async def sql_preflight_check(scope: str = "source") -> JSONResponse:
+async def sql_preflight_check(scope: str = "source") -> ORJSONResponse:
     """
     Check permissions and resources for Cloud SQL operations.
     Returns API status, available permissions, quota, and existing instances.
     """
     try:
-        project_id, creds = _get_project_and_creds_for_scope(scope, scopes=[SQLADMIN_SCOPE])
+        project_id, creds = await asyncio.to_thread(_get_project_and_creds_for_scope, scope, scopes=[SQLADMIN_SCOPE])
     except HTTPException as e:
-        return JSONResponse({
+        return ORJSONResponse({
             "ok": False,
             "error": str(e.detail),
             "api_enabled": False,
@@ -942,55 +1635,53 @@ async def sql_preflight_check(scope: str = "source") -> JSONResponse:
     # Test permissions by listing instances
     url = f"https://sqladmin.googleapis.com/sql/v1beta4/projects/{project_id}/instances"
     try:
-        async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-            resp = await client.get(url, headers=headers)
-            if resp.status_code == 200:
-                result["permissions"]["instances_list"] = True
-                result["permissions"]["instances_create"] = True  # Assume if can list, can create
-                result["permissions"]["databases_list"] = True
-                result["permissions"]["databases_create"] = True
-                result["permissions"]["users_list"] = True
-                result["permissions"]["users_create"] = True
+        resp = await _http_client().get(url, headers=headers)
+        if resp.status_code == 200:
+            result["permissions"]["instances_list"] = True
+            result["permissions"]["instances_create"] = True  # Assume if can list, can create
+            result["permissions"]["databases_list"] = True
+            result["permissions"]["databases_create"] = True
+            result["permissions"]["users_list"] = True
+            result["permissions"]["users_create"] = True
                 
-                payload = resp.json()
-                instances = payload.get("items") or []
-                result["quota"]["instances_used"] = len(instances)
-                result["quota"]["instances_available"] = max(0, 10 - len(instances))
+            payload = orjson.loads(resp.content)
+            instances = payload.get("items") or []
+            result["quota"]["instances_used"] = len(instances)
+            result["quota"]["instances_available"] = max(0, 10 - len(instances))
                 
-                for inst in instances:
-                    result["existing_instances"].append({
-                        "name": inst.get("name"),
-                        "region": inst.get("region"),
-                        "status": inst.get("state"),
-                        "database_version": inst.get("databaseVersion"),
-                        "connection_name": inst.get("connectionName"),
-                    })
-            elif resp.status_code == 403:
-                result["ok"] = False
-                result["error"] = "Permission denied. Grant 'Cloud SQL Admin' role to the service account."
-            else:
-                result["ok"] = False
-                result["error"] = f"SQL Admin API returned status {resp.status_code}"
+            for inst in instances:
+                result["existing_instances"].append({
+                    "name": inst.get("name"),
+                    "region": inst.get("region"),
+                    "status": inst.get("state"),
+                    "database_version": inst.get("databaseVersion"),
+                    "connection_name": inst.get("connectionName"),
+                })
+        elif resp.status_code == 403:
+            result["ok"] = False
+            result["error"] = "Permission denied. Grant 'Cloud SQL Admin' role to the service account."
+        else:
+            result["ok"] = False
+            result["error"] = f"SQL Admin API returned status {resp.status_code}"
     except Exception as exc:
         logger.error("SQL preflight check failed: %s", exc)
         result["ok"] = False
         result["error"] = str(exc)
 
-    return JSONResponse(result)
+    return ORJSONResponse(result)
 
 
 @app.get("/api/sql/instances-list")
-async def sql_instances_list(scope: str = "source") -> JSONResponse:
+async def sql_instances_list(scope: str = "source") -> ORJSONResponse:
     """
     List all Cloud SQL instances for a given scope (source/target).
     """
-    project_id, creds = _get_project_and_creds_for_scope(scope, scopes=[SQLADMIN_SCOPE])
+    project_id, creds = await asyncio.to_thread(_get_project_and_creds_for_scope, scope, scopes=[SQLADMIN_SCOPE])
     headers = {"Authorization": f"Bearer {creds.token}"}
     url = f"https://sqladmin.googleapis.com/sql/v1beta4/projects/{project_id}/instances"
 
     try:
-        async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-            resp = await client.get(url, headers=headers)
+        resp = await _http_client().get(url, headers=headers)
     except httpx.RequestError as exc:
         logger.error("SQL instances list request failed: %s", exc)
         raise HTTPException(status_code=502, detail="Failed to contact Cloud SQL Admin.")
@@ -998,7 +1689,7 @@ async def sql_instances_list(scope: str = "source") -> JSONResponse:
     if resp.is_error:
         raise HTTPException(status_code=resp.status_code, detail=resp.text)
 
-    payload = resp.json()
+    payload = orjson.loads(resp.content)
     instances = []
     for inst in payload.get("items") or []:
         instances.append({
@@ -1010,19 +1701,16 @@ async def sql_instances_list(scope: str = "source") -> JSONResponse:
             "tier": inst.get("settings", {}).get("tier"),
         })
 
-    return JSONResponse({"project_id": project_id, "instances": instances})
+    return ORJSONResponse({"project_id": project_id, "instances": instances})
 
 
 @app.post("/api/sql/instances-create")
-async def sql_instances_create(request: Request) -> JSONResponse:
+async def sql_instances_create(request: Request) -> ORJSONResponse:
     """
     Create a new Cloud SQL instance. Returns operation_id for polling.
     Instance creation can take 15-30 minutes.
     """
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    body = await _read_json(request)
 
     scope = body.get("scope", "source")
     instance_name = body.get("name")
@@ -1033,7 +1721,7 @@ async def sql_instances_create(request: Request) -> JSONResponse:
     if not instance_name:
         raise HTTPException(status_code=400, detail="Instance name is required.")
 
-    project_id, creds = _get_project_and_creds_for_scope(scope, scopes=[SQLADMIN_SCOPE])
+    project_id, creds = await asyncio.to_thread(_get_project_and_creds_for_scope, scope, scopes=[SQLADMIN_SCOPE])
     headers = {"Authorization": f"Bearer {creds.token}", "Content-Type": "application/json"}
     url = f"https://sqladmin.googleapis.com/sql/v1beta4/projects/{project_id}/instances"
 
@@ -1054,18 +1742,17 @@ async def sql_instances_create(request: Request) -> JSONResponse:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            resp = await client.post(url, headers=headers, json=instance_body)
+        resp = await _http_client().post(url, headers=headers, json=instance_body, timeout=60.0)
     except httpx.RequestError as exc:
         logger.error("SQL instance create request failed: %s", exc)
         raise HTTPException(status_code=502, detail="Failed to contact Cloud SQL Admin.")
 
     if resp.is_error:
-        payload = resp.json() if resp.content else {}
+        payload = orjson.loads(resp.content) if resp.content else {}
         error_msg = payload.get("error", {}).get("message", resp.text)
         raise HTTPException(status_code=resp.status_code, detail=error_msg)
 
-    payload = resp.json()
+    payload = orjson.loads(resp.content)
     operation_name = payload.get("name")
     
     # Track operation
@@ -1082,7 +1769,7 @@ async def sql_instances_create(request: Request) -> JSONResponse:
         "scope": scope,
     }
 
-    return JSONResponse({
+    return ORJSONResponse({
         "operation_id": operation_id,
         "operation_name": operation_name,
         "instance_name": instance_name,
@@ -1093,7 +1780,7 @@ async def sql_instances_create(request: Request) -> JSONResponse:
 
 
 @app.get("/api/sql/operations/{operation_id}")
-async def sql_operation_status(operation_id: str) -> JSONResponse:
+async def sql_operation_status(operation_id: str) -> ORJSONResponse:
     """
     Poll status of a long-running SQL operation (e.g., instance creation).
     """
@@ -1106,9 +1793,9 @@ async def sql_operation_status(operation_id: str) -> JSONResponse:
     operation_name = op["operation_name"]
 
     try:
-        _, creds = _get_project_and_creds_for_scope(scope, scopes=[SQLADMIN_SCOPE])
+        _, creds = await asyncio.to_thread(_get_project_and_creds_for_scope, scope, scopes=[SQLADMIN_SCOPE])
     except HTTPException:
-        return JSONResponse({
+        return ORJSONResponse({
             "operation_id": operation_id,
             "status": "ERROR",
             "error": "Credential no longer valid.",
@@ -1118,24 +1805,23 @@ async def sql_operation_status(operation_id: str) -> JSONResponse:
     url = f"https://sqladmin.googleapis.com/sql/v1beta4/projects/{project_id}/operations/{operation_name}"
 
     try:
-        async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-            resp = await client.get(url, headers=headers)
+        resp = await _http_client().get(url, headers=headers)
     except httpx.RequestError as exc:
         logger.error("SQL operation status request failed: %s", exc)
-        return JSONResponse({
+        return ORJSONResponse({
             "operation_id": operation_id,
             "status": "UNKNOWN",
             "error": str(exc),
         })
 
     if resp.is_error:
-        return JSONResponse({
+        return ORJSONResponse({
             "operation_id": operation_id,
             "status": "ERROR",
             "error": resp.text,
         })
 
-    payload = resp.json()
+    payload = orjson.loads(resp.content)
     op_status = payload.get("status")
     
     # Calculate elapsed time
@@ -1164,34 +1850,33 @@ async def sql_operation_status(operation_id: str) -> JSONResponse:
         result["status"] = "ERROR"
         result["error"] = payload.get("error", {}).get("message", "Unknown error")
 
-    return JSONResponse(result)
+    return ORJSONResponse(result)
 
 
 @app.get("/api/sql/databases-list")
-async def sql_databases_list(instance: str, scope: str = "source") -> JSONResponse:
+async def sql_databases_list(instance: str, scope: str = "source") -> ORJSONResponse:
     """
     List all databases in a Cloud SQL instance.
     """
     if not instance:
         raise HTTPException(status_code=400, detail="instance is required.")
 
-    project_id, creds = _get_project_and_creds_for_scope(scope, scopes=[SQLADMIN_SCOPE])
+    project_id, creds = await asyncio.to_thread(_get_project_and_creds_for_scope, scope, scopes=[SQLADMIN_SCOPE])
     headers = {"Authorization": f"Bearer {creds.token}"}
     url = f"https://sqladmin.googleapis.com/sql/v1beta4/projects/{project_id}/instances/{instance}/databases"
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.get(url, headers=headers)
+        resp = await _http_client().get(url, headers=headers, timeout=30.0)
     except httpx.RequestError as exc:
         logger.error("SQL databases list request failed: %s", exc)
         raise HTTPException(status_code=502, detail="Failed to contact Cloud SQL Admin.")
 
     if resp.is_error:
-        payload = resp.json() if resp.content else {}
+        payload = orjson.loads(resp.content) if resp.content else {}
         error_msg = payload.get("error", {}).get("message", resp.text)
         raise HTTPException(status_code=resp.status_code, detail=error_msg)
 
-    payload = resp.json()
+    payload = orjson.loads(resp.content)
     databases = []
     for db in payload.get("items", []):
         # Filter out system databases
@@ -1203,7 +1888,7 @@ async def sql_databases_list(instance: str, scope: str = "source") -> JSONRespon
                 "collation": db.get("collation", ""),
             })
 
-    return JSONResponse({
+    return ORJSONResponse({
         "databases": databases,
         "instance": instance,
         "project_id": project_id,
@@ -1211,14 +1896,11 @@ async def sql_databases_list(instance: str, scope: str = "source") -> JSONRespon
 
 
 @app.post("/api/sql/databases-create")
-async def sql_databases_create(request: Request) -> JSONResponse:
+async def sql_databases_create(request: Request) -> ORJSONResponse:
     """
     Create a new database in an existing Cloud SQL instance.
     """
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    body = await _read_json(request)
 
     scope = body.get("scope", "source")
     instance_name = body.get("instance")
@@ -1227,7 +1909,7 @@ async def sql_databases_create(request: Request) -> JSONResponse:
     if not instance_name or not database_name:
         raise HTTPException(status_code=400, detail="instance and database are required.")
 
-    project_id, creds = _get_project_and_creds_for_scope(scope, scopes=[SQLADMIN_SCOPE])
+    project_id, creds = await asyncio.to_thread(_get_project_and_creds_for_scope, scope, scopes=[SQLADMIN_SCOPE])
     headers = {"Authorization": f"Bearer {creds.token}", "Content-Type": "application/json"}
     url = f"https://sqladmin.googleapis.com/sql/v1beta4/projects/{project_id}/instances/{instance_name}/databases"
 
@@ -1238,18 +1920,17 @@ async def sql_databases_create(request: Request) -> JSONResponse:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-            resp = await client.post(url, headers=headers, json=db_body)
+        resp = await _http_client().post(url, headers=headers, json=db_body)
     except httpx.RequestError as exc:
         logger.error("SQL database create request failed: %s", exc)
         raise HTTPException(status_code=502, detail="Failed to contact Cloud SQL Admin.")
 
     if resp.is_error:
-        payload = resp.json() if resp.content else {}
+        payload = orjson.loads(resp.content) if resp.content else {}
         error_msg = payload.get("error", {}).get("message", resp.text)
         # Check if database already exists
         if "already exists" in error_msg.lower():
-            return JSONResponse({
+            return ORJSONResponse({
                 "instance": instance_name,
                 "database": database_name,
                 "project_id": project_id,
@@ -1258,7 +1939,7 @@ async def sql_databases_create(request: Request) -> JSONResponse:
             })
         raise HTTPException(status_code=resp.status_code, detail=error_msg)
 
-    return JSONResponse({
+    return ORJSONResponse({
         "instance": instance_name,
         "database": database_name,
         "project_id": project_id,
@@ -1268,17 +1949,16 @@ async def sql_databases_create(request: Request) -> JSONResponse:
 
 
 @app.get("/api/sql/users-list")
-async def sql_users_list(instance: str, scope: str = "source") -> JSONResponse:
+async def sql_users_list(instance: str, scope: str = "source") -> ORJSONResponse:
     """
     List users for a Cloud SQL instance.
     """
-    project_id, creds = _get_project_and_creds_for_scope(scope, scopes=[SQLADMIN_SCOPE])
+    project_id, creds = await asyncio.to_thread(_get_project_and_creds_for_scope, scope, scopes=[SQLADMIN_SCOPE])
     headers = {"Authorization": f"Bearer {creds.token}"}
     url = f"https://sqladmin.googleapis.com/sql/v1beta4/projects/{project_id}/instances/{instance}/users"
 
     try:
-        async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-            resp = await client.get(url, headers=headers)
+        resp = await _http_client().get(url, headers=headers)
     except httpx.RequestError as exc:
         logger.error("SQL users list request failed: %s", exc)
         raise HTTPException(status_code=502, detail="Failed to contact Cloud SQL Admin.")
@@ -1286,7 +1966,7 @@ async def sql_users_list(instance: str, scope: str = "source") -> JSONResponse:
     if resp.is_error:
         raise HTTPException(status_code=resp.status_code, detail=resp.text)
 
-    payload = resp.json()
+    payload = orjson.loads(resp.content)
     users = []
     for user in payload.get("items") or []:
         users.append({
@@ -1295,18 +1975,15 @@ async def sql_users_list(instance: str, scope: str = "source") -> JSONResponse:
             "type": user.get("type"),
         })
 
-    return JSONResponse({"project_id": project_id, "instance": instance, "users": users})
+    return ORJSONResponse({"project_id": project_id, "instance": instance, "users": users})
 
 
 @app.post("/api/sql/users-create")
-async def sql_users_create(request: Request) -> JSONResponse:
+async def sql_users_create(request: Request) -> ORJSONResponse:
     """
     Create a new user in a Cloud SQL instance with password.
     """
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    body = await _read_json(request)
 
     scope = body.get("scope", "source")
     instance_name = body.get("instance")
@@ -1316,7 +1993,7 @@ async def sql_users_create(request: Request) -> JSONResponse:
     if not instance_name or not username:
         raise HTTPException(status_code=400, detail="instance and username are required.")
 
-    project_id, creds = _get_project_and_creds_for_scope(scope, scopes=[SQLADMIN_SCOPE])
+    project_id, creds = await asyncio.to_thread(_get_project_and_creds_for_scope, scope, scopes=[SQLADMIN_SCOPE])
     headers = {"Authorization": f"Bearer {creds.token}", "Content-Type": "application/json"}
     url = f"https://sqladmin.googleapis.com/sql/v1beta4/projects/{project_id}/instances/{instance_name}/users"
 
@@ -1328,18 +2005,17 @@ async def sql_users_create(request: Request) -> JSONResponse:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-            resp = await client.post(url, headers=headers, json=user_body)
+        resp = await _http_client().post(url, headers=headers, json=user_body)
     except httpx.RequestError as exc:
         logger.error("SQL user create request failed: %s", exc)
         raise HTTPException(status_code=502, detail="Failed to contact Cloud SQL Admin.")
 
     if resp.is_error:
-        payload = resp.json() if resp.content else {}
+        payload = orjson.loads(resp.content) if resp.content else {}
         error_msg = payload.get("error", {}).get("message", resp.text)
         # Check if user already exists
         if "already exists" in error_msg.lower():
-            return JSONResponse({
+            return ORJSONResponse({
                 "instance": instance_name,
                 "username": username,
                 "project_id": project_id,
@@ -1348,7 +2024,7 @@ async def sql_users_create(request: Request) -> JSONResponse:
             })
         raise HTTPException(status_code=resp.status_code, detail=error_msg)
 
-    return JSONResponse({
+    return ORJSONResponse({
         "instance": instance_name,
         "username": username,
         "project_id": project_id,
@@ -1359,21 +2035,18 @@ async def sql_users_create(request: Request) -> JSONResponse:
 
 # --- Provider bootstrap via Cloud Build using the selected source credential ---
 @app.post("/api/bootstrap/provider")
-async def bootstrap_provider(request: Request) -> JSONResponse:
+async def bootstrap_provider(request: Request) -> ORJSONResponse:
     """
     Kick off a provider bootstrap Cloud Build using the selected source credential.
     This runs `make bootstrap-provider` from the thunderdeploy repo (GitHub), using the provided region.
     """
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    body = await _read_json(request)
 
     region = (body.get("region") or "us-central1").strip() or "us-central1"
     branch = (body.get("branch") or "main").strip() or "main"
     repo_url = (body.get("repo_url") or "https://github.com/thunderdomeai/thunderdeploy.git").strip()
 
-    project_id, access_token, sa_email = _get_source_build_token_and_project()
+    project_id, access_token, sa_email = await asyncio.to_thread(_get_source_build_token_and_project)
 
     # Use GitHub PAT for private repo access (optional for public repos)
     authenticated_url = repo_url
@@ -1419,16 +2092,12 @@ async def bootstrap_provider(request: Request) -> JSONResponse:
     headers = {"Authorization": f"Bearer {access_token}"}
 
     try:
-        async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-            resp = await client.post(url, headers=headers, json=build_body)
+        resp = await _http_client().post(url, headers=headers, json=build_body)
     except httpx.RequestError as exc:
         logger.error("Cloud Build bootstrap request failed: %s", exc)
         raise HTTPException(status_code=502, detail="Failed to contact Cloud Build.")
 
-    try:
-        payload = resp.json()
-    except Exception:
-        payload = None
+    payload = _fast_json(resp)
 
     if resp.is_error or payload is None:
         detail = payload or resp.text
@@ -1444,30 +2113,18 @@ async def bootstrap_provider(request: Request) -> JSONResponse:
         "branch": branch,
         "repo": repo_url,
     }
-    return JSONResponse(result, status_code=resp.status_code)
+    return ORJSONResponse(result, status_code=resp.status_code)
 
 
-@app.post("/api/thunderdeploy/deploy-agents")
-async def thunderdeploy_deploy_agents(request: Request) -> JSONResponse:
+async def _deploy_agents_context() -> Dict[str, Any]:
     """
-    Kick off a Cloud Build that runs thunderdeploy/deploy_agents_ordered.py for a 10-agent stack.
-    Supports dry-run preview and optional inclusion of scheduling agents.
+    Load what every deploy-agents build shares: the active source/target credentials and a
+    Cloud Build token for the source project.
     """
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
-
-    region = (body.get("region") or "us-central1").strip() or "us-central1"
-    branch = (body.get("branch") or "main").strip() or "main"
-    repo_url = (body.get("repo_url") or "https://github.com/thunderdomeai/thunderdeploy.git").strip()
-    dry_run = bool(body.get("dry_run"))
-    include_schedulers = bool(body.get("include_schedulers"))
-    deployment_tag = (body.get("deployment_tag") or "").strip()
-    requested_project_id = (body.get("project_id") or "").strip()
-
-    source_store = _load_store("source")
-    target_store = _load_store("target")
+    source_store, target_store = await asyncio.gather(
+        asyncio.to_thread(_load_store, "source"),
+        asyncio.to_thread(_load_store, "target"),
+    )
     source_entry = (source_store.get("entries") or {}).get(source_store.get("selectedId"))
     target_entry = (target_store.get("entries") or {}).get(target_store.get("selectedId"))
     if not source_entry or not source_entry.get("credential"):
@@ -1475,28 +2132,57 @@ async def thunderdeploy_deploy_agents(request: Request) -> JSONResponse:
     if not target_entry or not target_entry.get("credential"):
         raise HTTPException(status_code=400, detail="Active target credential is required for mass deploy.")
 
+    if not TRIGGERSERVICE_BASE_URL:
+        raise HTTPException(status_code=500, detail="TriggerService base URL not configured.")
+
+    build_project_id, access_token, build_sa_email = await asyncio.to_thread(_get_source_build_token_and_project)
     runner_sa_info = source_entry.get("credential") or {}
     customer_sa_info = target_entry.get("credential") or {}
+    return {
+        "target_entry": target_entry,
+        "customer_sa_info": customer_sa_info,
+        "runner_sa_b64": _encode_credential(runner_sa_info),
+        "customer_sa_b64": _encode_credential(customer_sa_info),
+        "build_project_id": build_project_id,
+        "auth_headers": {"Authorization": f"Bearer {access_token}"},
+        "build_sa_email": build_sa_email,
+    }
+
+
+def _body_str(body: Dict[str, Any], field: str, default: str = "") -> str:
+    value = body.get(field) or default
+    if not isinstance(value, str):
+        raise HTTPException(status_code=400, detail=f"{field} must be a string.")
+    return value.strip()
+
+
+async def _submit_deploy_agents_build(body: Dict[str, Any], context: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    """
+    Build and submit one deploy_agents_ordered.py Cloud Build; returns (status_code, result).
+    """
+    region = _body_str(body, "region", "us-central1") or "us-central1"
+    branch = _body_str(body, "branch", "main") or "main"
+    repo_url = _body_str(body, "repo_url", "https://github.com/thunderdomeai/thunderdeploy.git")
+    dry_run = bool(body.get("dry_run"))
+    include_schedulers = bool(body.get("include_schedulers"))
+    deployment_tag = _body_str(body, "deployment_tag")
+    requested_project_id = _body_str(body, "project_id")
+
     target_project_id = (
         requested_project_id
-        or target_entry.get("projectId")
-        or customer_sa_info.get("project_id")
+        or context["target_entry"].get("projectId")
+        or context["customer_sa_info"].get("project_id")
         or "thunderdeployone"
     )
 
-    if not TRIGGERSERVICE_BASE_URL:
-        raise HTTPException(status_code=500, detail="TriggerService base URL not configured.")
-
     config_path = (
         "config/thunderdeployone_userrequirements_final.json"
         if include_schedulers
         else "execdir/thunderdeployone_no_sched.json"
     )
 
-    build_project_id, access_token, build_sa_email = _get_source_build_token_and_project()
-
-    runner_sa_b64 = base64.b64encode(json.dumps(runner_sa_info).encode("utf-8")).decode("utf-8")
-    customer_sa_b64 = base64.b64encode(json.dumps(customer_sa_info).encode("utf-8")).decode("utf-8")
+    build_project_id = context["build_project_id"]
+    build_sa_email = context["build_sa_email"]
 
     # Use GitHub PAT for private repo access (optional for public repos)
     authenticated_url = repo_url
@@ -1541,8 +2227,8 @@ async def thunderdeploy_deploy_agents(request: Request) -> JSONResponse:
         "entrypoint": "/bin/sh",
         "dir": ".",
         "env": [
-            f"RUNNER_SA_B64={runner_sa_b64}",
-            f"CUSTOMER_SA_B64={customer_sa_b64}",
+            f"RUNNER_SA_B64={context['runner_sa_b64']}",
+            f"CUSTOMER_SA_B64={context['customer_sa_b64']}",
             f"TRIGGERSERVICE_BASE_URL={TRIGGERSERVICE_BASE_URL}",
             f"TARGET_PROJECT_ID={target_project_id}",
             f"REGION={region}",
@@ -1564,20 +2250,13 @@ async def thunderdeploy_deploy_agents(request: Request) -> JSONResponse:
         build_body["serviceAccount"] = f"projects/{build_project_id}/serviceAccounts/{build_sa_email}"
 
     url = f"https://cloudbuild.googleapis.com/v1/projects/{build_project_id}/builds"
-    headers = {"Authorization": f"Bearer {access_token}"}
-
     try:
-        async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-            resp = await client.post(url, headers=headers, json=build_body)
+        resp = await _http_client().post(url, headers=context["auth_headers"], json=build_body)
     except httpx.RequestError as exc:
         logger.error("Cloud Build deploy request failed: %s", exc)
         raise HTTPException(status_code=502, detail="Failed to contact Cloud Build.")
 
-    try:
-        payload = resp.json()
-    except Exception:
-        payload = None
-
+    payload = _fast_json(resp)
     if resp.is_error or payload is None:
         detail = payload or resp.text
         logger.error("Cloud Build deploy failed: %s", detail)
@@ -1596,30 +2275,231 @@ async def thunderdeploy_deploy_agents(request: Request) -> JSONResponse:
         "branch": branch,
         "repo": repo_url,
     }
-    return JSONResponse(result, status_code=resp.status_code)
+    return resp.status_code, result
+
+
+@app.post("/api/thunderdeploy/deploy-agents")
+async def thunderdeploy_deploy_agents(request: Request) -> ORJSONResponse:
+    """
+    Kick off a Cloud Build that runs thunderdeploy/deploy_agents_ordered.py for a 10-agent stack.
+    Supports dry-run preview and optional inclusion of scheduling agents.
+    """
+    body = await _read_json(request)
+    context = await _deploy_agents_context()
+    status_code, result = await _submit_deploy_agents_build(body, context)
+    return ORJSONResponse(result, status_code=status_code)
+
 
+DEPLOY_AGENTS_BULK_MAX_TARGETS = 20
+DEPLOY_AGENTS_BULK_CONCURRENCY = 8
 
-# --- Deploy configuration store (simple JSON persisted on disk) ---
+
+@app.post("/api/thunderdeploy/deploy-agents-bulk")
+async def thunderdeploy_deploy_agents_bulk(request: Request) -> ORJSONResponse:
+    """
+    Submit several deploy-agents builds at once. Body: {"targets": [<deploy-agents body>, ...]}.
+    Credentials and the Cloud Build token are resolved once; builds are submitted concurrently and
+    each target reports its own status so one failure does not hide the others.
+    """
+    body = await _read_json(request)
+    targets = body.get("targets") if isinstance(body, dict) else None
+    if not isinstance(targets, list) or not targets:
+        raise HTTPException(status_code=400, detail="targets must be a non-empty list.")
+    if len(targets) > DEPLOY_AGENTS_BULK_MAX_TARGETS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {DEPLOY_AGENTS_BULK_MAX_TARGETS} targets can be deployed per request.",
+        )
+    if not all(isinstance(target, dict) for target in targets):
+        raise HTTPException(status_code=400, detail="Each target must be an object.")
+
+    context = await _deploy_agents_context()
+    semaphore = asyncio.Semaphore(DEPLOY_AGENTS_BULK_CONCURRENCY)
+
+    async def submit(target: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                status_code, result = await _submit_deploy_agents_build(target, context)
+            except HTTPException as exc:
+                return {"status": exc.status_code, "body": {"detail": exc.detail}}
+            except Exception:
+                logger.exception("Deploy-agents bulk submission failed for one target")
+                return {"status": 500, "body": {"detail": "Failed to submit deploy-agents build."}}
+        return {"status": status_code, "body": result}
+
+    results = await asyncio.gather(*(submit(target) for target in targets))
+    return ORJSONResponse({"results": list(results)})
+
+
+# --- Deploy configuration store (JSON snapshot plus an append-only change log on disk) ---
 CONFIG_STORE_FILE = DATA_DIR / "deploy-configs.json"
+CONFIG_LOG_FILE = DATA_DIR / "deploy-configs.ndjson"
+# Fold the log back into the snapshot once it holds this many records per live config.
+CONFIG_LOG_COMPACT_RATIO = 4
 
 
-def _load_deploy_configs() -> Dict[str, Any]:
-    if not CONFIG_STORE_FILE.exists():
-        return {"configs": {}}
+_deploy_configs_cache: Optional[Tuple[Tuple[int, ...], Dict[str, Any], int]] = None
+_deploy_configs_lock = asyncio.Lock()
+
+
+@contextmanager
+def _deploy_configs_file_lock(exclusive: bool) -> Iterator[None]:
+    """
+    flock a sibling lock file so appends and compaction from other worker processes never
+    interleave: writers hold it exclusively, readers shared so they never see a snapshot
+    whose log has already been folded away.
+    """
+    with open(CONFIG_LOG_FILE.with_suffix(".lock"), "a+b") as fh:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+def _deploy_configs_stamp() -> Tuple[int, ...]:
+    stamp = []
+    for path in (CONFIG_STORE_FILE, CONFIG_LOG_FILE):
+        try:
+            stat = path.stat()
+            stamp.extend((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            stamp.extend((0, 0))
+    return tuple(stamp)
+
+
+def _read_deploy_configs_snapshot() -> Dict[str, Any]:
     try:
-        raw = json.loads(CONFIG_STORE_FILE.read_text(encoding="utf-8"))
-        if not isinstance(raw, dict):
-            return {"configs": {}}
-        if "configs" not in raw or not isinstance(raw["configs"], dict):
-            raw["configs"] = {}
-        return raw
+        raw = orjson.loads(CONFIG_STORE_FILE.read_bytes())
     except Exception:
         return {"configs": {}}
+    if not isinstance(raw, dict):
+        return {"configs": {}}
+    if "configs" not in raw or not isinstance(raw["configs"], dict):
+        raw["configs"] = {}
+    return raw
 
 
-def _write_deploy_configs(store: Dict[str, Any]) -> Dict[str, Any]:
-    CONFIG_STORE_FILE.write_text(json.dumps(store, indent=2), encoding="utf-8")
-    return store
+def _replay_deploy_configs_log(configs: Dict[str, Any]) -> int:
+    """
+    Apply the upsert/delete records from the change log to configs; returns the number of records read.
+    """
+    try:
+        lines = CONFIG_LOG_FILE.read_bytes().splitlines()
+    except FileNotFoundError:
+        return 0
+    for line in lines:
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # A torn line from an interrupted append; the records around it are still valid.
+            continue
+        if not isinstance(record, dict):
+            continue
+        if record.get("op") == "upsert" and isinstance(record.get("cfg"), dict):
+            configs[record.get("id")] = record["cfg"]
+        elif record.get("op") == "delete":
+            configs.pop(record.get("id"), None)
+    return len(lines)
+
+
+def _deploy_configs_state() -> Tuple[Tuple[int, ...], Dict[str, Any], int]:
+    """
+    Return the cached (stamp, store, log_records), reloading from disk when another process
+    has touched the files. Callers must hold the file lock.
+    """
+    global _deploy_configs_cache
+    stamp = _deploy_configs_stamp()
+    if _deploy_configs_cache is None or _deploy_configs_cache[0] != stamp:
+        store = _read_deploy_configs_snapshot()
+        log_records = _replay_deploy_configs_log(store["configs"])
+        _deploy_configs_cache = (stamp, store, log_records)
+    return _deploy_configs_cache
+
+
+def _load_deploy_configs() -> Dict[str, Any]:
+    with _deploy_configs_file_lock(exclusive=False):
+        _, store, _ = _deploy_configs_state()
+    # Stored configs are replaced, never edited in place, so a shallow copy is a stable snapshot.
+    return {**store, "configs": dict(store["configs"])}
+
+
+def _append_deploy_configs_log(records: list[Dict[str, Any]]) -> None:
+    payload = b"".join(orjson.dumps(record) + b"\n" for record in records)
+    with open(CONFIG_LOG_FILE, "a+b") as fh:
+        if fh.tell():
+            fh.seek(-1, os.SEEK_END)
+            if fh.read(1) != b"\n":
+                payload = b"\n" + payload
+        fh.write(payload)
+        fh.flush()
+        os.fsync(fh.fileno())
+
+
+def _compact_deploy_configs(store: Dict[str, Any]) -> None:
+    # Write to a sibling temp file and rename so readers never see a half-written store.
+    tmp_path = CONFIG_STORE_FILE.with_suffix(".json.tmp")
+    with open(tmp_path, "wb") as fh:
+        fh.write(orjson.dumps(store, option=orjson.OPT_INDENT_2))
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp_path, CONFIG_STORE_FILE)
+    # The log is the only other copy of recent edits, so the rename must be durable before it goes.
+    dir_fd = os.open(DATA_DIR, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+    # Replaying the log over the new snapshot is idempotent, so a crash before this unlink is harmless.
+    CONFIG_LOG_FILE.unlink(missing_ok=True)
+
+
+def _write_deploy_config(
+    cfg_id: str, mutate: Callable[[Optional[Dict[str, Any]]], Optional[Dict[str, Any]]]
+) -> Optional[Dict[str, Any]]:
+    """
+    Apply mutate to one config and persist it as a single log record, compacting when the log
+    grows too long. mutate receives a private copy of the config (None if it does not exist) and
+    returns its new value, or None to delete it.
+    """
+    global _deploy_configs_cache
+    with _deploy_configs_file_lock(exclusive=True):
+        _, store, log_records = _deploy_configs_state()
+        configs = store["configs"]
+        current = configs.get(cfg_id)
+        updated = mutate(copy.deepcopy(current))
+        if updated == current:
+            return updated
+        if log_records + 1 > CONFIG_LOG_COMPACT_RATIO * max(len(configs), 1):
+            configs = dict(configs)
+            if updated is None:
+                configs.pop(cfg_id, None)
+            else:
+                configs[cfg_id] = updated
+            store = {**store, "configs": configs}
+            _compact_deploy_configs(store)
+            log_records = 0
+        else:
+            if updated is None:
+                _append_deploy_configs_log([{"op": "delete", "id": cfg_id}])
+                configs.pop(cfg_id, None)
+            else:
+                _append_deploy_configs_log([{"op": "upsert", "id": cfg_id, "cfg": updated}])
+                configs[cfg_id] = updated
+            log_records += 1
+        _deploy_configs_cache = (_deploy_configs_stamp(), store, log_records)
+    return updated
+
+
+async def _update_deploy_config(
+    cfg_id: str, mutate: Callable[[Optional[Dict[str, Any]]], Optional[Dict[str, Any]]]
+) -> Optional[Dict[str, Any]]:
+    """
+    Replace (or delete) a single deploy config under a process-wide lock so concurrent edits
+    cannot overwrite each other. Returns the config's new value.
+    """
+    async with _deploy_configs_lock:
+        return await asyncio.to_thread(_write_deploy_config, cfg_id, mutate)
 
 
 def _maybe_parse_b64_json(value: Optional[str]) -> Optional[Any]:
@@ -1627,11 +2507,16 @@ def _maybe_parse_b64_json(value: Optional[str]) -> Optional[Any]:
         return None
     try:
         decoded = base64.b64decode(value)
-        return json.loads(decoded)
+        return orjson.loads(decoded)
     except Exception:
         return None
 
 
+# Keys that mark a bare dict as a single agent entry.
+_AGENT_ID_KEYS = frozenset({"name", "instance_id", "service", "service_name"})
+_WAVE_LABEL_KEYS: Tuple[str, ...] = ("wave", "deployment_wave", "tier")
+
+
 def _build_userrequirements(candidate: Any) -> Optional[Dict[str, Any]]:
     if candidate is None:
         return None
@@ -1643,7 +2528,7 @@ def _build_userrequirements(candidate: Any) -> Optional[Dict[str, Any]]:
                 "agents": agents or repos or [],
                 "repositories": repos or agents or [],
             }
-        if any(key in candidate for key in ("name", "instance_id", "service", "service_name")):
+        if not _AGENT_ID_KEYS.isdisjoint(candidate):
             return {
                 "agents": [candidate],
                 "repositories": [candidate],
@@ -1656,6 +2541,29 @@ def _build_userrequirements(candidate: Any) -> Optional[Dict[str, Any]]:
     return None
 
 
+# Where job records stash the userrequirements snapshot, in lookup order.
+_JOB_USERREQ_PATHS: Tuple[Tuple[str, ...], ...] = (
+    ("userrequirements",),
+    ("metadata", "userrequirements"),
+    ("metadata", "config"),
+    ("config",),
+    ("job_config",),
+)
+_JOB_USERREQ_B64_PATHS: Tuple[Tuple[str, ...], ...] = (
+    ("metadata", "config_b64"),
+    ("config_b64",),
+)
+
+
+def _lookup_path(record: Any, path: Tuple[str, ...]) -> Any:
+    node = record
+    for key in path:
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    return node
+
+
 def _extract_userrequirements_from_job(job_record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Attempt to recover the userrequirements payload from a job record.
@@ -1664,36 +2572,24 @@ def _extract_userrequirements_from_job(job_record: Dict[str, Any]) -> Optional[D
     if not isinstance(job_record, dict):
         return None
 
-    metadata = job_record.get("metadata") if isinstance(job_record.get("metadata"), dict) else {}
-
-    candidates = [
-        job_record.get("userrequirements"),
-        metadata.get("userrequirements") if isinstance(metadata, dict) else None,
-        metadata.get("config") if isinstance(metadata, dict) else None,
-        job_record.get("config"),
-        job_record.get("job_config"),
-    ]
-
-    for b64_field in ("config_b64",):
-        if isinstance(metadata, dict) and metadata.get(b64_field):
-            parsed = _maybe_parse_b64_json(metadata.get(b64_field))
-            if parsed:
-                candidates.append(parsed)
-        if job_record.get(b64_field):
-            parsed = _maybe_parse_b64_json(job_record.get(b64_field))
-            if parsed:
-                candidates.append(parsed)
-
-    for candidate in candidates:
-        userreq = _build_userrequirements(candidate)
+    for path in _JOB_USERREQ_PATHS:
+        userreq = _build_userrequirements(_lookup_path(job_record, path))
         if userreq:
             return userreq
 
+    # Only pay for base64 decoding when no plain snapshot was found.
+    for path in _JOB_USERREQ_B64_PATHS:
+        parsed = _maybe_parse_b64_json(_lookup_path(job_record, path))
+        if parsed:
+            userreq = _build_userrequirements(parsed)
+            if userreq:
+                return userreq
+
     return None
 
 
 def _derive_waves_from_userrequirements(userreq: Dict[str, Any]) -> Dict[str, Any]:
-    waves: Dict[str, Any] = {}
+    waves: DefaultDict[int, list] = defaultdict(list)
     agents = []
     if isinstance(userreq, dict):
         if isinstance(userreq.get("agents"), list):
@@ -1704,108 +2600,94 @@ def _derive_waves_from_userrequirements(userreq: Dict[str, Any]) -> Dict[str, An
         wave_value = 0
         if isinstance(agent, dict):
             wave_value = agent.get("wave")
-            if wave_value is None and isinstance(agent.get("environment"), dict):
+            if wave_value is None:
                 env = agent.get("environment")
-                wave_value = env.get("wave") or env.get("deployment_wave")
+                if isinstance(env, dict):
+                    wave_value = env.get("wave") or env.get("deployment_wave")
         try:
             wave_idx = int(wave_value) if wave_value is not None else 0
         except (TypeError, ValueError):
             wave_idx = 0
-        waves.setdefault(str(wave_idx), []).append(agent)
-    if not waves and agents:
-        waves["0"] = agents
-    return waves or {"0": []}
+        waves[wave_idx].append(agent)
+    return {str(wave_idx): members for wave_idx, members in waves.items()} or {"0": []}
+
+
+# Editable fields of a stored deploy config, in the order they are persisted.
+_DEPLOY_CONFIG_FIELDS: Tuple[str, ...] = ("name", "description", "waves", "metadata", "userrequirements")
 
 
 @app.get("/api/deploy-configs")
-async def deploy_configs_list() -> JSONResponse:
-    store = _load_deploy_configs()
+async def deploy_configs_list() -> ORJSONResponse:
+    store = await asyncio.to_thread(_load_deploy_configs)
     configs = [
         {"id": cid, **cfg}
         for cid, cfg in store.get("configs", {}).items()
     ]
-    return JSONResponse({"configs": configs})
+    return ORJSONResponse({"configs": configs})
 
 
 @app.post("/api/deploy-configs")
-async def deploy_configs_create(request: Request) -> JSONResponse:
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+async def deploy_configs_create(request: Request) -> ORJSONResponse:
+    body = await _read_json(request)
     name = body.get("name")
     if not name:
         raise HTTPException(status_code=400, detail="name is required")
-    cfg_id = uuid4().hex
-    store = _load_deploy_configs()
-    store["configs"][cfg_id] = {
+    cfg_id = secrets.token_hex(16)
+    config = {
         "name": name,
         "description": body.get("description") or "",
         "waves": body.get("waves") or {},
         "metadata": body.get("metadata") or {},
         "userrequirements": body.get("userrequirements") or {},
     }
-    _write_deploy_configs(store)
-    return JSONResponse({"id": cfg_id, **store["configs"][cfg_id]}, status_code=201)
+
+    await _update_deploy_config(cfg_id, lambda _: config)
+    return ORJSONResponse({"id": cfg_id, **config}, status_code=201)
 
 
 @app.put("/api/deploy-configs/{cfg_id}")
-async def deploy_configs_update(cfg_id: str, request: Request) -> JSONResponse:
-    store = _load_deploy_configs()
-    if cfg_id not in store.get("configs", {}):
-        raise HTTPException(status_code=404, detail="Config not found")
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
-    existing = store["configs"][cfg_id]
-    existing.update({
-        "name": body.get("name", existing.get("name")),
-        "description": body.get("description", existing.get("description")),
-        "waves": body.get("waves", existing.get("waves")),
-        "metadata": body.get("metadata", existing.get("metadata")),
-        "userrequirements": body.get("userrequirements", existing.get("userrequirements")),
-    })
-    store["configs"][cfg_id] = existing
-    _write_deploy_configs(store)
-    return JSONResponse({"id": cfg_id, **existing})
+async def deploy_configs_update(cfg_id: str, request: Request) -> ORJSONResponse:
+    body = await _read_json(request)
+
+    def update_config(existing: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if existing is None:
+            raise HTTPException(status_code=404, detail="Config not found")
+        existing.update({field: body.get(field, existing.get(field)) for field in _DEPLOY_CONFIG_FIELDS})
+        return existing
+
+    existing = await _update_deploy_config(cfg_id, update_config)
+    return ORJSONResponse({"id": cfg_id, **existing})
 
 
 @app.delete("/api/deploy-configs/{cfg_id}")
-async def deploy_configs_delete(cfg_id: str) -> JSONResponse:
-    store = _load_deploy_configs()
-    if cfg_id not in store.get("configs", {}):
-        raise HTTPException(status_code=404, detail="Config not found")
-    del store["configs"][cfg_id]
-    _write_deploy_configs(store)
-    return JSONResponse({"deleted": cfg_id})
+async def deploy_configs_delete(cfg_id: str) -> ORJSONResponse:
+    def delete_config(existing: Optional[Dict[str, Any]]) -> None:
+        if existing is None:
+            raise HTTPException(status_code=404, detail="Config not found")
+        return None
+
+    await _update_deploy_config(cfg_id, delete_config)
+    return ORJSONResponse({"deleted": cfg_id})
 
 
 async def _fetch_trigger_job(job_identifier: str, request: Request) -> Dict[str, Any]:
     if not TRIGGERSERVICE_BASE_URL:
         raise HTTPException(status_code=500, detail="TriggerService is not configured.")
-    url = f"{TRIGGERSERVICE_BASE_URL.rstrip('/')}/jobs/{job_identifier}"
+    url = f"{TRIGGERSERVICE_BASE_URL}/jobs/{job_identifier}"
     headers = _with_forward_headers(request)
-    async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-        resp = await client.get(url, headers=headers)
-    try:
-        payload = resp.json()
-    except Exception:
-        payload = None
+    resp = await _http_client().get(url, headers=headers)
+    payload = _fast_json(resp)
     if resp.is_error or payload is None:
         raise HTTPException(status_code=resp.status_code, detail=payload or resp.text)
     return payload
 
 
 @app.post("/api/deploy-configs/from-job")
-async def deploy_configs_from_job(request: Request) -> JSONResponse:
+async def deploy_configs_from_job(request: Request) -> ORJSONResponse:
     """
     Save a deploy configuration sourced from an existing job record (uses the job's stored userrequirements/config snapshot).
     """
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    body = await _read_json(request)
     job_id = body.get("job_id") or body.get("job_identifier")
     if not job_id:
         raise HTTPException(status_code=400, detail="job_id is required")
@@ -1816,49 +2698,51 @@ async def deploy_configs_from_job(request: Request) -> JSONResponse:
         raise HTTPException(status_code=404, detail="Job does not contain a reusable userrequirements/config snapshot.")
 
     waves = _derive_waves_from_userrequirements(userreq)
-    store = _load_deploy_configs()
-    cfg_id = uuid4().hex
-    now_iso = datetime.now(timezone.utc).isoformat()
+    cfg_id = secrets.token_hex(16)
+    now_iso = _now_iso()
     name = body.get("name") or f"From job {job_id}"
     description = body.get("description") or f"Imported from job {job_id}"
     metadata = body.get("metadata") or {}
-    metadata.update({
+    metadata = {
+        **metadata,
         "source": metadata.get("source") or "job",
         "job_identifier": job_id,
         "tenant_id": job_record.get("tenant_id") or job_record.get("client_project"),
         "service_name": job_record.get("service_name") or job_record.get("instance_id"),
         "imported_at": now_iso,
-    })
+    }
 
-    store["configs"][cfg_id] = {
+    config = {
         "name": name,
         "description": description,
         "waves": waves,
         "metadata": metadata,
         "userrequirements": userreq,
     }
-    _write_deploy_configs(store)
-    return JSONResponse({"id": cfg_id, **store["configs"][cfg_id]}, status_code=201)
+
+    await _update_deploy_config(cfg_id, lambda _: config)
+    return ORJSONResponse({"id": cfg_id, **config}, status_code=201)
 
 
 # --- Logs fetch (server-side token) ---
 
 
 def _to_env_map(env_list: Optional[Any]) -> Dict[str, Any]:
-    env_map: Dict[str, Any] = {}
-    if isinstance(env_list, list):
-        for item in env_list:
-            if isinstance(item, dict) and item.get("name") and "value" in item:
-                env_map[item["name"]] = item.get("value")
-    elif isinstance(env_list, dict):
+    if isinstance(env_list, dict):
         return env_list
-    return env_map
+    if not isinstance(env_list, list):
+        return {}
+    return {
+        name: item["value"]
+        for item in env_list
+        if isinstance(item, dict) and "value" in item and (name := item.get("name"))
+    }
 
 
 def _infer_wave_from_labels(labels: Optional[Dict[str, Any]]) -> Optional[int]:
     if not isinstance(labels, dict):
         return None
-    for key in ("wave", "deployment_wave", "tier"):
+    for key in _WAVE_LABEL_KEYS:
         if key in labels:
             try:
                 return int(labels[key])
@@ -1868,14 +2752,11 @@ def _infer_wave_from_labels(labels: Optional[Dict[str, Any]]) -> Optional[int]:
 
 
 @app.post("/api/run/service-config")
-async def run_service_config(request: Request) -> JSONResponse:
+async def run_service_config(request: Request) -> Response:
     """
     Fetch a Cloud Run service definition using a provided service account and build a minimal userrequirements payload.
     """
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    body = await _read_json(request)
 
     service_account = body.get("service_account")
     service_name = body.get("service_name") or body.get("service")
@@ -1890,19 +2771,20 @@ async def run_service_config(request: Request) -> JSONResponse:
     token = await _get_access_token(service_account, ["https://www.googleapis.com/auth/cloud-platform"])
     run_url = f"https://run.googleapis.com/v2/projects/{project_id}/locations/{region}/services/{service_name}"
 
-    async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-        resp = await client.get(
-            run_url,
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json",
-            },
-        )
+    resp = await _http_client().get(
+        run_url,
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        },
+    )
     if resp.is_error:
-        detail = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else resp.text
+        detail = _upstream_error_detail(resp)
         raise HTTPException(status_code=resp.status_code, detail=detail)
 
-    service_payload = resp.json()
+    service_payload = _fast_json(resp)
+    if not isinstance(service_payload, dict):
+        raise HTTPException(status_code=502, detail="Cloud Run returned an unexpected service payload.")
     template = service_payload.get("template") or {}
     containers = template.get("containers") or []
     first_container = containers[0] if containers else {}
@@ -1930,23 +2812,17 @@ async def run_service_config(request: Request) -> JSONResponse:
         "repositories": [agent_entry],
     }
 
-    return JSONResponse(
-        {
-            "service": service_payload,
-            "userrequirements": userrequirements,
-        }
-    )
+    # The service definition goes back verbatim; splice the upstream bytes in instead of re-encoding them.
+    content = b'{"service":' + resp.content + b',"userrequirements":' + orjson.dumps(userrequirements) + b"}"
+    return Response(content=content, media_type="application/json")
 
 
 @app.post("/api/run/services")
-async def run_list_services(request: Request) -> JSONResponse:
+async def run_list_services(request: Request) -> ORJSONResponse:
     """
     List Cloud Run services using a provided service account (for dropdowns/autocomplete).
     """
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    body = await _read_json(request)
 
     service_account = body.get("service_account")
     project_id = body.get("project_id") or (service_account or {}).get("project_id")
@@ -1958,110 +2834,220 @@ async def run_list_services(request: Request) -> JSONResponse:
 
     token = await _get_access_token(service_account, ["https://www.googleapis.com/auth/cloud-platform"])
     base_url = f"https://run.googleapis.com/v2/projects/{project_id}/locations/{region}/services"
-    services: list[dict[str, Any]] = []
+    simplified: list[dict[str, Any]] = []
     page_token = None
-    async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-        while True:
-            params = {"pageSize": 200}
-            if page_token:
-                params["pageToken"] = page_token
-            resp = await client.get(
-                base_url,
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json",
-                },
-                params=params,
-            )
-            if resp.is_error:
-                detail = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else resp.text
-                raise HTTPException(status_code=resp.status_code, detail=detail)
-            payload = resp.json()
-            page_services = payload.get("services") or []
-            if page_services:
-                services.extend(page_services)
-            page_token = payload.get("nextPageToken")
-            if not page_token:
-                break
-
-    simplified = []
-    for svc in services:
-        name = svc.get("name", "")
-        short_name = name.rsplit("/", 1)[-1] if name else svc.get("serviceName")
-        simplified.append(
-            {
-                "name": short_name,
-                "full_name": name,
-                "url": svc.get("uri") or svc.get("url"),
-                "labels": svc.get("labels") or {},
-            }
+    client = _http_client()
+    # Page tokens are opaque and only returned one page at a time, so pages are fetched in sequence;
+    # each page is reduced to the dropdown fields as it arrives instead of holding every full service.
+    while True:
+        params = {"pageSize": 200}
+        if page_token:
+            params["pageToken"] = page_token
+        resp = await client.get(
+            base_url,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            },
+            params=params,
         )
+        if resp.is_error:
+            detail = _upstream_error_detail(resp)
+            raise HTTPException(status_code=resp.status_code, detail=detail)
+        payload = _fast_json(resp) or {}
+        for svc in payload.get("services") or []:
+            name = svc.get("name", "")
+            short_name = name.rsplit("/", 1)[-1] if name else svc.get("serviceName")
+            simplified.append(
+                {
+                    "name": short_name,
+                    "full_name": name,
+                    "url": svc.get("uri") or svc.get("url"),
+                    "labels": svc.get("labels") or {},
+                }
+            )
+        page_token = payload.get("nextPageToken")
+        if not page_token:
+            break
+
+    return ORJSONResponse({"services": simplified})
+
+
+# Path("") is Path("."), which is truthy and exists, so only add the override when it is actually set.
+DEFAULT_SAMPLE_PATHS: Tuple[Path, ...] = tuple(
+    p
+    for p in (
+        Path(os.environ["SAMPLE_USERREQUIREMENTS_PATH"]) if os.getenv("SAMPLE_USERREQUIREMENTS_PATH") else None,
+        BASE_DIR / "sample_userrequirements.json",
+        BASE_DIR.parent / "thunderdeploy" / "config" / "thunderdeployone_userrequirements_final.json",
+    )
+    if p is not None
+)
+
+
+# parent directory -> (st_mtime_ns, entry names); only the fixed default locations are looked up here.
+_dir_listings: Dict[Path, Tuple[int, Set[str]]] = {}
+
+
+def _dir_listing(parent: Path) -> Set[str]:
+    try:
+        mtime_ns = parent.stat().st_mtime_ns
+    except OSError:
+        return set()
+    cached = _dir_listings.get(parent)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    try:
+        names = set(os.listdir(parent))
+    except OSError:
+        return set()
+    _dir_listings[parent] = (mtime_ns, names)
+    return names
+
 
-    return JSONResponse({"services": simplified})
+def _first_existing(paths: Iterable[Path]) -> Optional[Path]:
+    """
+    Return the first path that exists. Parent listings are memoized and revalidated by mtime, so a lookup
+    costs one stat per parent; a listed name is confirmed with exists() so a dangling symlink falls through.
+    """
+    for path in paths:
+        if path.name in _dir_listing(path.parent) and path.exists():
+            return path
+    return None
 
 
-DEFAULT_SAMPLE_PATHS = [
-    Path(os.getenv("SAMPLE_USERREQUIREMENTS_PATH", "")),
-    BASE_DIR / "sample_userrequirements.json",
-    BASE_DIR.parent / "thunderdeploy" / "config" / "thunderdeployone_userrequirements_final.json",
-]
+# str(path) -> (st_mtime_ns, parsed canonical userrequirements); callers treat the payload as read-only.
+_canonical_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
 
 
 def _load_canonical_userrequirements() -> Dict[str, Any]:
     """
-    Load the canonical provider userrequirements without sanitization.
+    Load the canonical provider userrequirements without sanitization, re-parsing only when the file changes.
     Uses the same search order as /api/deploy/sample-userrequirements.
     """
-    candidate_paths = [p for p in DEFAULT_SAMPLE_PATHS if p]
+    candidate_paths = DEFAULT_SAMPLE_PATHS
     for path in candidate_paths:
-        if path.exists():
-            try:
-                payload = json.loads(path.read_text(encoding="utf-8"))
-                if isinstance(payload, dict):
-                    return payload
-            except Exception as exc:
-                logger.warning("Failed to parse canonical userrequirements at %s: %s", path, exc)
-                continue
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            continue
+        key = str(path)
+        cached = _canonical_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        try:
+            payload = orjson.loads(path.read_bytes())
+        except Exception as exc:
+            logger.warning("Failed to parse canonical userrequirements at %s: %s", path, exc)
+            continue
+        if isinstance(payload, dict):
+            _canonical_cache[key] = (mtime_ns, payload)
+            return payload
     raise HTTPException(
         status_code=500,
         detail=f"Canonical userrequirements not found. Tried: {[str(p) for p in candidate_paths]}",
     )
 
 
-def _canonical_agent_env_by_name(canonical: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+def _resolved_canonical_env(env: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten env for `_get_extra_env(env, key) or env.get(key)` lookups: a truthy extra_env value wins,
+    otherwise the top-level value is used.
+    """
+    resolved = dict(env)
+    extra = env.get("extra_env")
+    if isinstance(extra, dict):
+        resolved.update((key, value) for key, value in extra.items() if value)
+    elif isinstance(extra, list):
+        seen: Set[str] = set()
+        for entry in extra:
+            if not isinstance(entry, dict):
+                continue
+            entry_key = entry.get("key") or entry.get("name")
+            # Only the first matching entry is ever consulted.
+            if not isinstance(entry_key, str) or entry_key in seen:
+                continue
+            seen.add(entry_key)
+            if entry.get("value"):
+                resolved[entry_key] = entry["value"]
+    return resolved
+
+
+# (canonical payload, its index); the canonical payload is cached and read-only, so identity is enough.
+_canonical_env_index: Optional[Tuple[Dict[str, Any], Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]]]] = None
+
+
+def _canonical_agent_env_by_name(canonical: Dict[str, Any]) -> Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]]:
     """
-    Build a lookup of agent name -> canonical environment block.
+    Build a lookup of agent name -> (canonical environment block, same block with extra_env folded in).
     """
-    mapping: Dict[str, Dict[str, Any]] = {}
+    global _canonical_env_index
+    if _canonical_env_index is not None and _canonical_env_index[0] is canonical:
+        return _canonical_env_index[1]
+    mapping: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
     for agent in canonical.get("agents") or []:
         if not isinstance(agent, dict):
             continue
         name = agent.get("name")
         env = agent.get("environment")
         if name and isinstance(env, dict):
-            mapping[name] = env
+            mapping[name] = (env, _resolved_canonical_env(env))
+    _canonical_env_index = (canonical, mapping)
     return mapping
 
 
+_SAMPLE_CACHE_MAX_ENTRIES = 16
+# str(path) -> (st_mtime_ns, encoded {"userrequirements", "path"} response body, ETag)
+_sample_cache: Dict[str, Tuple[int, bytes, str]] = {}
+
+
+def _sample_response_bytes(path: Path) -> Tuple[bytes, str]:
+    """
+    Encoded sample-userrequirements response (and its ETag) for path,
+    re-read only when the file's mtime changes.
+    """
+    key = str(path)
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _sample_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1], cached[2]
+    content = orjson.dumps({"userrequirements": orjson.loads(path.read_bytes()), "path": key})
+    etag = f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+    if len(_sample_cache) >= _SAMPLE_CACHE_MAX_ENTRIES:
+        # ?path= overrides can point anywhere; keep the cache from growing without bound.
+        _sample_cache.clear()
+    _sample_cache[key] = (mtime_ns, content, etag)
+    return content, etag
+
+
 @app.get("/api/deploy/sample-userrequirements")
-async def deploy_sample_userrequirements(request: Request) -> JSONResponse:
+async def deploy_sample_userrequirements(request: Request) -> Response:
     """
     Load a known-good userrequirements file from disk (defaulting to thunderdeploy/config/thunderdeployone_userrequirements_final.json).
     """
     override_path = request.query_params.get("path")
     candidate_paths = []
+    path = None
     if override_path:
         override = Path(override_path).expanduser()
-        candidate_paths.append(override if override.is_absolute() else (BASE_DIR / override).resolve())
-    candidate_paths.extend([p for p in DEFAULT_SAMPLE_PATHS if p])
-
-    for path in candidate_paths:
-        if path.exists():
-            try:
-                payload = json.loads(path.read_text(encoding="utf-8"))
-                return JSONResponse({"userrequirements": payload, "path": str(path)})
-            except Exception as exc:
-                raise HTTPException(status_code=500, detail=f"Failed to read sample userrequirements: {exc}")
+        override = override if override.is_absolute() else (BASE_DIR / override).resolve()
+        candidate_paths.append(override)
+        # Caller-chosen location: stat it directly rather than listing (and memoizing) its directory.
+        if override.exists():
+            path = override
+    candidate_paths.extend(DEFAULT_SAMPLE_PATHS)
+
+    if path is None:
+        path = _first_existing(DEFAULT_SAMPLE_PATHS)
+    if path is not None:
+        try:
+            content, etag = await asyncio.to_thread(_sample_response_bytes, path)
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=f"Failed to read sample userrequirements: {exc}")
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=content, media_type="application/json", headers=headers)
 
     raise HTTPException(status_code=404, detail=f"Sample userrequirements not found. Tried: {[str(p) for p in candidate_paths]}")
 
@@ -2069,15 +3055,10 @@ async def deploy_sample_userrequirements(request: Request) -> JSONResponse:
 def _placeholder_value(value: Any) -> bool:
     if value is None:
         return True
-    if isinstance(value, str):
-        stripped = value.strip()
-        if not stripped:
-            return True
-        if stripped.upper() == "PLACEHOLDER":
-            return True
-        if stripped.startswith("REPLACE_ME_"):
-            return True
-    return False
+    if not isinstance(value, str):
+        return False
+    stripped = value.strip()
+    return not stripped or stripped.startswith("REPLACE_ME_") or stripped.upper() == "PLACEHOLDER"
 
 
 def _get_extra_env(env: Dict[str, Any], key: str) -> Optional[Any]:
@@ -2095,29 +3076,26 @@ def _get_extra_env(env: Dict[str, Any], key: str) -> Optional[Any]:
 
 
 def _set_extra_env(env: Dict[str, Any], key: str, value: Any) -> None:
+    # env belongs to the finalized clone, so extra_env can be updated in place.
     extra = env.get("extra_env")
     if isinstance(extra, dict):
-        updated = dict(extra)
-        updated[key] = value
-        env["extra_env"] = updated
+        extra[key] = value
         return
     if isinstance(extra, list):
-        new_entries = []
         updated = False
+        stray = False
         for entry in extra:
-            if isinstance(entry, dict):
-                entry_key = entry.get("key") or entry.get("name")
-                if entry_key == key:
-                    new_entry = dict(entry)
-                    new_entry["key"] = key
-                    new_entry["value"] = value
-                    updated = True
-                    new_entries.append(new_entry)
-                else:
-                    new_entries.append(entry)
+            if not isinstance(entry, dict):
+                stray = True
+                continue
+            if (entry.get("key") or entry.get("name")) == key:
+                entry["key"] = key
+                entry["value"] = value
+                updated = True
+        if stray:
+            extra[:] = [entry for entry in extra if isinstance(entry, dict)]
         if not updated:
-            new_entries.append({"key": key, "value": value})
-        env["extra_env"] = new_entries
+            extra.append({"key": key, "value": value})
         return
     env["extra_env"] = [{"key": key, "value": value}]
 
@@ -2152,59 +3130,65 @@ def _apply_postgres_env(env: Dict[str, Any], connection_name: str, db_name: str,
     _maybe_set_env_or_extra(env, "POSTGRES_PORT", default_port)
 
 
+_CRITICAL_ENV_PREFIXES: Tuple[str, ...] = ("DB_", "POSTGRES_")
+_CRITICAL_ENV_KEYS = frozenset({"DATABASE_URL", "DEFAULT_MAX_TOKENS", "REPO_URL", "GITHUB_TOKEN"})
+_BAD_GIT_MARKERS: Tuple[str, ...] = ("REPLACE_ME_GITHUB_TOKEN", "REPLACE_ME_REPO_URL")
+
+
+def _is_critical_env_key(key: str) -> bool:
+    upper_key = key.upper()
+    return upper_key in _CRITICAL_ENV_KEYS or upper_key.startswith(_CRITICAL_ENV_PREFIXES)
+
+
+def _contains_bad_git(value: Any) -> bool:
+    return isinstance(value, str) and "REPLACE_ME_" in value and any(m in value for m in _BAD_GIT_MARKERS)
+
+
 def _collect_placeholder_paths(node: Any, path: list, out: list) -> None:
     """
     Walks the structure and collects critical placeholders.
+    path is a shared stack of the keys leading to node; it is joined only when a placeholder is reported.
     """
-    critical_prefixes = ("DB_", "POSTGRES_")
-    critical_keys = {"DATABASE_URL", "DEFAULT_MAX_TOKENS", "REPO_URL", "GITHUB_TOKEN"}
-
     if isinstance(node, dict):
         # Handle extra_env entries specially when keyed by "key"/"value"
         if "key" in node and "value" in node and len(node) <= 3:
             env_key = node.get("key") or node.get("name")
             env_val = node.get("value")
-            key_path = ".".join(path + [env_key or "value"])
-            if env_key:
-                upper_key = env_key.upper()
-                is_critical = (
-                    upper_key in critical_keys
-                    or upper_key.startswith(critical_prefixes)
-                    or upper_key == "DEFAULT_MAX_TOKENS"
-                )
-            else:
-                is_critical = False
-            if isinstance(env_val, str):
-                contains_bad_git = "REPLACE_ME_GITHUB_TOKEN" in env_val or "REPLACE_ME_REPO_URL" in env_val
-            else:
-                contains_bad_git = False
-            if is_critical and _placeholder_value(env_val):
-                out.append(f"{key_path}={env_val}")
-            elif contains_bad_git:
-                out.append(f"{key_path}={env_val}")
+            is_critical = bool(env_key) and _is_critical_env_key(env_key)
+            if (is_critical and _placeholder_value(env_val)) or _contains_bad_git(env_val):
+                out.append(f"{'.'.join(path + [env_key or 'value'])}={env_val}")
             return
 
         for k, v in node.items():
-            _collect_placeholder_paths(v, path + [str(k)], out)
+            path.append(str(k))
+            _collect_placeholder_paths(v, path, out)
+            path.pop()
         return
 
     if isinstance(node, list):
         for idx, item in enumerate(node):
-            _collect_placeholder_paths(item, path + [f"[{idx}]"], out)
+            path.append(f"[{idx}]")
+            _collect_placeholder_paths(item, path, out)
+            path.pop()
         return
 
     if isinstance(node, str):
-        last_key = path[-1] if path else ""
-        upper_key = last_key.upper()
-        is_critical = (
-            upper_key in {"DATABASE_URL", "DEFAULT_MAX_TOKENS", "GITHUB_TOKEN", "REPO_URL"}
-            or upper_key.startswith(critical_prefixes)
-        )
-        contains_bad_git = "REPLACE_ME_GITHUB_TOKEN" in node or "REPLACE_ME_REPO_URL" in node
-        if (is_critical and _placeholder_value(node)) or contains_bad_git:
+        is_critical = _is_critical_env_key(path[-1] if path else "")
+        if (is_critical and _placeholder_value(node)) or _contains_bad_git(node):
             out.append(f"{'.'.join(path)}={node}")
 
 
+def _clone_json(node: Any) -> Any:
+    """
+    Deep-copy a JSON-shaped value, sharing the immutable leaves instead of re-encoding them.
+    """
+    if isinstance(node, dict):
+        return {key: _clone_json(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_clone_json(item) for item in node]
+    return node
+
+
 def finalize_tenant_userrequirements(
     tenant_ur: Dict[str, Any],
     tenant_meta: Dict[str, Any],
@@ -2215,8 +3199,8 @@ def finalize_tenant_userrequirements(
     Also validates that no critical placeholders remain.
     """
     try:
-        finalized = json.loads(json.dumps(tenant_ur))
-    except Exception as exc:
+        finalized = _clone_json(tenant_ur)
+    except RecursionError as exc:
         raise HTTPException(status_code=400, detail=f"Invalid userrequirements payload: {exc}")
 
     canonical_by_name = _canonical_agent_env_by_name(canonical_ur)
@@ -2230,7 +3214,7 @@ def finalize_tenant_userrequirements(
             if not isinstance(env, dict):
                 continue
 
-            canonical_env = canonical_by_name.get(agent.get("name"))
+            canonical_env, canonical_resolved = canonical_by_name.get(agent.get("name")) or (None, {})
             connect_db = env.get("connectDatabase")
 
             if connect_db:
@@ -2259,14 +3243,10 @@ def finalize_tenant_userrequirements(
                 _maybe_set_env_or_extra(env, "DATABASE_URL", database_url)
                 _maybe_set_env_or_extra(env, "DB_HOST", db_socket)
                 _maybe_set_env_or_extra(env, "DB_CONNECTION", db_socket)
-                canonical_port = None
-                if canonical_env:
-                    canonical_port = _get_extra_env(canonical_env, "POSTGRES_PORT") or canonical_env.get("POSTGRES_PORT")
+                canonical_port = canonical_resolved.get("POSTGRES_PORT")
                 _apply_postgres_env(env, db_instance, db_name, db_username, db_password, canonical_port)
 
-            canonical_max_tokens = None
-            if canonical_env:
-                canonical_max_tokens = _get_extra_env(canonical_env, "DEFAULT_MAX_TOKENS") or canonical_env.get("DEFAULT_MAX_TOKENS")
+            canonical_max_tokens = canonical_resolved.get("DEFAULT_MAX_TOKENS")
             max_tokens_default = str(canonical_max_tokens) if canonical_max_tokens else "16384"
             current_max_tokens = _get_extra_env(env, "DEFAULT_MAX_TOKENS") or env.get("DEFAULT_MAX_TOKENS")
             if _placeholder_value(current_max_tokens):
@@ -2286,42 +3266,51 @@ def finalize_tenant_userrequirements(
     return finalized
 
 
+# The template module already keeps the sanitized template for the process lifetime; cache the encoded
+# bodies too. Failures are not cached, so a missing template file is retried on the next request.
+@lru_cache(maxsize=1)
+def _tenant_stack_template_bytes() -> bytes:
+    return orjson.dumps(get_tenant_stack_template())
+
+
+@lru_cache(maxsize=1)
+def _tenant_stack_templates_summary_bytes() -> bytes:
+    return orjson.dumps({"templates": list_tenant_stack_templates(summary_only=True)})
+
+
 @app.get("/api/tenant-stack/template")
-async def tenant_stack_template() -> JSONResponse:
+async def tenant_stack_template() -> Response:
     """
     Return the sanitized default tenant stack template (10-agent wiring).
     """
     try:
-        template = get_tenant_stack_template()
+        content = _tenant_stack_template_bytes()
     except Exception as exc:
         logger.exception("Failed to load tenant stack template: %s", exc)
         raise HTTPException(status_code=500, detail=f"Failed to load tenant stack template: {exc}")
-    return JSONResponse(template)
+    return Response(content=content, media_type="application/json")
 
 
 @app.get("/api/tenant-stack/templates")
-async def tenant_stack_templates() -> JSONResponse:
+async def tenant_stack_templates() -> Response:
     """
     List available tenant stack templates (summary only).
     """
     try:
-        templates = list_tenant_stack_templates(summary_only=True)
+        content = _tenant_stack_templates_summary_bytes()
     except Exception as exc:
         logger.exception("Failed to list tenant stack templates: %s", exc)
         raise HTTPException(status_code=500, detail=f"Failed to list tenant stack templates: {exc}")
-    return JSONResponse({"templates": templates})
+    return Response(content=content, media_type="application/json")
 
 
 @app.post("/api/tenant-stack/finalize")
-async def tenant_stack_finalize(request: Request) -> JSONResponse:
+async def tenant_stack_finalize(request: Request) -> ORJSONResponse:
     """
     Finalize a tenant-scoped userrequirements by applying DB/LLM defaults from the canonical provider config
     and validating critical placeholders.
     """
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    body = await _read_json(request)
 
     tenant_ur = body.get("userrequirements")
     tenant_meta = body.get("tenant_metadata") or {}
@@ -2331,11 +3320,11 @@ async def tenant_stack_finalize(request: Request) -> JSONResponse:
 
     canonical_ur = _load_canonical_userrequirements()
     finalized = finalize_tenant_userrequirements(tenant_ur, tenant_meta, canonical_ur)
-    return JSONResponse({"userrequirements": finalized})
+    return ORJSONResponse({"userrequirements": finalized})
 
 
 @app.get("/api/agent-catalog")
-async def agent_catalog(request: Request) -> JSONResponse:
+async def agent_catalog(request: Request) -> Response:
     """
     Fetch the official agent catalog (proxied to avoid CORS issues).
     """
@@ -2343,35 +3332,94 @@ async def agent_catalog(request: Request) -> JSONResponse:
         raise HTTPException(status_code=500, detail="Agent registry URL not configured.")
     url = f"{AGENT_REGISTRY_BASE_URL}/api/agents"
     headers = _with_forward_headers(request)
+    headers["Accept-Encoding"] = _upstream_accept_encoding(request)
+    client = _http_client()
     try:
-        async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-            resp = await client.get(url, headers=headers)
+        resp = await client.send(client.build_request("GET", url, headers=headers), stream=True)
+        if resp.is_error:
+            try:
+                await resp.aread()
+            finally:
+                await resp.aclose()
     except httpx.RequestError as exc:
         raise HTTPException(status_code=502, detail=str(exc))
     if resp.is_error:
-        detail = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else resp.text
+        detail = _upstream_error_detail(resp)
         raise HTTPException(status_code=resp.status_code, detail=detail)
-    return JSONResponse(resp.json())
+    if not resp.headers.get("content-type", "").startswith("application/json"):
+        await resp.aclose()
+        raise HTTPException(status_code=502, detail="Agent registry returned a non-JSON catalog.")
+    return _passthrough_response(resp, resp.aiter_raw())
+
+
+ONBOARDING_SCRIPT_PATHS = (
+    FRONTEND_DIST / "create_service_account.sh",
+    BASE_DIR / "frontend" / "public" / "create_service_account.sh",
+    BASE_DIR.parent / "thunderdeploy" / "scripts" / "bootstrap" / "create_service_account.sh",
+)
+# str(path) -> (st_mtime_ns, content ETag)
+_file_etags: Dict[str, Tuple[int, str]] = {}
+
+
+def _file_etag(path: Path) -> str:
+    """
+    Strong ETag from the file's content, recomputed only when its mtime changes.
+    """
+    key = str(path)
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _file_etags.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    etag = f'"{hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()}"'
+    _file_etags[key] = (mtime_ns, etag)
+    return etag
 
 
 @app.get("/create_service_account.sh")
-async def serve_onboarding_script() -> FileResponse:
+async def serve_onboarding_script(request: Request) -> Response:
     """
     Serve the customer onboarding/permissions script bundled with the UI.
     Looks for the built asset in the frontend dist; falls back to the source public folder.
     """
-    candidates = [
-        FRONTEND_DIST / "create_service_account.sh",
-        BASE_DIR / "frontend" / "public" / "create_service_account.sh",
-        BASE_DIR.parent / "thunderdeploy" / "scripts" / "bootstrap" / "create_service_account.sh",
-    ]
-    for path in candidates:
-        if path.exists():
-            return FileResponse(path, media_type="text/x-sh")
+    path = _first_existing(ONBOARDING_SCRIPT_PATHS)
+    if path is not None:
+        headers = {"ETag": _file_etag(path), "Cache-Control": "public, max-age=300"}
+        if _etag_matches(request, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        return FileResponse(path, media_type="text/x-sh", headers=headers)
     raise HTTPException(status_code=404, detail="create_service_account.sh not found")
 
 
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+# (client_email, private key digest, scopes) -> (access_token, expiry epoch seconds)
+_TOKEN_CACHE_MAX_ENTRIES = 256
+_token_cache: Dict[Tuple[str, str, Tuple[str, ...]], Tuple[str, float]] = {}
+# Least recently used first; a key's cached token is evicted together with its lock.
+_token_locks: OrderedDict[Tuple[str, str, Tuple[str, ...]], asyncio.Lock] = OrderedDict()
+
+
+def _token_lock(cache_key: Tuple[str, str, Tuple[str, ...]]) -> asyncio.Lock:
+    """
+    Per-key lock for token minting. Keys come from caller-supplied service accounts, so the table is
+    bounded; locks that are currently held are never evicted.
+    """
+    lock = _token_locks.get(cache_key)
+    if lock is not None:
+        _token_locks.move_to_end(cache_key)
+        return lock
+    if len(_token_locks) >= _TOKEN_CACHE_MAX_ENTRIES:
+        idle = [key for key, held in _token_locks.items() if not held.locked()]
+        for stale_key in idle[: len(_token_locks) - _TOKEN_CACHE_MAX_ENTRIES + 1]:
+            del _token_locks[stale_key]
+            _token_cache.pop(stale_key, None)
+    lock = _token_locks[cache_key] = asyncio.Lock()
+    return lock
+
+
 def _build_jwt_assertion(service_account_info: Dict[str, Any], scopes: list[str]) -> str:
+    import jwt
+    from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
     audience = "https://oauth2.googleapis.com/token"
     now = int(time.time())
     payload = {
@@ -2382,14 +3430,25 @@ def _build_jwt_assertion(service_account_info: Dict[str, Any], scopes: list[str]
         "exp": now + 3600,
     }
     headers = {"alg": "RS256", "typ": "JWT", "kid": service_account_info.get("private_key_id")}
-    private_key = service_account_info["private_key"]
+    private_key = load_pem_private_key(service_account_info["private_key"].encode("utf-8"), password=None)
     return jwt.encode(payload, private_key, algorithm="RS256", headers=headers)
 
 
 async def _get_access_token(service_account_info: Dict[str, Any], scopes: list[str]) -> str:
-    assertion = _build_jwt_assertion(service_account_info, scopes)
-    async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-        resp = await client.post(
+    """
+    Exchange a service account for an OAuth access token, reusing it until shortly before expiry.
+    The cache key includes a digest of the private key so a request carrying only a client_email
+    can never pick up a token minted for someone else's key.
+    """
+    cache_key = _service_account_cache_key(service_account_info, scopes)
+    async with _token_lock(cache_key):
+        cached = _token_cache.get(cache_key)
+        if cached and cached[1] > time.time() + TOKEN_REFRESH_MARGIN_SECONDS:
+            return cached[0]
+
+        # RS256 signing is a few ms of CPU; keep it off the event loop.
+        assertion = await asyncio.to_thread(_build_jwt_assertion, service_account_info, scopes)
+        resp = await _http_client().post(
             "https://oauth2.googleapis.com/token",
             data={
                 "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer",
@@ -2397,22 +3456,30 @@ async def _get_access_token(service_account_info: Dict[str, Any], scopes: list[s
             },
             headers={"Content-Type": "application/x-www-form-urlencoded"},
         )
-    if resp.is_error:
-        detail = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else resp.text
-        raise HTTPException(status_code=resp.status_code, detail=detail)
-    data = resp.json()
-    return data.get("access_token")
+        if resp.is_error:
+            detail = _upstream_error_detail(resp)
+            raise HTTPException(status_code=resp.status_code, detail=detail)
+        data = _fast_json(resp) or {}
+        token = data.get("access_token")
+        if token:
+            _token_cache[cache_key] = (token, time.time() + float(data.get("expires_in") or 3600))
+        return token
+
+
+_LOGS_FILTER_TMPL = (
+    'resource.type="cloud_run_revision" '
+    'resource.labels.service_name="{service}" '
+    'resource.labels.location="{region}"'
+)
+_RE_SAFE_LOG_LABEL = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
 
 
 @app.post("/api/logs/fetch")
-async def logs_fetch(request: Request) -> JSONResponse:
+async def logs_fetch(request: Request) -> Response:
     """
     Fetch Cloud Run logs for a service using the provided service account JSON.
     """
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    body = await _read_json(request)
 
     service_account = body.get("service_account")
     project_id = body.get("project_id")
@@ -2422,29 +3489,41 @@ async def logs_fetch(request: Request) -> JSONResponse:
 
     if not isinstance(service_account, dict) or not project_id or not service_name:
         raise HTTPException(status_code=400, detail="service_account, project_id, and service_name are required.")
+    for label, value in (("service_name", service_name), ("region", region)):
+        if not isinstance(value, str) or not _RE_SAFE_LOG_LABEL.fullmatch(value):
+            raise HTTPException(status_code=400, detail=f"Invalid {label}.")
 
     token = await _get_access_token(service_account, ["https://www.googleapis.com/auth/cloud-platform"])
-    filter_str = (
-        f'resource.type="cloud_run_revision" '
-        f'resource.labels.service_name="{service_name}" '
-        f'resource.labels.location="{region}"'
-    )
+    filter_str = _LOGS_FILTER_TMPL.format(service=service_name, region=region)
     payload = {
         "resourceNames": [f"projects/{project_id}"],
         "filter": filter_str,
         "pageSize": limit,
         "orderBy": "timestamp desc",
     }
-    async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-        resp = await client.post(
+    client = _http_client()
+    resp = await client.send(
+        client.build_request(
+            "POST",
             f"https://logging.googleapis.com/v2/projects/{project_id}/entries:list",
-            headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+                "Accept-Encoding": _upstream_accept_encoding(request),
+            },
             json=payload,
-        )
+        ),
+        stream=True,
+    )
     if resp.is_error:
-        detail = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else resp.text
+        try:
+            await resp.aread()
+        finally:
+            await resp.aclose()
+        detail = _upstream_error_detail(resp)
         raise HTTPException(status_code=resp.status_code, detail=detail)
-    return JSONResponse(resp.json())
+    # Log pages can run to megabytes; relay them chunk by chunk rather than buffering the whole body.
+    return _passthrough_response(resp)
 
 
 @app.get("/healthz")
@@ -2463,14 +3542,11 @@ async def healthz() -> Dict[str, Any]:
 
 
 @app.post("/api/login")
-async def login(request: Request) -> JSONResponse:
+async def login(request: Request) -> Response:
     """
     Thin wrapper around the core login endpoint.
     """
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    body = await _read_json(request)
 
     return await _proxy_request(
         request,
@@ -2482,7 +3558,7 @@ async def login(request: Request) -> JSONResponse:
 
 
 @app.get("/api/user_info")
-async def user_info(request: Request) -> JSONResponse:
+async def user_info(request: Request) -> Response:
     """
     Fetch user info from the core service.
     """
@@ -2494,28 +3570,12 @@ async def user_info(request: Request) -> JSONResponse:
     )
 
 
-@app.get("/api/mcp/registry")
-async def mcp_registry_list(request: Request) -> JSONResponse:
-    """
-    Admin-only: list MCP registry entries from the MCP Registry service.
-    """
-    return await _proxy_request(
-        request,
-        method="GET",
-        base_url=MCP_REGISTRY_BASE_URL,
-        endpoint="/registry",
-    )
-
-
 @app.post("/api/web-research/invoke")
-async def web_research_invoke(request: Request) -> JSONResponse:
+async def web_research_invoke(request: Request) -> Response:
     """
     Invoke the web research agent.
     """
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    body = await _read_json(request)
 
     return await _proxy_request(
         request,
@@ -2527,7 +3587,7 @@ async def web_research_invoke(request: Request) -> JSONResponse:
 
 
 @app.get("/api/cheat-sheet")
-async def cheat_sheet_list(request: Request) -> JSONResponse:
+async def cheat_sheet_list(request: Request) -> Response:
     """
     List cheat-sheet entries via the MCP client agent.
     """
@@ -2540,14 +3600,11 @@ async def cheat_sheet_list(request: Request) -> JSONResponse:
 
 
 @app.post("/api/cheat-sheet")
-async def cheat_sheet_add(request: Request) -> JSONResponse:
+async def cheat_sheet_add(request: Request) -> Response:
     """
     Add a cheat-sheet entry via the MCP client agent.
     """
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    body = await _read_json(request)
 
     return await _proxy_request(
         request,
@@ -2559,14 +3616,11 @@ async def cheat_sheet_add(request: Request) -> JSONResponse:
 
 
 @app.put("/api/cheat-sheet/{entry_id}")
-async def cheat_sheet_update(entry_id: str, request: Request) -> JSONResponse:
+async def cheat_sheet_update(entry_id: str, request: Request) -> Response:
     """
     Update a cheat-sheet entry.
     """
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    body = await _read_json(request)
 
     return await _proxy_request(
         request,
@@ -2578,7 +3632,7 @@ async def cheat_sheet_update(entry_id: str, request: Request) -> JSONResponse:
 
 
 @app.delete("/api/cheat-sheet/{entry_id}")
-async def cheat_sheet_delete(entry_id: str, request: Request) -> JSONResponse:
+async def cheat_sheet_delete(entry_id: str, request: Request) -> Response:
     """
     Delete a cheat-sheet entry.
     """
@@ -2594,14 +3648,11 @@ async def cheat_sheet_delete(entry_id: str, request: Request) -> JSONResponse:
 
 
 @app.post("/api/trigger/prime")
-async def trigger_prime_customer(request: Request) -> JSONResponse:
+async def trigger_prime_customer(request: Request) -> Response:
     """
     Proxy to TriggerService /prime-customer.
     """
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    body = await _read_json(request)
 
     return await _proxy_trigger_request(
         request,
@@ -2612,7 +3663,7 @@ async def trigger_prime_customer(request: Request) -> JSONResponse:
 
 
 @app.get("/api/trigger/prime-status")
-async def trigger_prime_status(request: Request) -> JSONResponse:
+async def trigger_prime_status(request: Request) -> Response:
     """
     Proxy to TriggerService /prime-status with passthrough query params.
     """
@@ -2620,12 +3671,12 @@ async def trigger_prime_status(request: Request) -> JSONResponse:
         request,
         method="GET",
         endpoint="/prime-status",
-        params=dict(request.query_params),
+        params=request.query_params,
     )
 
 
 @app.get("/api/trigger/jobs")
-async def trigger_jobs(request: Request) -> JSONResponse:
+async def trigger_jobs(request: Request) -> Response:
     """
     Proxy to TriggerService /jobs (job history/status).
     """
@@ -2633,12 +3684,12 @@ async def trigger_jobs(request: Request) -> JSONResponse:
         request,
         method="GET",
         endpoint="/jobs",
-        params=dict(request.query_params),
+        params=request.query_params,
     )
 
 
 @app.get("/api/trigger/jobs/{job_identifier}")
-async def trigger_job_detail(job_identifier: str, request: Request) -> JSONResponse:
+async def trigger_job_detail(job_identifier: str, request: Request) -> Response:
     """
     Proxy to TriggerService /jobs/<job_identifier> for job detail.
     """
@@ -2646,12 +3697,12 @@ async def trigger_job_detail(job_identifier: str, request: Request) -> JSONRespo
         request,
         method="GET",
         endpoint=f"/jobs/{job_identifier}",
-        params=dict(request.query_params),
+        params=request.query_params,
     )
 
 
 @app.get("/api/trigger/tenants")
-async def trigger_tenants(request: Request) -> JSONResponse:
+async def trigger_tenants(request: Request) -> Response:
     """
     Proxy to TriggerService /tenants (multi-tenant awareness).
     """
@@ -2663,7 +3714,7 @@ async def trigger_tenants(request: Request) -> JSONResponse:
 
 
 @app.get("/api/trigger/services/{tenant_id}")
-async def trigger_services(tenant_id: str, request: Request) -> JSONResponse:
+async def trigger_services(tenant_id: str, request: Request) -> Response:
     """
     Proxy to TriggerService /<tenant_id>/services for health/metadata.
     """
@@ -2671,12 +3722,12 @@ async def trigger_services(tenant_id: str, request: Request) -> JSONResponse:
         request,
         method="GET",
         endpoint=f"/{tenant_id}/services",
-        params=dict(request.query_params),
+        params=request.query_params,
     )
 
 
 @app.get("/api/trigger/services/{tenant_id}/{service_name}/revisions")
-async def trigger_service_revisions(tenant_id: str, service_name: str, request: Request) -> JSONResponse:
+async def trigger_service_revisions(tenant_id: str, service_name: str, request: Request) -> Response:
     """
     Proxy to TriggerService /<tenant_id>/services/<service_name>/revisions
     """
@@ -2684,7 +3735,7 @@ async def trigger_service_revisions(tenant_id: str, service_name: str, request:
         request,
         method="GET",
         endpoint=f"/{tenant_id}/services/{service_name}/revisions",
-        params=dict(request.query_params),
+        params=request.query_params,
     )
 
 
@@ -2693,14 +3744,11 @@ async def trigger_service_revision_activate(
     tenant_id: str,
     service_name: str,
     request: Request,
-) -> JSONResponse:
+) -> Response:
     """
     Proxy to TriggerService revision activation.
     """
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    body = await _read_json(request)
 
     return await _proxy_trigger_request(
         request,
@@ -2711,7 +3759,7 @@ async def trigger_service_revision_activate(
 
 
 @app.post("/api/trigger/deploy")
-async def trigger_deploy(request: Request) -> JSONResponse:
+async def trigger_deploy(request: Request) -> Response:
     """
     Proxy to TriggerService /trigger. Accepts a JSON body:
     {
@@ -2722,10 +3770,10 @@ async def trigger_deploy(request: Request) -> JSONResponse:
     Converts to multipart for TriggerService.
     """
     try:
-        body = await request.json()
-    except Exception:
+        body = await _read_json(request)
+    except HTTPException:
         logger.error("Invalid JSON payload in trigger_deploy")
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+        raise
 
     required = ("userrequirements", "serviceaccount", "customer_serviceaccount")
     missing = [key for key in required if key not in body]
@@ -2733,15 +3781,8 @@ async def trigger_deploy(request: Request) -> JSONResponse:
         logger.error(f"Missing fields in trigger_deploy: {missing}. Keys found: {list(body.keys())}")
         raise HTTPException(status_code=400, detail=f"Missing fields: {', '.join(missing)}")
 
-    files = {
-        "userrequirements.json": ("userrequirements.json", json.dumps(body["userrequirements"]), "application/json"),
-        "serviceaccount.json": ("serviceaccount.json", json.dumps(body["serviceaccount"]), "application/json"),
-        "customer_serviceaccount.json": (
-            "customer_serviceaccount.json",
-            json.dumps(body["customer_serviceaccount"]),
-            "application/json",
-        ),
-    }
+    # orjson emits bytes, which httpx streams as file content without another encode pass.
+    files = {f"{key}.json": (f"{key}.json", orjson.dumps(body[key]), "application/json") for key in required}
 
     return await _proxy_trigger_request(
         request,
@@ -2758,7 +3799,7 @@ async def trigger_job_status(
     job_name: str,
     execution_name: str,
     request: Request,
-) -> JSONResponse:
+) -> Response:
     """
     Proxy to TriggerService /job_status/<job_project_id>/<job_region>/<job_name>/<execution_name>.
     """
@@ -2766,33 +3807,32 @@ async def trigger_job_status(
         request,
         method="GET",
         endpoint=f"/job_status/{job_project_id}/{job_region}/{job_name}/{execution_name}",
-        params=dict(request.query_params),
+        params=request.query_params,
     )
 
 
 @app.get("/api/provider/health")
-async def provider_health(request: Request) -> JSONResponse:
+async def provider_health(request: Request) -> ORJSONResponse:
     """
     Lightweight provider health check used by the tenant provisioning UI.
     Reports TriggerService reachability and selected credential presence/status.
     """
-    triggerservice = {
-        "configured": bool(TRIGGERSERVICE_BASE_URL),
-        "reachable": False,
-        "detail": "",
-    }
-
-    if not TRIGGERSERVICE_BASE_URL:
-        triggerservice["detail"] = "TriggerService base URL not configured."
-    else:
-        url = f"{TRIGGERSERVICE_BASE_URL.rstrip('/')}/tenants"
+    async def _probe_triggerservice() -> Dict[str, Any]:
+        triggerservice = {
+            "configured": bool(TRIGGERSERVICE_BASE_URL),
+            "reachable": False,
+            "detail": "",
+        }
+        if not TRIGGERSERVICE_BASE_URL:
+            triggerservice["detail"] = "TriggerService base URL not configured."
+            return triggerservice
+        url = f"{TRIGGERSERVICE_BASE_URL}/tenants"
         headers = _with_forward_headers(request)
         try:
-            async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-                resp = await client.get(url, headers=headers)
+            resp = await _http_client().get(url, headers=headers)
             if resp.is_error:
                 try:
-                    payload = resp.json()
+                    payload = orjson.loads(resp.content)
                     detail = payload.get("detail") if isinstance(payload, dict) else payload
                 except Exception:
                     detail = resp.text
@@ -2804,6 +3844,7 @@ async def provider_health(request: Request) -> JSONResponse:
         except Exception as exc:
             logger.warning("Provider health TriggerService probe failed: %s", exc)
             triggerservice["detail"] = str(exc)
+        return triggerservice
 
     def _credential_health(type_name: str) -> Dict[str, Any]:
         try:
@@ -2821,8 +3862,12 @@ async def provider_health(request: Request) -> JSONResponse:
             "projectId": entry.get("projectId") if entry else None,
         }
 
-    source_credential = _credential_health("source")
-    target_credential = _credential_health("target")
+    # The store loads run in threads while the TriggerService probe is in flight.
+    triggerservice, source_credential, target_credential = await asyncio.gather(
+        _probe_triggerservice(),
+        asyncio.to_thread(_credential_health, "source"),
+        asyncio.to_thread(_credential_health, "target"),
+    )
 
     selected_source = bool(source_credential.get("selectedId"))
     source_status = (source_credential.get("status") or "").lower()
@@ -2844,302 +3889,335 @@ async def provider_health(request: Request) -> JSONResponse:
         "target_credential": target_credential,
         "overall_status": overall_status,
     }
-    return JSONResponse(payload)
+    return ORJSONResponse(payload)
 
 
 @app.get("/api/health/summary")
-async def health_summary(request: Request) -> JSONResponse:
+async def health_summary(request: Request) -> ORJSONResponse:
     """
     Lightweight aggregator for the health dashboard.
     Uses TriggerService services listing when available.
     """
     if not TRIGGERSERVICE_BASE_URL:
-        return JSONResponse({"detail": "TriggerService is not configured."}, status_code=500)
+        return ORJSONResponse({"detail": "TriggerService is not configured."}, status_code=500)
     tenant_id = request.query_params.get("tenant_id")
     if not tenant_id:
-        return JSONResponse({"detail": "tenant_id is required"}, status_code=400)
+        return ORJSONResponse({"detail": "tenant_id is required"}, status_code=400)
 
     try:
-        async with httpx.AsyncClient(timeout=HTTPX_TIMEOUT) as client:
-            resp = await client.get(f"{TRIGGERSERVICE_BASE_URL.rstrip('/')}/{tenant_id}/services")
-        data = resp.json()
+        resp = await _http_client().get(f"{TRIGGERSERVICE_BASE_URL}/{tenant_id}/services")
+        data = orjson.loads(resp.content)
     except Exception as exc:
         logger.warning("Failed to fetch service health: %s", exc)
         data = {"services": []}
 
-    return JSONResponse({"tenant_id": tenant_id, "services": data.get("services", [])})
-
-
-# --- MCP Registry proxies ---
-
-
-@app.get("/api/mcp/config")
-async def mcp_config(request: Request) -> JSONResponse:
-    return await _proxy_request(
-        request,
-        method="GET",
-        base_url=MCP_REGISTRY_BASE_URL,
-        endpoint="/config",
-    )
-
-
-@app.post("/api/mcp/auth/verify")
-async def mcp_auth_verify(request: Request) -> JSONResponse:
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
-
-    return await _proxy_request(
-        request,
-        method="POST",
-        base_url=MCP_REGISTRY_BASE_URL,
-        endpoint="/auth/verify",
-        json_body=body,
-    )
-
-
-@app.get("/api/mcp/registry")
-async def mcp_registry_list(request: Request) -> JSONResponse:
-    return await _proxy_request(
-        request,
-        method="GET",
-        base_url=MCP_REGISTRY_BASE_URL,
-        endpoint="/registry",
-    )
-
-
-@app.post("/api/mcp/registry")
-async def mcp_registry_create(request: Request) -> JSONResponse:
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
-
-    return await _proxy_request(
-        request,
-        method="POST",
-        base_url=MCP_REGISTRY_BASE_URL,
-        endpoint="/registry",
-        json_body=body,
-    )
-
-
-@app.put("/api/mcp/registry/{mcp_id}")
-async def mcp_registry_update(mcp_id: int, request: Request) -> JSONResponse:
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
-
-    return await _proxy_request(
-        request,
-        method="PUT",
-        base_url=MCP_REGISTRY_BASE_URL,
-        endpoint=f"/registry/{mcp_id}",
-        json_body=body,
-    )
-
-
-@app.delete("/api/mcp/registry/{mcp_id}")
-async def mcp_registry_delete(mcp_id: int, request: Request) -> JSONResponse:
-    return await _proxy_request(
-        request,
-        method="DELETE",
-        base_url=MCP_REGISTRY_BASE_URL,
-        endpoint=f"/registry/{mcp_id}",
-    )
-
-
-@app.get("/api/mcp/database-mcp-urls")
-async def mcp_database_urls(request: Request) -> JSONResponse:
-    return await _proxy_request(
-        request,
-        method="GET",
-        base_url=MCP_REGISTRY_BASE_URL,
-        endpoint="/database-mcp-urls",
-    )
-
-
-@app.post("/api/mcp/database-mcp-urls")
-async def mcp_database_urls_create(request: Request) -> JSONResponse:
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
-
-    return await _proxy_request(
-        request,
-        method="POST",
-        base_url=MCP_REGISTRY_BASE_URL,
-        endpoint="/database-mcp-urls",
-        json_body=body,
-    )
-
+    return ORJSONResponse({"tenant_id": tenant_id, "services": data.get("services", [])})
+
+
+# --- MCP Registry / Agent One Configurator proxies ---
+_PROXY_BACKENDS: Dict[str, Callable[[], Optional[str]]] = {
+    "mcp": lambda: MCP_REGISTRY_BASE_URL,
+    "agentone": lambda: AGENTONE_CONFIGURATOR_URL,
+}
+
+# (route name, method, UI path, backend, upstream endpoint, body) where body is None for no body,
+# True when a JSON body is required and False when it is optional.
+_PASSTHROUGH_ROUTES: Tuple[Tuple[str, str, str, str, str, Optional[bool]], ...] = (
+    ("mcp_config", "GET", "/api/mcp/config", "mcp", "/config", None),
+    ("mcp_auth_verify", "POST", "/api/mcp/auth/verify", "mcp", "/auth/verify", True),
+    ("mcp_registry_list", "GET", "/api/mcp/registry", "mcp", "/registry", None),
+    ("mcp_registry_create", "POST", "/api/mcp/registry", "mcp", "/registry", True),
+    ("mcp_registry_update", "PUT", "/api/mcp/registry/{mcp_id:int}", "mcp", "/registry/{mcp_id}", True),
+    ("mcp_registry_delete", "DELETE", "/api/mcp/registry/{mcp_id:int}", "mcp", "/registry/{mcp_id}", None),
+    ("mcp_database_urls", "GET", "/api/mcp/database-mcp-urls", "mcp", "/database-mcp-urls", None),
+    ("mcp_database_urls_create", "POST", "/api/mcp/database-mcp-urls", "mcp", "/database-mcp-urls", True),
+    (
+        "mcp_database_urls_update",
+        "PUT",
+        "/api/mcp/database-mcp-urls/{user_id:int}/{mcp_id:int}",
+        "mcp",
+        "/database-mcp-urls/{user_id}/{mcp_id}",
+        True,
+    ),
+    (
+        "mcp_database_urls_delete",
+        "DELETE",
+        "/api/mcp/database-mcp-urls/{user_id:int}/{mcp_id:int}",
+        "mcp",
+        "/database-mcp-urls/{user_id}/{mcp_id}",
+        None,
+    ),
+    ("mcp_users", "GET", "/api/mcp/users", "mcp", "/users", None),
+    ("agentone_configs", "GET", "/api/agentone/configs", "agentone", "/configs", None),
+    ("agentone_config_get", "GET", "/api/agentone/config/{api_key}", "agentone", "/config/{api_key}", None),
+    ("agentone_config_create", "POST", "/api/agentone/config", "agentone", "/config", True),
+    ("agentone_config_update", "PUT", "/api/agentone/config/{api_key}", "agentone", "/config/{api_key}", True),
+    ("agentone_config_delete", "DELETE", "/api/agentone/config/{api_key}", "agentone", "/config/{api_key}", None),
+    (
+        "agentone_config_provision",
+        "POST",
+        "/api/agentone/config/{api_key}/provision-cloud-mcp",
+        "agentone",
+        "/config/{api_key}/provision-cloud-mcp",
+        False,
+    ),
+)
 
-@app.put("/api/mcp/database-mcp-urls/{user_id}/{mcp_id}")
-async def mcp_database_urls_update(user_id: int, mcp_id: int, request: Request) -> JSONResponse:
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
 
-    return await _proxy_request(
-        request,
-        method="PUT",
-        base_url=MCP_REGISTRY_BASE_URL,
-        endpoint=f"/database-mcp-urls/{user_id}/{mcp_id}",
-        json_body=body,
-    )
+def _passthrough_handler(
+    method: str, backend: str, endpoint: str, body: Optional[bool]
+) -> Callable[[Request], Any]:
+    base_url = _PROXY_BACKENDS[backend]
+    templated = "{" in endpoint
 
+    async def handler(request: Request) -> Response:
+        if method == "GET":
+            return await _coalesced_get(
+                request,
+                base_url=base_url(),
+                endpoint=endpoint.format(**request.path_params) if templated else endpoint,
+            )
+        raw = None if body is None else await _read_raw_json(request, required=body)
+        return await _proxy_request(
+            request,
+            method=method,
+            base_url=base_url(),
+            endpoint=endpoint.format(**request.path_params) if templated else endpoint,
+            raw_body=raw,
+        )
 
-@app.delete("/api/mcp/database-mcp-urls/{user_id}/{mcp_id}")
-async def mcp_database_urls_delete(user_id: int, mcp_id: int, request: Request) -> JSONResponse:
-    return await _proxy_request(
-        request,
-        method="DELETE",
-        base_url=MCP_REGISTRY_BASE_URL,
-        endpoint=f"/database-mcp-urls/{user_id}/{mcp_id}",
-    )
+    return handler
 
 
-@app.get("/api/mcp/users")
-async def mcp_users(request: Request) -> JSONResponse:
-    return await _proxy_request(
-        request,
-        method="GET",
-        base_url=MCP_REGISTRY_BASE_URL,
-        endpoint="/users",
+for _name, _method, _path, _backend, _endpoint, _body in _PASSTHROUGH_ROUTES:
+    app.add_api_route(
+        _path,
+        _passthrough_handler(_method, _backend, _endpoint, _body),
+        methods=[_method],
+        name=_name,
     )
 
 
-# --- Agent One Configurator proxies ---
+_GITHUB_CONTENT_CACHE_MAX_BYTES = 8 * 1024 * 1024
+# Large files (including every raw download) are refetched instead of crowding out the small configs.
+GITHUB_CACHE_MAX_FILE_BYTES = 1024 * 1024
+GITHUB_INLINE_DECODE_BYTES = 64 * 1024
+# (repo, path, ref) -> (etag, content, size in bytes), least recently used first.
+_github_content_cache: OrderedDict[Tuple[str, str, str], Tuple[str, str, int]] = OrderedDict()
+_github_content_cache_bytes = 0
+_GITHUB_HEADERS = {
+    "Authorization": f"token {DEFAULT_GITHUB_TOKEN}",
+    "Accept": "application/vnd.github.v3+json",
+}
 
 
-@app.get("/api/agentone/configs")
-async def agentone_configs(request: Request) -> JSONResponse:
-    return await _proxy_request(
-        request,
-        method="GET",
-        base_url=AGENTONE_CONFIGURATOR_URL,
-        endpoint="/configs",
-    )
+_GITHUB_RAW_HEADERS = {**_GITHUB_HEADERS, "Accept": "application/vnd.github.raw"}
 
 
-@app.get("/api/agentone/config/{api_key}")
-async def agentone_config_get(api_key: str, request: Request) -> JSONResponse:
-    return await _proxy_request(
-        request,
-        method="GET",
-        base_url=AGENTONE_CONFIGURATOR_URL,
-        endpoint=f"/config/{api_key}",
-    )
+def _decode_github_content(raw_b64: bytes) -> Tuple[str, int]:
+    raw = base64.b64decode(raw_b64)
+    return raw.decode("utf-8"), len(raw)
 
 
-@app.post("/api/agentone/config")
-async def agentone_config_create(request: Request) -> JSONResponse:
+async def _github_get(url: str, headers: Dict[str, str], ref: str, timeout: float) -> httpx.Response:
     try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
-
-    return await _proxy_request(
-        request,
-        method="POST",
-        base_url=AGENTONE_CONFIGURATOR_URL,
-        endpoint="/config",
-        json_body=body,
-    )
+        return await _http_client().get(url, headers=headers, params={"ref": ref}, timeout=timeout)
+    except httpx.RequestError as exc:
+        logger.error("GitHub request for %s failed: %s", url, exc)
+        raise HTTPException(status_code=502, detail="Failed to contact GitHub.")
 
 
-@app.put("/api/agentone/config/{api_key}")
-async def agentone_config_update(api_key: str, request: Request) -> JSONResponse:
-    try:
-        body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+async def _fetch_github_raw(url: str, ref: str) -> Tuple[str, int]:
+    """
+    Download a file too large for the contents API to inline (GitHub sends encoding "none" past 1 MiB).
+    """
+    resp = await _github_get(url, _GITHUB_RAW_HEADERS, ref, timeout=30.0)
+    if resp.is_error:
+        raise HTTPException(status_code=resp.status_code, detail=resp.text)
+    return await asyncio.to_thread(resp.content.decode, "utf-8"), len(resp.content)
 
-    return await _proxy_request(
-        request,
-        method="PUT",
-        base_url=AGENTONE_CONFIGURATOR_URL,
-        endpoint=f"/config/{api_key}",
-        json_body=body,
-    )
 
+def _forget_github_content(cache_key: Tuple[str, str, str]) -> None:
+    global _github_content_cache_bytes
+    entry = _github_content_cache.pop(cache_key, None)
+    if entry is not None:
+        _github_content_cache_bytes -= entry[2]
 
-@app.delete("/api/agentone/config/{api_key}")
-async def agentone_config_delete(api_key: str, request: Request) -> JSONResponse:
-    return await _proxy_request(
-        request,
-        method="DELETE",
-        base_url=AGENTONE_CONFIGURATOR_URL,
-        endpoint=f"/config/{api_key}",
-    )
 
+def _remember_github_content(cache_key: Tuple[str, str, str], etag: str, content: str, size: int) -> None:
+    """
+    Cache decoded content against its ETag, evicting least recently used files to stay under the byte budget.
+    """
+    global _github_content_cache_bytes
+    _forget_github_content(cache_key)
+    if size > GITHUB_CACHE_MAX_FILE_BYTES:
+        return
+    while _github_content_cache and _github_content_cache_bytes + size > _GITHUB_CONTENT_CACHE_MAX_BYTES:
+        _forget_github_content(next(iter(_github_content_cache)))
+    _github_content_cache[cache_key] = (etag, content, size)
+    _github_content_cache_bytes += size
 
-@app.post("/api/agentone/config/{api_key}/provision-cloud-mcp")
-async def agentone_config_provision(api_key: str, request: Request) -> JSONResponse:
-    body = None
-    try:
-        if request.headers.get("content-length"):
-            body = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
 
-    return await _proxy_request(
-        request,
-        method="POST",
-        base_url=AGENTONE_CONFIGURATOR_URL,
-        endpoint=f"/config/{api_key}/provision-cloud-mcp",
-        json_body=body,
-    )
+def _is_safe_github_path(value: str) -> bool:
+    """
+    Reject "."/".." and empty segments (plus "?"/"#") that could move the request off the intended file.
+    Any other character is left to GitHub: file names and refs allow far more than word characters.
+    """
+    if "?" in value or "#" in value:
+        return False
+    return all(segment not in ("", ".", "..") for segment in value.split("/"))
 
 
 @app.get("/api/github/content")
-async def github_content(repo: str, path: str, ref: str = "main") -> JSONResponse:
+async def github_content(
+    repo: str = Query(..., pattern=r"^[\w.-]+/[\w.-]+$"),
+    path: str = Query(...),
+    ref: str = Query("main"),
+) -> ORJSONResponse:
     """
     Proxy to fetch file content from GitHub.
     repo: "owner/repo"
     path: file path (e.g. ".env")
     ref: branch or commit sha
     """
+    for name, value in (("repo", repo), ("path", path), ("ref", ref)):
+        if not _is_safe_github_path(value):
+            raise HTTPException(status_code=422, detail=f"Invalid {name}: {value!r}")
     if not DEFAULT_GITHUB_TOKEN:
         raise HTTPException(status_code=500, detail="Server misconfigured: No GitHub token available.")
 
-    url = f"https://api.github.com/repos/{repo}/contents/{path}"
-    headers = {
-        "Authorization": f"token {DEFAULT_GITHUB_TOKEN}",
-        "Accept": "application/vnd.github.v3+json",
-    }
-    params = {"ref": ref}
+    quoted_path = "/".join(quote(segment, safe="") for segment in path.split("/"))
+    url = f"https://api.github.com/repos/{repo}/contents/{quoted_path}"
+    cache_key = (repo, path, ref)
+    cached = _github_content_cache.get(cache_key)
+    headers = _GITHUB_HEADERS
+    if cached is not None:
+        # Conditional requests answered with 304 don't count against the GitHub rate limit.
+        headers = {**_GITHUB_HEADERS, "If-None-Match": cached[0]}
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        resp = await client.get(url, headers=headers, params=params)
+    resp = await _github_get(url, headers, ref, timeout=10.0)
+
+    if resp.status_code == 304 and cached is not None:
+        _github_content_cache.move_to_end(cache_key)
+        return ORJSONResponse({"content": cached[1]})
 
     if resp.status_code == 404:
-        return JSONResponse({"content": None})
+        _forget_github_content(cache_key)
+        return ORJSONResponse({"content": None})
     
     if resp.is_error:
         raise HTTPException(status_code=resp.status_code, detail=resp.text)
 
-    data = resp.json()
+    data = _fast_json(resp)
+    if data is None:
+        raise HTTPException(status_code=502, detail="Invalid response from GitHub.")
+    if not isinstance(data, dict):
+        # Directory paths come back as a listing; there is no file content to return.
+        return ORJSONResponse({"content": ""})
     # GitHub API returns 'content' as base64 encoded string
     content_b64 = data.get("content", "")
     try:
-        decoded = base64.b64decode(content_b64).decode("utf-8")
-    except Exception:
-        decoded = ""
-    
-    return JSONResponse({"content": decoded})
+        if data.get("encoding") == "none":
+            decoded, size = await _fetch_github_raw(url, ref)
+        else:
+            # b64decode skips the line breaks GitHub wraps content with; hand it bytes to skip an encode.
+            raw_b64 = content_b64.encode("ascii", "ignore")
+            if len(raw_b64) > GITHUB_INLINE_DECODE_BYTES:
+                decoded, size = await asyncio.to_thread(_decode_github_content, raw_b64)
+            else:
+                decoded, size = _decode_github_content(raw_b64)
+    except ValueError as exc:
+        # Bad base64 or non-UTF-8 (binary) content. Never cache it: later 304s would keep serving
+        # the empty placeholder.
+        logger.warning("Failed to decode GitHub content %s/%s@%s: %s", repo, path, ref, exc)
+        _forget_github_content(cache_key)
+        return ORJSONResponse({"content": ""})
+
+    etag = resp.headers.get("etag")
+    if etag:
+        _remember_github_content(cache_key, etag, decoded, size)
+    return ORJSONResponse({"content": decoded})
+
+
+# --- Request batching (collapses the UI's page-load fan-out into one round trip) ---
+BATCH_MAX_REQUESTS = 20
+BATCH_ENTRY_TIMEOUT = 60.0
+# Set on every batch sub-request so a sub-request that still routes to /api/batch is refused.
+BATCH_SUBREQUEST_HEADER = "x-batch-subrequest"
+_BATCH_ROUTE_ERROR = {"detail": "Batch entries must target an /api/ route."}
+
+
+async def _dispatch_batch_entry(
+    client: httpx.AsyncClient,
+    headers: Dict[str, str],
+    entry: Any,
+) -> Dict[str, Any]:
+    if not isinstance(entry, dict):
+        return {"id": None, "status": 400, "body": {"detail": "Batch entries must be objects."}}
+    entry_id = entry.get("id")
+    method = str(entry.get("method") or "GET").upper()
+    url = entry.get("url")
+    if not isinstance(url, str):
+        return {"id": entry_id, "status": 400, "body": _BATCH_ROUTE_ERROR}
+    try:
+        # Routing happens on the percent-decoded path, so check that rather than the raw string.
+        path = httpx.URL(url).path
+    except httpx.InvalidURL:
+        return {"id": entry_id, "status": 400, "body": {"detail": "Invalid batch entry URL."}}
+    if not url.startswith("/api/") or not path.startswith("/api/") or path.startswith("/api/batch"):
+        return {"id": entry_id, "status": 400, "body": _BATCH_ROUTE_ERROR}
+    try:
+        resp = await asyncio.wait_for(
+            client.request(method, url, headers=headers, json=entry.get("body")),
+            timeout=BATCH_ENTRY_TIMEOUT,
+        )
+    except asyncio.TimeoutError:
+        return {"id": entry_id, "status": 504, "body": {"detail": READ_TIMEOUT_MESSAGE}}
+    except (httpx.InvalidURL, ValueError):
+        return {"id": entry_id, "status": 400, "body": {"detail": "Invalid batch entry URL."}}
+    except httpx.RequestError:
+        logger.exception("Batch entry %s %s failed", method, url)
+        return {"id": entry_id, "status": 502, "body": {"detail": "Batch entry request failed."}}
+    body = _fast_json(resp)
+    if body is None:
+        body = resp.text or None
+    return {"id": entry_id, "status": resp.status_code, "body": body}
+
+
+@app.post("/api/batch")
+async def batch(request: Request) -> ORJSONResponse:
+    """
+    Execute several /api/ calls concurrently in-process.
+    Body: {"requests": [{"id", "method", "url", "body"}]}; returns {"responses": [{"id", "status", "body"}]}.
+    """
+    if request.headers.get(BATCH_SUBREQUEST_HEADER):
+        raise HTTPException(status_code=400, detail="Batch requests cannot be nested.")
+    payload = await _read_json(request)
+    entries = payload.get("requests") if isinstance(payload, dict) else None
+    if not isinstance(entries, list) or not entries:
+        raise HTTPException(status_code=400, detail="requests must be a non-empty list.")
+    if len(entries) > BATCH_MAX_REQUESTS:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_REQUESTS} requests per batch.")
+
+    # httpx sets Content-Type itself for entries that carry a JSON body.
+    headers = _with_forward_headers(request)
+    headers.pop("Content-Type", None)
+    headers[BATCH_SUBREQUEST_HEADER] = "1"
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://batch") as client:
+        responses = await asyncio.gather(*(_dispatch_batch_entry(client, headers, entry) for entry in entries))
+    return ORJSONResponse({"responses": responses})
+
+
+_SPA_EXCLUDED_PREFIXES = ("api/", "assets/", "create_service_account.sh")
 
 
 @app.get("/{full_path:path}", response_class=HTMLResponse)
-async def catch_all(full_path: str) -> HTMLResponse:
+async def catch_all(full_path: str, request: Request) -> Response:
     """
     Serve the SPA for any non-API/non-static route (e.g., /deploy, /health).
     Keep this as the last route so API endpoints and health checks are not shadowed.
     """
-    if full_path.startswith(("api/", "assets/", "create_service_account.sh")):
+    if full_path.startswith(_SPA_EXCLUDED_PREFIXES):
         raise HTTPException(status_code=404, detail="Not found")
-    return _serve_frontend()
+    return _serve_frontend(request)
@@ -1,8 +1,9 @@
-import json
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, Iterable, Set, Tuple
+from typing import Any, Dict, Set, Tuple
+
+import orjson
 
 BASE_DIR = Path(__file__).resolve().parent
 
@@ -41,11 +42,13 @@ URL_KEYWORDS: Tuple[str, ...] = ("url", "endpoint", "base_url")
 
 _template_cache: Dict[str, Any] | None = None
 
+_NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9]+")
+
 
 def _normalize_key(key: str | None) -> str:
     if not key:
         return "VALUE"
-    cleaned = re.sub(r"[^A-Za-z0-9]+", "_", key).strip("_")
+    cleaned = _NON_ALNUM_RE.sub("_", key).strip("_")
     return cleaned.upper() or "VALUE"
 
 
@@ -71,22 +74,24 @@ def _collect_known_coordinates(payload: Any) -> Tuple[Set[str], Set[str], Set[st
     regions: Set[str] = set()
     db_instances: Set[str] = set()
 
-    def walk(node: Any, key: str | None = None) -> None:
+    stack = [payload]
+    while stack:
+        node = stack.pop()
         if isinstance(node, dict):
             for child_key, child_value in node.items():
-                lower = child_key.lower()
-                if lower in ("project_id", "tenant_id", "google_cloud_project") and isinstance(child_value, str):
-                    project_ids.add(child_value)
-                if lower == "region" and isinstance(child_value, str):
-                    regions.add(child_value)
-                if lower == "database_instance" and isinstance(child_value, str):
-                    db_instances.add(child_value)
-                walk(child_value, child_key)
+                if isinstance(child_value, str):
+                    lower = child_key.lower()
+                    if lower in ("project_id", "tenant_id", "google_cloud_project"):
+                        project_ids.add(child_value)
+                    elif lower == "region":
+                        regions.add(child_value)
+                    elif lower == "database_instance":
+                        db_instances.add(child_value)
+                elif isinstance(child_value, (dict, list)):
+                    stack.append(child_value)
         elif isinstance(node, list):
-            for item in node:
-                walk(item)
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
 
-    walk(payload)
     return project_ids, regions, db_instances
 
 
@@ -106,45 +111,62 @@ def _placeholder_for_key(key: str | None) -> str | None:
 
 
 def _looks_like_secret_value(value: str) -> bool:
-    if value.startswith("-----BEGIN") or value.startswith("ssh-"):
+    if value.startswith(("-----BEGIN", "ssh-")):
         return True
-    if len(value) > 32 and any(c.isdigit() for c in value) and any(c.isalpha() for c in value):
-        if not value.lower().startswith("http"):
-            return True
-    return False
+    return (
+        len(value) > 32
+        and value[:4].lower() != "http"
+        and any(map(str.isdigit, value))
+        and any(map(str.isalpha, value))
+    )
 
 
-def _replace_known_tokens(value: str, tokens: Iterable[str], placeholder: str) -> str:
-    for token in tokens:
-        if token:
-            value = value.replace(token, placeholder)
-    return value
+def _known_tokens_pattern(
+    project_ids: Set[str], regions: Set[str], db_instances: Set[str]
+) -> Tuple[re.Pattern[str] | None, Dict[str, str]]:
+    """
+    Build one alternation over every known coordinate (longest first) and the placeholder each maps to.
+    A token that is both a project ID and a region/instance maps to {{PROJECT_ID}}.
+    """
+    replacements: Dict[str, str] = {}
+    for tokens, placeholder in (
+        (db_instances, "{{DB_INSTANCE}}"),
+        (regions, "{{REGION}}"),
+        (project_ids, "{{PROJECT_ID}}"),
+    ):
+        replacements.update((token, placeholder) for token in tokens if token)
+    if not replacements:
+        return None, replacements
+    alternation = "|".join(re.escape(token) for token in sorted(replacements, key=len, reverse=True))
+    return re.compile(alternation), replacements
 
 
 def _sanitize_value(
     value: Any,
     key: str | None,
     *,
-    project_ids: Set[str],
-    regions: Set[str],
-    db_instances: Set[str],
+    tokens: re.Pattern[str] | None,
+    replacements: Dict[str, str],
 ) -> Any:
+    # Containers are copied only once a child actually changes; untouched subtrees are returned as-is.
     if isinstance(value, dict):
-        return {
-            child_key: _sanitize_value(
-                child_value,
-                child_key,
-                project_ids=project_ids,
-                regions=regions,
-                db_instances=db_instances,
-            )
-            for child_key, child_value in value.items()
-        }
+        rebuilt: Dict[str, Any] | None = None
+        for child_key, child_value in value.items():
+            clean = _sanitize_value(child_value, child_key, tokens=tokens, replacements=replacements)
+            if clean is not child_value:
+                if rebuilt is None:
+                    rebuilt = dict(value)
+                rebuilt[child_key] = clean
+        return value if rebuilt is None else rebuilt
     if isinstance(value, list):
-        return [
-            _sanitize_value(item, None, project_ids=project_ids, regions=regions, db_instances=db_instances)
-            for item in value
-        ]
+        rebuilt_items: list | None = None
+        for index, item in enumerate(value):
+            clean = _sanitize_value(item, None, tokens=tokens, replacements=replacements)
+            if clean is not item:
+                if rebuilt_items is None:
+                    rebuilt_items = list(value)
+                rebuilt_items[index] = clean
+        return value if rebuilt_items is None else rebuilt_items
     if not isinstance(value, str):
         return value
 
@@ -152,13 +174,10 @@ def _sanitize_value(
     if placeholder:
         return placeholder
 
-    sanitized = value
-    sanitized = _replace_known_tokens(sanitized, project_ids, "{{PROJECT_ID}}")
-    sanitized = _replace_known_tokens(sanitized, regions, "{{REGION}}")
-    sanitized = _replace_known_tokens(sanitized, db_instances, "{{DB_INSTANCE}}")
-    sanitized = re.sub(r"\\b\\d{11,}\\b", "{{PROJECT_NUMBER}}", sanitized)
-    if sanitized != value:
-        return sanitized
+    if tokens is not None:
+        sanitized = tokens.sub(lambda match: replacements[match.group(0)], value)
+        if sanitized != value:
+            return sanitized
 
     if _looks_like_secret_value(value):
         return f"REPLACE_ME_{_normalize_key(key)}"
@@ -167,8 +186,11 @@ def _sanitize_value(
 
 
 def sanitize_tenant_stack_template(payload: Dict[str, Any]) -> Dict[str, Any]:
-    project_ids, regions, db_instances = _collect_known_coordinates(payload)
-    return _sanitize_value(payload, None, project_ids=project_ids, regions=regions, db_instances=db_instances)
+    """
+    Return a sanitized view of payload; unchanged subtrees are shared with it, so treat both as read-only.
+    """
+    tokens, replacements = _known_tokens_pattern(*_collect_known_coordinates(payload))
+    return _sanitize_value(payload, None, tokens=tokens, replacements=replacements)
 
 
 def get_tenant_stack_template() -> Dict[str, Any]:
@@ -184,7 +206,7 @@ def get_tenant_stack_template() -> Dict[str, Any]:
         raise FileNotFoundError(f"Tenant stack template not found at {path}")
 
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = orjson.loads(path.read_bytes())
     except Exception as exc:
         raise ValueError(f"Failed to read tenant stack template: {exc}") from exc
 
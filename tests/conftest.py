@@ -0,0 +1,45 @@
+import os
+import sys
+
+import httpx
+import pytest
+
+# Ensure the project root and ui directory are on sys.path so imports in ui.main work.
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+UI_DIR = os.path.join(PROJECT_ROOT, "ui")
+for path in (PROJECT_ROOT, UI_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import ui.main as ui_main
+from ui.main import app
+
+
+@pytest.fixture(scope="module")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="module")
+async def client():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+async def mock_upstream(monkeypatch):
+    """
+    Install a MockTransport handler as the app's shared httpx client; returns the installer.
+    Each client it creates is closed on teardown.
+    """
+    clients = []
+
+    def install(handler):
+        http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        clients.append(http)
+        monkeypatch.setattr(ui_main, "_http_client", lambda: http)
+        return http
+
+    yield install
+    for http in clients:
+        await http.aclose()
@@ -0,0 +1,13 @@
+import httpx
+
+
+class BodyStream(httpx.AsyncByteStream):
+    """
+    Fake upstream body that is streamed rather than sent with a Content-Length.
+    """
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    async def __aiter__(self):
+        yield self.body
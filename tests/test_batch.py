@@ -0,0 +1,124 @@
+import json
+
+import httpx
+import pytest
+
+import ui.main as ui_main
+from streams import BodyStream
+
+
+def cheat_sheet(request):
+    """
+    Cheat-sheet service stand-in that echoes what it received, plus one failing route.
+    """
+    if request.url.path == "/cheat-sheet/missing":
+        return httpx.Response(404, json={"error": "no such entry"})
+    echo = {
+        "method": request.method,
+        "path": request.url.path,
+        "authorization": request.headers.get("authorization"),
+        "content_type": request.headers.get("content-type"),
+        "body": json.loads(request.content) if request.content else None,
+    }
+    return httpx.Response(200, headers={"content-type": "application/json"}, stream=BodyStream(json.dumps(echo).encode()))
+
+
+@pytest.fixture
+def upstream(monkeypatch, mock_upstream):
+    mock_upstream(cheat_sheet)
+    monkeypatch.setattr(ui_main, "CHEATSHEET_BASE_URL", "http://cheatsheet.test")
+
+
+@pytest.mark.anyio
+async def test_batch_passes_each_status_and_body_through(client, upstream):
+    response = await client.post(
+        "/api/batch",
+        headers={"Authorization": "Bearer caller-token", "Content-Type": "application/json"},
+        json={
+            "requests": [
+                {"id": "list", "url": "/api/cheat-sheet"},
+                {"id": "add", "method": "post", "url": "/api/cheat-sheet", "body": {"entry": "tip"}},
+                {"id": "gone", "method": "DELETE", "url": "/api/cheat-sheet/missing"},
+                {"id": "unknown", "url": "/api/does-not-exist"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    responses = {item["id"]: item for item in response.json()["responses"]}
+    assert [item["id"] for item in response.json()["responses"]] == ["list", "add", "gone", "unknown"]
+    assert responses["list"]["status"] == 200
+    assert responses["list"]["body"] == {
+        "method": "GET",
+        "path": "/cheat-sheet/get-all",
+        "authorization": "Bearer caller-token",
+        "content_type": None,
+        "body": None,
+    }
+    assert responses["add"]["status"] == 200
+    assert responses["add"]["body"]["content_type"] == "application/json"
+    assert responses["add"]["body"]["path"] == "/add_to_cheat_sheet"
+    assert responses["add"]["body"]["body"] == {"entry": "tip"}
+    assert responses["gone"]["status"] == 404
+    assert responses["gone"]["body"] == {"detail": {"error": "no such entry"}}
+    assert responses["unknown"]["status"] == 404
+
+
+@pytest.mark.anyio
+async def test_batch_rejects_nested_batches_and_non_api_urls(client, upstream):
+    response = await client.post(
+        "/api/batch",
+        json={
+            "requests": [
+                {"id": "nested", "method": "POST", "url": "/api/batch", "body": {"requests": []}},
+                {"id": "encoded", "method": "POST", "url": "/api/%62atch", "body": {"requests": [{"url": "/api/cheat-sheet"}]}},
+                {"id": "spa", "url": "/deploy"},
+                "not-an-object",
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json()["responses"] == [
+        {"id": "nested", "status": 400, "body": {"detail": "Batch entries must target an /api/ route."}},
+        {"id": "encoded", "status": 400, "body": {"detail": "Batch entries must target an /api/ route."}},
+        {"id": "spa", "status": 400, "body": {"detail": "Batch entries must target an /api/ route."}},
+        {"id": None, "status": 400, "body": {"detail": "Batch entries must be objects."}},
+    ]
+
+
+@pytest.mark.anyio
+async def test_batch_enforces_request_limit(client, upstream):
+    entries = [{"url": "/api/cheat-sheet"} for _ in range(ui_main.BATCH_MAX_REQUESTS + 1)]
+
+    too_many = await client.post("/api/batch", json={"requests": entries})
+    empty = await client.post("/api/batch", json={"requests": []})
+
+    assert too_many.status_code == 400
+    assert too_many.json() == {"detail": f"At most {ui_main.BATCH_MAX_REQUESTS} requests per batch."}
+    assert empty.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_batch_refuses_to_run_as_a_sub_request(client, upstream):
+    response = await client.post(
+        "/api/batch",
+        headers={ui_main.BATCH_SUBREQUEST_HEADER: "1"},
+        json={"requests": [{"url": "/api/cheat-sheet"}]},
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Batch requests cannot be nested."}
+
+
+@pytest.mark.anyio
+async def test_invalid_entry_url_fails_only_its_own_slot(client, upstream):
+    response = await client.post(
+        "/api/batch",
+        json={"requests": [{"id": "bad", "url": "/api/\u0000x"}, {"id": "good", "url": "/api/cheat-sheet"}]},
+    )
+
+    assert response.status_code == 200
+    bad, good = response.json()["responses"]
+    assert bad == {"id": "bad", "status": 400, "body": {"detail": "Invalid batch entry URL."}}
+    assert good["status"] == 200
@@ -1,18 +1,8 @@
 import json
-import os
-import sys
 from unittest.mock import patch
 
-from fastapi.testclient import TestClient
-
-# Ensure the project root and ui directory are on sys.path so imports in ui.main work.
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-UI_DIR = os.path.join(PROJECT_ROOT, "ui")
-for path in (PROJECT_ROOT, UI_DIR):
-    if path not in sys.path:
-        sys.path.insert(0, path)
-
-from ui.main import app
+import orjson
+import pytest
 
 
 class FakeResponse:
@@ -24,6 +14,7 @@ class FakeResponse:
         }
         self.status_code = 200
         self.text = json.dumps(self._payload)
+        self.content = orjson.dumps(self._payload)
 
     def json(self):
         return self._payload
@@ -35,7 +26,7 @@ class FakeResponse:
 
 class FakeHttpxClient:
     """
-    Minimal async context manager that records the Cloud Build request body.
+    Minimal stand-in for the shared httpx client that records the Cloud Build request body.
     """
 
     last_request = None
@@ -58,9 +49,10 @@ class FakeHttpxClient:
         return FakeResponse()
 
 
-@patch("ui.main.httpx.AsyncClient", new=FakeHttpxClient)
+@pytest.mark.anyio
+@patch("ui.main._http_client", new=FakeHttpxClient)
 @patch("ui.main._get_source_build_token_and_project")
-def test_bootstrap_provider_build_body_uses_env_and_not_substitutions(mock_get_token):
+async def test_bootstrap_provider_build_body_uses_env_and_not_substitutions(mock_get_token, client):
     """
     The Cloud Build step for provider bootstrap must pass PROJECT_ID/REGION via env,
     not as PROJECT_ID=$$PROJECT_ID REGION=$$REGION in the command string.
@@ -71,9 +63,7 @@ def test_bootstrap_provider_build_body_uses_env_and_not_substitutions(mock_get_t
         "builder@test-project-123.iam.gserviceaccount.com",
     )
 
-    client = TestClient(app)
-
-    response = client.post(
+    response = await client.post(
         "/api/bootstrap/provider",
         json={
             "region": "europe-west1",
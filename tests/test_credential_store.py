@@ -0,0 +1,182 @@
+import asyncio
+import copy
+import json
+import threading
+
+import pytest
+from google.api_core import exceptions as gcs_exceptions
+
+import ui.main as ui_main
+
+
+class FakeBucketStore:
+    """
+    Generation-checked stand-in for the GCS-backed credential store.
+    `conflicts` makes that many writes fail as if another writer got in first; `hold` blocks
+    writes in their worker thread until it is set.
+    """
+
+    def __init__(self):
+        self.store = {"selectedId": None, "entries": {}}
+        self.generation = 1
+        self.reads = 0
+        self.writes = []
+        self.conflicts = 0
+        self.hold = None
+
+    def read(self, type_name):
+        self.reads += 1
+        return copy.deepcopy(self.store), self.generation
+
+    def write(self, type_name, store, *, if_generation_match=None):
+        if self.hold is not None:
+            self.hold.wait(timeout=5)
+        if self.conflicts:
+            self.conflicts -= 1
+            self.generation += 1
+            raise gcs_exceptions.PreconditionFailed("generation mismatch")
+        assert if_generation_match == self.generation
+        self.generation += 1
+        self.store = copy.deepcopy(store)
+        self.writes.append(self.store)
+        return store
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    fake = FakeBucketStore()
+    monkeypatch.setattr(ui_main, "_read_store", fake.read)
+    monkeypatch.setattr(ui_main, "_write_store", fake.write)
+    monkeypatch.setattr(ui_main, "_store_pending", {})
+    monkeypatch.setattr(ui_main, "_store_committers", {})
+    return fake
+
+
+def add(entry_id, label=None):
+    def mutate(store):
+        store["entries"][entry_id] = {"label": label or entry_id}
+        return entry_id
+
+    return mutate
+
+
+async def _wait_for_write(backend):
+    # Let the first commit reach its (held) upload before queueing more updates behind it.
+    for _ in range(100):
+        if backend.reads:
+            break
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.01)
+
+
+@pytest.mark.anyio
+async def test_updates_queued_behind_a_write_share_one_upload(backend):
+    backend.hold = threading.Event()
+    first = asyncio.ensure_future(ui_main._update_store("target", add("a")))
+    await _wait_for_write(backend)
+    queued = [asyncio.ensure_future(ui_main._update_store("target", add(name))) for name in ("b", "c", "d")]
+    await asyncio.sleep(0.01)
+    backend.hold.set()
+
+    assert await first == "a"
+    assert await asyncio.gather(*queued) == ["b", "c", "d"]
+    assert [sorted(store["entries"]) for store in backend.writes] == [["a"], ["a", "b", "c", "d"]]
+
+
+@pytest.mark.anyio
+async def test_failed_mutation_is_rolled_back_without_affecting_the_batch(backend):
+    def rename_then_fail(store):
+        store["entries"]["b"] = {"label": "half-written"}
+        store["selectedId"] = "b"
+        raise ValueError("bad update")
+
+    backend.hold = threading.Event()
+    first = asyncio.ensure_future(ui_main._update_store("target", add("a")))
+    await _wait_for_write(backend)
+    good = asyncio.ensure_future(ui_main._update_store("target", add("b")))
+    bad = asyncio.ensure_future(ui_main._update_store("target", rename_then_fail))
+    later = asyncio.ensure_future(ui_main._update_store("target", add("c")))
+    await asyncio.sleep(0.01)
+    backend.hold.set()
+
+    assert await first == "a"
+    assert await good == "b"
+    with pytest.raises(ValueError, match="bad update"):
+        await bad
+    assert await later == "c"
+    assert backend.store == {
+        "selectedId": None,
+        "entries": {"a": {"label": "a"}, "b": {"label": "b"}, "c": {"label": "c"}},
+    }
+
+
+@pytest.mark.anyio
+async def test_generation_conflict_reloads_and_retries(backend):
+    backend.conflicts = 1
+
+    assert await ui_main._update_store("target", add("a")) == "a"
+
+    assert backend.reads == 2
+    assert backend.store["entries"] == {"a": {"label": "a"}}
+
+
+@pytest.mark.anyio
+async def test_persistent_conflicts_fail_every_update_with_409(backend):
+    backend.conflicts = ui_main.STORE_WRITE_ATTEMPTS
+
+    results = await asyncio.gather(
+        ui_main._update_store("target", add("a")),
+        ui_main._update_store("target", add("b")),
+        return_exceptions=True,
+    )
+
+    assert [getattr(result, "status_code", None) for result in results] == [409, 409]
+    assert backend.writes == []
+
+
+@pytest.mark.anyio
+async def test_unchanged_store_is_not_written(backend):
+    backend.store = {"selectedId": None, "entries": {"a": {"label": "a"}}}
+
+    await ui_main._update_store("target", add("a"))
+
+    assert backend.writes == []
+
+
+@pytest.mark.anyio
+async def test_cancelled_caller_does_not_cancel_the_shared_write(backend):
+    backend.hold = threading.Event()
+    leader = asyncio.ensure_future(ui_main._update_store("target", add("a")))
+    await _wait_for_write(backend)
+    follower = asyncio.ensure_future(ui_main._update_store("target", add("b")))
+    await asyncio.sleep(0.01)
+
+    leader.cancel()
+    await asyncio.sleep(0.01)
+    backend.hold.set()
+
+    assert await follower == "b"
+    assert leader.cancelled()
+    assert sorted(backend.store["entries"]) == ["a", "b"]
+
+
+def test_store_write_forgets_credentials_no_longer_stored(monkeypatch, tmp_path):
+    monkeypatch.setattr(ui_main, "CREDENTIALS_BUCKET", "")
+    monkeypatch.setattr(ui_main, "_store_file_path", lambda type_name: tmp_path / f"{type_name}.json")
+    monkeypatch.setattr(ui_main, "_store_cache", {})
+    kept = {"client_email": "kept@example.test", "private_key": "kept-key"}
+    deleted = {"client_email": "gone@example.test", "private_key": "gone-key"}
+    busy = {"client_email": "busy@example.test", "private_key": "busy-key"}
+    source = {"client_email": "source@example.test", "private_key": "source-key"}
+    keys = [ui_main._service_account_cache_key(info, ["scope"]) for info in (kept, deleted, busy, source)]
+    monkeypatch.setattr(ui_main, "_credentials_cache", {key: object() for key in keys})
+    monkeypatch.setattr(ui_main, "_credentials_locks", {key: threading.Lock() for key in keys})
+    # A refresh in flight holds its lock; pruning leaves that entry for the next write.
+    ui_main._credentials_locks[keys[2]].acquire()
+    # The source store has not been loaded yet; its key must still count as stored.
+    (tmp_path / "source.json").write_text(json.dumps({"entries": {"s": {"credential": source}}}))
+
+    ui_main._write_store("target", {"selectedId": "a", "entries": {"a": {"credential": kept}}})
+
+    assert set(ui_main._credentials_cache) == {keys[0], keys[2], keys[3]}
+    assert set(ui_main._credentials_locks) == set(keys)
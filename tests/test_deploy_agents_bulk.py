@@ -0,0 +1,62 @@
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+DEPLOY_CONTEXT = {
+    "target_entry": {"projectId": "tenant-default"},
+    "customer_sa_info": {"project_id": "tenant-default"},
+    "runner_sa_b64": "cnVubmVy",
+    "customer_sa_b64": "Y3VzdG9tZXI=",
+    "build_project_id": "build-project",
+    "auth_headers": {"Authorization": "Bearer fake-access-token"},
+    "build_sa_email": None,
+}
+
+
+def cloud_build(request):
+    """
+    Cloud Build stand-in keyed on the target project in the deploy step env.
+    """
+    env = json.loads(request.content)["steps"][1]["env"]
+    if "TARGET_PROJECT_ID=unreachable" in env:
+        raise httpx.ConnectError("connection refused", request=request)
+    if "TARGET_PROJECT_ID=rejected" in env:
+        return httpx.Response(403, json={"error": "permission denied"})
+    return httpx.Response(200, json={"id": "build-1", "status": "QUEUED", "logUrl": "https://example.test/log"})
+
+
+async def _context():
+    return DEPLOY_CONTEXT
+
+
+@pytest.mark.anyio
+async def test_bulk_deploy_reports_each_target_separately(client, mock_upstream):
+    mock_upstream(cloud_build)
+    targets = [
+        {"project_id": "good"},
+        {"project_id": "bad-region", "region": 123},
+        {"project_id": "rejected"},
+        {"project_id": "unreachable"},
+    ]
+
+    with patch("ui.main._deploy_agents_context", new=_context):
+        response = await client.post("/api/thunderdeploy/deploy-agents-bulk", json={"targets": targets})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == [200, 400, 403, 502]
+    assert results[0]["body"]["buildId"] == "build-1"
+    assert results[0]["body"]["targetProjectId"] == "good"
+    assert results[1]["body"] == {"detail": "region must be a string."}
+    assert results[2]["body"] == {"detail": {"error": "permission denied"}}
+    assert results[3]["body"] == {"detail": "Failed to contact Cloud Build."}
+
+
+@pytest.mark.anyio
+async def test_bulk_deploy_rejects_non_object_targets(client):
+    with patch("ui.main._deploy_agents_context", new=_context):
+        response = await client.post("/api/thunderdeploy/deploy-agents-bulk", json={"targets": [{}, "oops"]})
+
+    assert response.status_code == 400
@@ -0,0 +1,109 @@
+import json
+
+import pytest
+
+import ui.main as ui_main
+
+
+@pytest.fixture
+def files(tmp_path, monkeypatch):
+    store_file = tmp_path / "deploy-configs.json"
+    log_file = tmp_path / "deploy-configs.ndjson"
+    monkeypatch.setattr(ui_main, "CONFIG_STORE_FILE", store_file)
+    monkeypatch.setattr(ui_main, "CONFIG_LOG_FILE", log_file)
+    monkeypatch.setattr(ui_main, "_deploy_configs_cache", None)
+    return store_file, log_file
+
+
+def log_lines(log_file):
+    return [json.loads(line) for line in log_file.read_bytes().splitlines()] if log_file.exists() else []
+
+
+def reload_from_disk(monkeypatch):
+    monkeypatch.setattr(ui_main, "_deploy_configs_cache", None)
+    return ui_main._load_deploy_configs()["configs"]
+
+
+def test_log_is_replayed_over_the_snapshot(files):
+    store_file, log_file = files
+    store_file.write_text(json.dumps({"configs": {"a": {"name": "old"}, "b": {"name": "b"}}}))
+    log_file.write_text(
+        "\n".join(
+            json.dumps(record)
+            for record in (
+                {"op": "upsert", "id": "a", "cfg": {"name": "new"}},
+                {"op": "upsert", "id": "c", "cfg": {"name": "c"}},
+                {"op": "delete", "id": "b"},
+            )
+        )
+        + "\n"
+    )
+
+    assert ui_main._load_deploy_configs()["configs"] == {"a": {"name": "new"}, "c": {"name": "c"}}
+
+
+@pytest.mark.anyio
+async def test_torn_final_line_is_skipped_and_later_appends_survive(client, files, monkeypatch):
+    _, log_file = files
+    log_file.write_bytes(b'{"op": "upsert", "id": "a", "cfg": {"name": "a"}}\n{"op": "upsert", "id": "b", "cf')
+
+    assert ui_main._load_deploy_configs()["configs"] == {"a": {"name": "a"}}
+
+    response = await client.put("/api/deploy-configs/a", json={"name": "renamed"})
+
+    assert response.status_code == 200
+    assert reload_from_disk(monkeypatch)["a"]["name"] == "renamed"
+
+
+@pytest.mark.anyio
+async def test_each_edit_appends_one_record_for_that_config(client, files, monkeypatch):
+    _, log_file = files
+    monkeypatch.setattr(ui_main, "CONFIG_LOG_COMPACT_RATIO", 100)
+    first = (await client.post("/api/deploy-configs", json={"name": "first"})).json()["id"]
+    second = (await client.post("/api/deploy-configs", json={"name": "second"})).json()["id"]
+
+    await client.put(f"/api/deploy-configs/{first}", json={"description": "edited"})
+    await client.put(f"/api/deploy-configs/{first}", json={"description": "edited"})
+    await client.delete(f"/api/deploy-configs/{second}")
+    missing = await client.delete(f"/api/deploy-configs/{second}")
+
+    assert missing.status_code == 404
+    assert [(record["op"], record["id"]) for record in log_lines(log_file)] == [
+        ("upsert", first),
+        ("upsert", second),
+        ("upsert", first),
+        ("delete", second),
+    ]
+    assert list(reload_from_disk(monkeypatch)) == [first]
+
+
+@pytest.mark.anyio
+async def test_compaction_folds_the_log_into_the_snapshot(client, files, monkeypatch):
+    store_file, log_file = files
+    monkeypatch.setattr(ui_main, "CONFIG_LOG_COMPACT_RATIO", 1)
+    cfg_id = (await client.post("/api/deploy-configs", json={"name": "v0"})).json()["id"]
+    assert len(log_lines(log_file)) == 1
+
+    response = await client.put(f"/api/deploy-configs/{cfg_id}", json={"name": "v1"})
+
+    assert response.status_code == 200
+    assert not log_file.exists()
+    assert json.loads(store_file.read_text())["configs"][cfg_id]["name"] == "v1"
+    assert reload_from_disk(monkeypatch)[cfg_id]["name"] == "v1"
+
+
+@pytest.mark.anyio
+async def test_records_appended_by_another_process_are_kept(client, files, monkeypatch):
+    store_file, log_file = files
+    monkeypatch.setattr(ui_main, "CONFIG_LOG_COMPACT_RATIO", 1)
+    ours = (await client.post("/api/deploy-configs", json={"name": "ours"})).json()["id"]
+    # Another worker appends after our cache was filled; the next edit must see it before compacting.
+    with open(log_file, "ab") as fh:
+        fh.write(b'{"op": "upsert", "id": "theirs", "cfg": {"name": "theirs"}}\n')
+
+    await client.put(f"/api/deploy-configs/{ours}", json={"name": "ours-edited"})
+    listed = (await client.get("/api/deploy-configs")).json()["configs"]
+
+    assert not log_file.exists()
+    assert set(json.loads(store_file.read_text())["configs"]) == {ours, "theirs"}
+    assert {cfg["id"]: cfg["name"] for cfg in listed} == {ours: "ours-edited", "theirs": "theirs"}
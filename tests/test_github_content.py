@@ -0,0 +1,157 @@
+import base64
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+import ui.main as ui_main
+
+
+class FakeGitHub:
+    """
+    Contents API stand-in that answers If-None-Match with 304 and records every request it sees.
+    """
+
+    def __init__(self, files):
+        self.files = files
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        path = request.url.path.split("/contents/", 1)[1]
+        if path not in self.files:
+            return httpx.Response(404)
+        etag = f'"{path}-v1"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"etag": etag})
+        raw = self.files[path]
+        if isinstance(raw, str):
+            raw = raw.encode("utf-8")
+        # Like GitHub, wrap the base64 body across lines.
+        content = base64.encodebytes(raw).decode("ascii")
+        return httpx.Response(200, headers={"etag": etag}, json={"content": content, "encoding": "base64"})
+
+
+@pytest.fixture
+def github(monkeypatch, mock_upstream):
+    def install(files):
+        fake = FakeGitHub(files)
+        mock_upstream(fake)
+        return fake
+
+    monkeypatch.setattr(ui_main, "DEFAULT_GITHUB_TOKEN", "test-token")
+    monkeypatch.setattr(ui_main, "_github_content_cache", type(ui_main._github_content_cache)())
+    monkeypatch.setattr(ui_main, "_github_content_cache_bytes", 0)
+    return install
+
+
+@pytest.mark.anyio
+async def test_github_content_revalidates_with_etag(client, github):
+    fake = github({".env": "FOO=bar\n"})
+
+    first = await client.get("/api/github/content", params={"repo": "acme/app", "path": ".env"})
+    second = await client.get("/api/github/content", params={"repo": "acme/app", "path": ".env"})
+
+    assert first.status_code == 200
+    assert first.json() == {"content": "FOO=bar\n"}
+    # The second call is answered by a 304 and served from the cache.
+    assert second.status_code == 200
+    assert second.json() == {"content": "FOO=bar\n"}
+    assert [r.headers.get("if-none-match") for r in fake.requests] == [None, '".env-v1"']
+
+
+@pytest.mark.anyio
+async def test_github_content_does_not_cache_failed_decode(client, github):
+    fake = github({"blob.bin": b"\xff\xfe\x00"})
+
+    for _ in range(2):
+        response = await client.get("/api/github/content", params={"repo": "acme/app", "path": "blob.bin"})
+        assert response.json() == {"content": ""}
+
+    assert [r.headers.get("if-none-match") for r in fake.requests] == [None, None]
+
+
+@pytest.mark.anyio
+async def test_github_content_cache_evicts_least_recently_used_by_size(client, github):
+    fake = github({"a": "a" * 40, "b": "b" * 40, "c": "c" * 40})
+
+    with patch.object(ui_main, "_GITHUB_CONTENT_CACHE_MAX_BYTES", 100):
+        for path in ("a", "b", "a", "c"):
+            await client.get("/api/github/content", params={"repo": "acme/app", "path": path})
+
+    # Caching "c" pushed the budget past 100 bytes; "b" was the least recently used entry.
+    assert [key[1] for key in ui_main._github_content_cache] == ["a", "c"]
+    assert ui_main._github_content_cache_bytes == 80
+    assert [r.headers.get("if-none-match") for r in fake.requests] == [None, None, '"a-v1"', None]
+
+
+@pytest.mark.anyio
+async def test_github_content_reports_transport_errors_as_502(client, github, mock_upstream):
+    def unreachable(request):
+        raise httpx.ConnectTimeout("timed out", request=request)
+
+    github({})
+    mock_upstream(unreachable)
+
+    response = await client.get("/api/github/content", params={"repo": "acme/app", "path": ".env"})
+
+    assert response.status_code == 502
+    assert not ui_main._github_content_cache
+
+
+@pytest.mark.anyio
+async def test_github_content_downloads_large_files_raw_without_caching(client, github, mock_upstream):
+    large = "x" * (ui_main.GITHUB_CACHE_MAX_FILE_BYTES + 1)
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers["accept"])
+        if request.headers["accept"] == "application/vnd.github.raw":
+            return httpx.Response(200, content=large.encode("utf-8"))
+        return httpx.Response(200, headers={"etag": '"big-v1"'}, json={"content": "", "encoding": "none"})
+
+    github({})
+    mock_upstream(handler)
+
+    response = await client.get("/api/github/content", params={"repo": "acme/app", "path": "big.json"})
+
+    assert response.json() == {"content": large}
+    assert seen == ["application/vnd.github.v3+json", "application/vnd.github.raw"]
+    assert not ui_main._github_content_cache
+
+
+@pytest.mark.anyio
+async def test_github_content_accepts_paths_and_refs_beyond_word_characters(client, github):
+    fake = github({"docs/Read Me.md": "hi", "src/c++/x.h": "int x;"})
+
+    for path in ("docs/Read Me.md", "src/c++/x.h"):
+        response = await client.get(
+            "/api/github/content", params={"repo": "acme/app", "path": path, "ref": "release/1.0+hotfix"}
+        )
+        assert response.status_code == 200
+
+    assert [r.url.raw_path.split(b"?")[0].rsplit(b"/contents/", 1)[1] for r in fake.requests] == [
+        b"docs/Read%20Me.md",
+        b"src/c%2B%2B/x.h",
+    ]
+    assert [r.url.params["ref"] for r in fake.requests] == ["release/1.0+hotfix"] * 2
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"repo": "acme/app", "path": "../../orgs/acme"},
+        {"repo": "acme/app", "path": "a//b"},
+        {"repo": "acme/app", "path": "a?ref=evil"},
+        {"repo": "acme/..", "path": "x"},
+        {"repo": "acme/app", "path": "x", "ref": "main/../evil"},
+    ],
+)
+async def test_github_content_rejects_traversal_segments(client, github, params):
+    fake = github({})
+
+    response = await client.get("/api/github/content", params=params)
+
+    assert response.status_code == 422
+    assert fake.requests == []
@@ -0,0 +1,82 @@
+import httpx
+import pytest
+
+import ui.main as ui_main
+from streams import BodyStream
+
+
+class EmptyStream(httpx.AsyncByteStream):
+    """
+    Chunked upstream body that ends without sending any bytes.
+    """
+
+    async def __aiter__(self):
+        yield b""
+
+
+def respond(content_type: str, stream: httpx.AsyncByteStream):
+    def handler(request):
+        return httpx.Response(200, headers={"content-type": content_type}, stream=stream)
+
+    return handler
+
+
+@pytest.fixture(autouse=True)
+def services(monkeypatch):
+    monkeypatch.setattr(ui_main, "CHEATSHEET_BASE_URL", "http://cheatsheet.test")
+    monkeypatch.setattr(ui_main, "MCP_REGISTRY_BASE_URL", "http://mcp.test")
+    monkeypatch.setattr(ui_main, "TRIGGERSERVICE_BASE_URL", "http://trigger.test")
+    monkeypatch.setattr(ui_main, "_coalesce_cache", {})
+    monkeypatch.setattr(ui_main, "_coalesce_inflight", {})
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("call", [("DELETE", "/api/cheat-sheet/1"), ("GET", "/api/mcp/config")])
+async def test_proxy_answers_chunked_empty_body_with_empty_object(client, mock_upstream, call):
+    mock_upstream(respond("application/json", EmptyStream()))
+
+    response = await client.request(*call)
+
+    assert response.status_code == 200
+    assert response.json() == {}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("call", [("DELETE", "/api/cheat-sheet/1"), ("GET", "/api/mcp/config")])
+async def test_proxy_answers_text_body_with_empty_object(client, mock_upstream, call):
+    mock_upstream(respond("text/plain", BodyStream(b"deleted")))
+
+    response = await client.request(*call)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {}
+
+
+@pytest.mark.anyio
+async def test_proxy_streams_json_body_through(client, mock_upstream):
+    mock_upstream(respond("application/json", BodyStream(b'{"deleted":true}')))
+
+    response = await client.delete("/api/cheat-sheet/1")
+
+    assert response.json() == {"deleted": True}
+
+
+@pytest.mark.anyio
+async def test_trigger_proxy_answers_chunked_empty_body_with_empty_string(client, mock_upstream):
+    mock_upstream(respond("application/json", EmptyStream()))
+
+    response = await client.get("/api/trigger/prime-status")
+
+    assert response.status_code == 200
+    assert response.json() == ""
+
+
+@pytest.mark.anyio
+async def test_trigger_proxy_answers_text_body_with_json_string(client, mock_upstream):
+    mock_upstream(respond("text/plain", BodyStream(b"primed")))
+
+    response = await client.get("/api/trigger/prime-status")
+
+    assert response.status_code == 200
+    assert response.json() == "primed"
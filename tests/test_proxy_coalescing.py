@@ -0,0 +1,98 @@
+import asyncio
+
+import httpx
+import pytest
+
+import ui.main as ui_main
+from streams import BodyStream
+
+MCP_BASE_URL = "http://mcp.test"
+
+
+class FakeRegistry:
+    """
+    MCP registry stand-in: GET /config returns the current version, POST /registry bumps it.
+    A test can hold GETs open with `gate` to interleave them with writes.
+    """
+
+    def __init__(self):
+        self.version = 1
+        self.gets = 0
+        self.gate = None
+
+    async def __call__(self, request):
+        if request.method == "GET":
+            self.gets += 1
+            version = self.version
+            if self.gate is not None:
+                await self.gate.wait()
+            body = f'{{"version":{version}}}'.encode()
+        else:
+            self.version += 1
+            body = b'{"ok":true}'
+        return httpx.Response(200, headers={"content-type": "application/json"}, stream=BodyStream(body))
+
+
+@pytest.fixture
+def registry(monkeypatch, mock_upstream):
+    fake = FakeRegistry()
+    mock_upstream(fake)
+    monkeypatch.setattr(ui_main, "MCP_REGISTRY_BASE_URL", MCP_BASE_URL)
+    monkeypatch.setattr(ui_main, "PROXY_COALESCE_TTL", 60.0)
+    monkeypatch.setattr(ui_main, "_coalesce_cache", {})
+    monkeypatch.setattr(ui_main, "_coalesce_inflight", {})
+    monkeypatch.setattr(ui_main, "_coalesce_generations", {})
+    return fake
+
+
+@pytest.mark.anyio
+async def test_concurrent_identical_gets_share_one_upstream_call(client, registry):
+    registry.gate = asyncio.Event()
+    pending = [asyncio.ensure_future(client.get("/api/mcp/config")) for _ in range(5)]
+    await asyncio.sleep(0.05)
+    registry.gate.set()
+    responses = await asyncio.gather(*pending)
+
+    assert [r.json() for r in responses] == [{"version": 1}] * 5
+    assert registry.gets == 1
+
+
+@pytest.mark.anyio
+async def test_cached_get_expires_after_ttl(client, registry, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(ui_main.time, "monotonic", lambda: now[0])
+
+    await client.get("/api/mcp/config")
+    await client.get("/api/mcp/config")
+    assert registry.gets == 1
+
+    now[0] += ui_main.PROXY_COALESCE_TTL + 1
+    await client.get("/api/mcp/config")
+    assert registry.gets == 2
+
+
+@pytest.mark.anyio
+async def test_write_invalidates_cached_get(client, registry):
+    assert (await client.get("/api/mcp/config")).json() == {"version": 1}
+
+    write = await client.post("/api/mcp/registry", json={"name": "new"})
+    assert write.status_code == 200
+
+    assert (await client.get("/api/mcp/config")).json() == {"version": 2}
+    assert registry.gets == 2
+
+
+@pytest.mark.anyio
+async def test_get_started_before_write_is_not_cached(client, registry):
+    registry.gate = asyncio.Event()
+    stale_get = asyncio.ensure_future(client.get("/api/mcp/config"))
+    await asyncio.sleep(0.05)
+
+    write = await client.post("/api/mcp/registry", json={"name": "new"})
+    assert write.status_code == 200
+    registry.gate.set()
+    assert (await stale_get).json() == {"version": 1}
+
+    # The pre-write read must not be replayed to later callers.
+    assert (await client.get("/api/mcp/config")).json() == {"version": 2}
+    assert registry.gets == 2
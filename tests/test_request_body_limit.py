@@ -0,0 +1,63 @@
+import httpx
+import pytest
+
+import ui.main as ui_main
+from streams import BodyStream
+
+LIMIT = ui_main.MAX_REQUEST_BODY_BYTES
+
+
+@pytest.fixture
+def upstream(monkeypatch, mock_upstream):
+    received = []
+
+    def main_api(request):
+        received.append(len(request.content))
+        return httpx.Response(200, headers={"content-type": "application/json"}, stream=BodyStream(b'{"ok":true}'))
+
+    mock_upstream(main_api)
+    monkeypatch.setattr(ui_main, "MAIN_API_URL", "http://main-api.test")
+    return received
+
+
+def json_body(size: int) -> bytes:
+    # A JSON string literal padded to exactly `size` bytes.
+    return b'"' + b"x" * (size - 2) + b'"'
+
+
+@pytest.mark.anyio
+async def test_oversized_content_length_is_rejected(client, upstream):
+    # The declared length alone triggers the rejection; the (small) body is never buffered.
+    response = await client.post(
+        "/api/login",
+        content=b"{}",
+        headers={"Content-Type": "application/json", "Content-Length": str(LIMIT + 1)},
+    )
+
+    assert response.request.headers["content-length"] == str(LIMIT + 1)
+    assert response.status_code == 413
+    assert response.json() == {"detail": "Request body too large"}
+    assert upstream == []
+
+
+@pytest.mark.anyio
+async def test_oversized_chunked_body_without_content_length_is_rejected(client, upstream):
+    body = json_body(LIMIT + 1)
+
+    async def chunks():
+        for start in range(0, len(body), 64 * 1024):
+            yield body[start : start + 64 * 1024]
+
+    response = await client.post("/api/login", content=chunks(), headers={"Content-Type": "application/json"})
+
+    assert response.request.headers.get("content-length") is None
+    assert response.status_code == 413
+    assert upstream == []
+
+
+@pytest.mark.anyio
+async def test_body_at_the_limit_is_accepted(client, upstream):
+    response = await client.post("/api/login", content=json_body(LIMIT), headers={"Content-Type": "application/json"})
+
+    assert response.status_code == 200
+    assert upstream == [LIMIT]
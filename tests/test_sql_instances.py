@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+INSTANCES_URL = "/sql/v1beta4/projects/tenant-project/instances"
+
+
+def sql_admin(request):
+    """
+    SQL Admin stand-in with three instances: one healthy, one whose database listing is
+    forbidden and one that cannot be reached at all.
+    """
+    assert request.headers["authorization"] == "Bearer fake-access-token"
+    path = request.url.path
+    if path == INSTANCES_URL:
+        return httpx.Response(
+            200,
+            json={
+                "items": [
+                    {"name": "main", "region": "europe-west1", "connectionName": "tenant-project:europe-west1:main"},
+                    {"name": "locked", "gceZone": "us-central1-a", "connectionName": "tenant-project:us-central1:locked"},
+                    {"name": "flaky", "region": "us-east1", "connectionName": "tenant-project:us-east1:flaky"},
+                    {"name": "no-connection"},
+                ]
+            },
+        )
+    if path == f"{INSTANCES_URL}/main/databases":
+        return httpx.Response(200, json={"items": [{"name": "app", "charset": "UTF8", "collation": "en_US.UTF8"}]})
+    if path == f"{INSTANCES_URL}/locked/databases":
+        return httpx.Response(403, json={"error": {"message": "forbidden"}})
+    if path == f"{INSTANCES_URL}/flaky/databases":
+        raise httpx.ConnectError("connection reset", request=request)
+    return httpx.Response(404, json={"error": "unexpected path"})
+
+
+@pytest.mark.anyio
+@patch("ui.main._get_target_sql_token_and_project", return_value=("tenant-project", "fake-access-token"))
+async def test_instances_with_databases_reports_per_instance_failures(mock_token, client, mock_upstream):
+    mock_upstream(sql_admin)
+
+    response = await client.get("/api/sql/instances-with-databases")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["projectId"] == "tenant-project"
+    assert body["instances"] == [
+        {
+            "name": "main",
+            "region": "europe-west1",
+            "connectionName": "tenant-project:europe-west1:main",
+            "databases": [{"name": "app", "charset": "UTF8", "collation": "en_US.UTF8"}],
+        },
+        {
+            "name": "locked",
+            "region": "us-central1-a",
+            "connectionName": "tenant-project:us-central1:locked",
+            "databases": [],
+            "error": {"error": {"message": "forbidden"}},
+        },
+        {
+            "name": "flaky",
+            "region": "us-east1",
+            "connectionName": "tenant-project:us-east1:flaky",
+            "databases": [],
+            "error": "Failed to contact Cloud SQL Admin.",
+        },
+    ]
+
+
+@pytest.mark.anyio
+@patch("ui.main._get_target_sql_token_and_project", return_value=("tenant-project", "fake-access-token"))
+async def test_instances_with_databases_propagates_instance_listing_failure(mock_token, client, mock_upstream):
+    mock_upstream(lambda request: httpx.Response(401, json={"error": "unauthenticated"}))
+
+    response = await client.get("/api/sql/instances-with-databases")
+
+    assert response.status_code == 401
+    assert response.json() == {"detail": {"error": "unauthenticated"}}